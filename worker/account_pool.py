@@ -0,0 +1,108 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Pool of pre-generated accounts (see workerAlgorand.create_user)
+"""
+import time
+import threading
+import collections
+from typing import Callable, Optional, Tuple
+
+
+class AccountPool():
+    """
+    a background thread generates accounts ahead of demand: the pool is filled up to the high
+    watermark when it starts and whenever its depth falls below the low watermark (low 0: when
+    the pool is empty)
+    pop() never waits for kmd: it returns None if the pool is empty (the caller generates
+    the account on its own)
+    NOTE:   the accounts are generated in the kmd wallet, the accounts still in the pool
+            when the worker is closed are simply never handed out
+    """
+
+    RETRY_SECONDS: float = 1.0                      #   pause after a failed generation (kmd not reachable, ...)
+
+    def __init__(
+        self,
+        generate: Callable[[], Tuple[str, str]],    #   returns (address, mnemonic) of a new account
+        low: int,                                   #   low watermark
+        high: int                                   #   high watermark
+        ):
+        self._generate = generate
+        self._low: int = max(low, 1)                #   refill threshold (an empty pool is always refilled)
+        self._high: int = max(high, low)
+
+        self._cond = threading.Condition()
+        self._accounts = collections.deque()        #   (address, mnemonic)
+        self._thread: threading.Thread = None
+        self._running: bool = False
+
+        self._generated: int = 0                    #   accounts generated by the background thread
+        self._hits: int = 0                         #   pop served by the pool
+        self._misses: int = 0                       #   pop on an empty pool
+
+    def depth(self) -> int:
+        return len(self._accounts)
+
+    def stats(self) -> dict:
+        """
+        returns the depth of the pool and its counters (generated, hits, misses)
+        """
+        with self._cond:
+            return {
+                'depth': len(self._accounts)
+            ,   'generated': self._generated
+            ,   'hits': self._hits
+            ,   'misses': self._misses
+            }
+
+    def start(self):
+        with self._cond:
+            if self._running or self._high <= 0:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self.__run, name='dop-account-pool', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        #   the thread might be waiting for kmd: do not wait for it
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def pop(self) -> Optional[Tuple[str, str]]:
+        """
+        returns (address, mnemonic) of a pre-generated account, None if the pool is empty
+        """
+        with self._cond:
+            entry = self._accounts.popleft() if self._accounts else None
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            if len(self._accounts) < self._low:
+                self._cond.notify_all()
+            return entry
+
+    def __run(self):
+        while True:
+            with self._cond:
+                while self._running and len(self._accounts) >= self._low:
+                    self._cond.wait()
+                if not self._running:
+                    return
+
+            #   fill up to the high watermark
+            while self._running and len(self._accounts) < self._high:
+                try:
+                    entry = self._generate()
+                except Exception:
+                    time.sleep(self.RETRY_SECONDS)
+                    continue
+                with self._cond:
+                    self._accounts.append(entry)
+                    self._generated += 1
@@ -0,0 +1,256 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Admission control of the transactions sent to algod (see workerAlgorand send paths)
+"""
+import time
+import asyncio
+import threading
+import collections
+
+
+class AdmissionRejected(Exception):
+    """
+    the transactions were not admitted: the admission queue is full or the deadline expired
+    """
+    pass
+
+
+class AdmissionController():
+    """
+    the transactions sent and not yet confirmed (in flight) are kept within a window adjusted
+    AIMD style: the window grows by one transaction per window of confirmed transactions, is
+    halved when algod rejects a send because its pool is full or when a transaction is not
+    confirmed within its timeout, and is reduced (DELAY_DECREASE) when the confirmation takes
+    more than TARGET_ROUNDS rounds; at most one decrease per COOLDOWN seconds (one congestion
+    event is not counted once per transaction)
+    the senders exceeding the window wait in a FIFO queue (up to max_queue senders, for up to
+    max_wait seconds): a burst turns into queueing delay instead of rejected transactions
+    """
+
+    DECREASE: float = 0.5                           #   pool full, not confirmed in time
+    DELAY_DECREASE: float = 0.8                     #   confirmed, but slower than TARGET_ROUNDS
+    TARGET_ROUNDS: int = 2
+    COOLDOWN: float = 3.5                           #   seconds (about one round)
+    MIN_WINDOW: float = 1.0
+
+    #   fragments of the algod messages reporting a congested pool
+    POOL_FULL: tuple = ('pool is full', 'pool have reached capacity', 'pool has reached capacity', 'overloaded')
+    #   fragment of the message of a transaction not confirmed within its timeout (see ConfirmationTracker)
+    NOT_CONFIRMED: str = 'not found in timeout rounds'
+
+    def __init__(
+        self,
+        window: int = 64,                           #   initial window (transactions)
+        max_window: int = 4096,
+        max_queue: int = 1024,                      #   max number of waiting senders
+        max_wait: float = 30.0                      #   max time (seconds) a sender waits in the queue
+        ):
+        self._max_window: float = float(max(max_window, 1))
+        self._window: float = min(max(float(window), self.MIN_WINDOW), self._max_window)
+        self._max_queue: int = max_queue
+        self._max_wait: float = max_wait
+
+        self._cond = threading.Condition()
+        self._waiters = collections.deque()         #   tickets of the waiting senders (FIFO)
+        self._in_flight: int = 0
+        self._decreased_at: float = 0.0
+
+        self._admitted: int = 0
+        self._rejected: int = 0
+        self._decreases: int = 0
+
+    @classmethod
+    def congestion(cls, exception: Exception) -> bool:
+        """
+        returns True if exception (raised by a send or by a confirmation) reports a congestion
+        """
+        message = str(exception).lower()
+        return cls.NOT_CONFIRMED in message or any(fragment in message for fragment in cls.POOL_FULL)
+
+    def deadline(self) -> float:
+        """
+        returns the default deadline (monotonic time) of a sender starting now
+        """
+        return time.monotonic() + self._max_wait
+
+    def __admissible(self, count: int) -> bool:
+        #   private method
+        #   a request larger than the window is admitted when nothing is in flight
+        return self._in_flight + count <= self._window or self._in_flight == 0
+
+    def try_acquire(self, count: int) -> bool:
+        """
+        non blocking acquire: returns False if the count transactions would have to wait
+        """
+        with self._cond:
+            if self._waiters or not self.__admissible(count):
+                return False
+            self._in_flight += count
+            self._admitted += count
+            return True
+
+    def acquire(self, count: int, deadline: float = None):
+        """
+        waits until count transactions can be sent
+        raises AdmissionRejected if the queue is full or the deadline (monotonic time) expires
+        """
+        if deadline is None:
+            deadline = self.deadline()
+        with self._cond:
+            if not self._waiters and self.__admissible(count):
+                self._in_flight += count
+                self._admitted += count
+                return
+            if len(self._waiters) >= self._max_queue:
+                self._rejected += count
+                raise AdmissionRejected('admission queue full')
+
+            ticket = object()
+            self._waiters.append(ticket)
+            try:
+                while self._waiters[0] is not ticket or not self.__admissible(count):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._rejected += count
+                        raise AdmissionRejected('admission deadline exceeded')
+                    self._cond.wait(remaining)
+                self._in_flight += count
+                self._admitted += count
+            finally:
+                self._waiters.remove(ticket)
+                #   the next sender in the queue might be admitted as well
+                self._cond.notify_all()
+
+    def release(self, count: int, confirmed: bool, congested: bool = False, rounds: int = 0):
+        """
+        count transactions (see acquire) are not in flight anymore
+        confirmed:  confirmed in rounds rounds (since they were sent)
+        congested:  rejected because of a full pool or not confirmed in time (see congestion)
+        """
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - count)
+            if congested:
+                self.__decrease(self.DECREASE)
+            elif confirmed and rounds > self.TARGET_ROUNDS:
+                self.__decrease(self.DELAY_DECREASE)
+            elif confirmed:
+                self._window = min(self._max_window, self._window + count / self._window)
+            self._cond.notify_all()
+
+    def __decrease(self, factor: float):
+        #   private method
+        now = time.monotonic()
+        if now - self._decreased_at < self.COOLDOWN:
+            return
+        self._decreased_at = now
+        self._decreases += 1
+        self._window = max(self.MIN_WINDOW, self._window * factor)
+
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def stats(self) -> dict:
+        """
+        returns window, transactions in flight, queue depth (waiting senders) and counters
+        """
+        with self._cond:
+            return {
+                'window': int(self._window)
+            ,   'in_flight': self._in_flight
+            ,   'queued': len(self._waiters)
+            ,   'admitted': self._admitted
+            ,   'rejected': self._rejected
+            ,   'decreases': self._decreases
+            }
+
+
+class AsyncAdmission():
+    """
+    asyncio front end of an AdmissionController (see AsyncWorkerAlgorand): the coroutines
+    exceeding the window wait (FIFO, up to max_queue of them) on futures resolved by release,
+    so the event loop is never blocked; all the methods are called from the event loop
+    """
+
+    def __init__(
+        self,
+        controller: AdmissionController,
+        max_queue: int = 1024                       #   max number of waiting coroutines
+        ):
+        self._controller: AdmissionController = controller
+        self._max_queue: int = max_queue
+        self._waiters = collections.deque()         #   (count, future) of the waiting coroutines (FIFO)
+        self._rejected: int = 0
+
+    def congestion(self, exception: Exception) -> bool:
+        return self._controller.congestion(exception)
+
+    def deadline(self) -> float:
+        return self._controller.deadline()
+
+    async def acquire(self, count: int, deadline: float = None):
+        """
+        waits until count transactions can be sent (see AdmissionController.acquire)
+        raises AdmissionRejected if the queue is full or the deadline (monotonic time) expires
+        """
+        if deadline is None:
+            deadline = self.deadline()
+        if not self._waiters and self._controller.try_acquire(count):
+            return
+        if len(self._waiters) >= self._max_queue:
+            self._rejected += count
+            raise AdmissionRejected('admission queue full')
+
+        entry = (count, asyncio.get_event_loop().create_future())
+        self._waiters.append(entry)
+        try:
+            await asyncio.wait_for(entry[1], max(deadline - time.monotonic(), 0))
+        except asyncio.TimeoutError:
+            self.__abandon(entry)
+            self._rejected += count
+            raise AdmissionRejected('admission deadline exceeded')
+        except asyncio.CancelledError:
+            self.__abandon(entry)
+            raise
+
+    def release(self, count: int, confirmed: bool, congested: bool = False, rounds: int = 0):
+        """
+        see AdmissionController.release - the coroutines at the head of the queue are admitted
+        """
+        self._controller.release(count, confirmed, congested, rounds)
+        self.__wake()
+
+    def __abandon(self, entry: tuple):
+        #   private method
+        count, future = entry
+        if entry in self._waiters:
+            self._waiters.remove(entry)
+        elif future.done() and not future.cancelled():
+            #   admitted while timing out (or being cancelled): the slots are given back
+            self._controller.release(count, False)
+        self.__wake()
+
+    def __wake(self):
+        #   private method
+        while self._waiters:
+            count, future = self._waiters[0]
+            if future.done():
+                self._waiters.popleft()
+                continue
+            if not self._controller.try_acquire(count):
+                return
+            self._waiters.popleft()
+            future.set_result(None)
+
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def stats(self) -> dict:
+        """
+        see AdmissionController.stats (the queue is the queue of the waiting coroutines)
+        """
+        stats: dict = self._controller.stats()
+        stats['queued'] = len(self._waiters)
+        stats['rejected'] += self._rejected
+        return stats
@@ -0,0 +1,311 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Asyncio HTTP/1.1 transport and async clients for algod and kmd
+the clients expose the same requests and return the same response shapes
+as algosdk.v2client.algod.AlgodClient and algosdk.kmd.KMDClient
+"""
+import ssl
+import json
+import base64
+import asyncio
+from urllib import parse
+from typing import Tuple, Optional
+
+from    algosdk                     import constants
+from    algosdk                     import encoding
+from    algosdk                     import error
+from    algosdk.future              import transaction
+
+
+class AsyncHTTPTransport():
+    """
+    keep-alive HTTP/1.1 connections (asyncio streams) to a single host
+    up to pool_size idle connections are kept for reuse and at most max_concurrent requests
+    are in progress at the same time (0: no limit, see HTTPConnectionPool)
+    """
+
+    def __init__(self, address: str, pool_size: int = 16, timeout: float = None, max_concurrent: int = 0):
+        url = parse.urlsplit(address)
+        self._scheme: str = url.scheme or 'http'
+        self._host: str = url.hostname or 'localhost'
+        self._port: int = url.port or (443 if self._scheme == 'https' else 80)
+        self._prefix: str = url.path.rstrip('/')
+        self._pool_size: int = pool_size
+        self._timeout: Optional[float] = timeout
+        self._slots = asyncio.Semaphore(max_concurrent) if max_concurrent > 0 else None
+        self._idle: list = []                       #   idle connections: (reader, writer)
+        self._ssl = ssl.create_default_context() if self._scheme == 'https' else None
+
+    async def close(self):
+        idle = self._idle
+        self._idle = []
+        for _, writer in idle:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        headers: dict = None,
+        body: bytes = None,
+        timeout: float = None,
+        limited: bool = True                        #   False: not counted in max_concurrent (long polls)
+        ) -> Tuple[int, bytes]:
+        """
+        returns (status code, response body)
+        timeout (seconds) overrides the transport timeout for this request
+        """
+        timeout = timeout if timeout is not None else self._timeout
+        if self._slots is None or not limited:
+            return await self.__timed(method, path, headers, body, timeout)
+        async with self._slots:
+            return await self.__timed(method, path, headers, body, timeout)
+
+    async def __timed(self, method: str, path: str, headers: dict, body: bytes, timeout: Optional[float]) -> Tuple[int, bytes]:
+        if timeout is None:
+            return await self.__request(method, path, headers, body)
+        return await asyncio.wait_for(self.__request(method, path, headers, body), timeout)
+
+    async def __request(self, method: str, path: str, headers: dict, body: bytes) -> Tuple[int, bytes]:
+        head = '{} {} HTTP/1.1\r\nHost: {}:{}\r\n'.format(method, self._prefix + path, self._host, self._port)
+        for name, value in (headers or {}).items():
+            head += '{}: {}\r\n'.format(name, value)
+        body = body or b''
+        head += 'Content-Length: {}\r\n\r\n'.format(len(body))
+        payload = head.encode('latin-1') + body
+
+        #   an idle connection might have been closed by the server: retry once on a new one
+        for attempt in range(2):
+            reused = len(self._idle) > 0
+            reader, writer = self._idle.pop() if reused else await asyncio.open_connection(
+                self._host, self._port, ssl=self._ssl)
+            try:
+                writer.write(payload)
+                await writer.drain()
+                status, keep_alive, response = await self.__response(reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except BaseException:
+                #   cancelled or timed out: the connection state is unknown
+                writer.close()
+                raise
+
+            if keep_alive and len(self._idle) < self._pool_size:
+                self._idle.append((reader, writer))
+            else:
+                writer.close()
+            return status, response
+
+    @staticmethod
+    async def __response(reader: asyncio.StreamReader) -> Tuple[int, bool, bytes]:
+        status_line = await reader.readuntil(b'\r\n')
+        parts = status_line.decode('latin-1').split(' ', 2)
+        status = int(parts[1])
+        keep_alive = parts[0] == 'HTTP/1.1'
+
+        response_headers: dict = {}
+        while True:
+            line = await reader.readuntil(b'\r\n')
+            if line == b'\r\n':
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            response_headers[name.strip().lower()] = value.strip()
+
+        connection = response_headers.get('connection', '').lower()
+        if connection == 'close':
+            keep_alive = False
+        elif connection == 'keep-alive':
+            keep_alive = True
+
+        if response_headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await reader.readuntil(b'\r\n')).split(b';')[0], 16)
+                if size == 0:
+                    #   trailers (if any) up to the empty line
+                    while (await reader.readuntil(b'\r\n')) != b'\r\n':
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            return status, keep_alive, b''.join(chunks)
+
+        if 'content-length' in response_headers:
+            return status, keep_alive, await reader.readexactly(int(response_headers['content-length']))
+
+        #   no length: the body ends with the connection
+        return status, False, await reader.read()
+
+
+class AsyncAlgodClient():
+    """
+    async counterpart of algosdk.v2client.algod.AlgodClient (subset used by the worker)
+    """
+
+    LONG_POLL: str = '/status/wait-for-block-after'  #   does not take a request slot of the transport
+
+    def __init__(self, algod_token: str, algod_address: str, transport: AsyncHTTPTransport = None):
+        self.algod_token: str = algod_token
+        self.algod_address: str = algod_address
+        self._transport = transport or AsyncHTTPTransport(algod_address)
+
+    async def close(self):
+        await self._transport.close()
+
+    async def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: dict = None,
+        data: bytes = None,
+        headers: dict = None,
+        response_format: str = 'json',
+        timeout: float = None
+        ):
+        header = {'User-Agent': 'py-algorand-sdk', 'Connection': 'keep-alive'}
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header[constants.algod_auth_header] = self.algod_token
+        limited: bool = not requrl.startswith(self.LONG_POLL)
+        if requrl not in constants.unversioned_paths:
+            requrl = '/v2' + requrl
+        if params:
+            requrl = requrl + '?' + parse.urlencode(params)
+
+        status, body = await self._transport.request(method, requrl, header, data, timeout, limited)
+        if status >= 400:
+            message = body.decode('utf-8', errors='replace')
+            try:
+                message = json.loads(message)['message']
+            except Exception:
+                pass
+            raise error.AlgodHTTPError(message, status)
+
+        if response_format == 'json':
+            try:
+                return json.loads(body)
+            except Exception as e:
+                raise error.AlgodResponseError('Failed to parse JSON response from algod') from e
+        return body
+
+    async def status(self) -> dict:
+        return await self.algod_request('GET', '/status')
+
+    async def status_after_block(self, round_num: int) -> dict:
+        return await self.algod_request('GET', '/status/wait-for-block-after/' + str(round_num))
+
+    async def versions(self) -> dict:
+        return await self.algod_request('GET', '/versions')
+
+    async def account_info(self, address: str) -> dict:
+        return await self.algod_request('GET', '/accounts/' + address)
+
+    async def account_application_info(self, address: str, application_id: int) -> dict:
+        return await self.algod_request('GET', '/accounts/' + address + '/applications/' + str(application_id))
+
+    async def block_info(self, round_num: int, response_format: str = 'json'):
+        return await self.algod_request(
+            'GET', '/blocks/' + str(round_num), {'format': response_format}, response_format=response_format)
+
+    async def application_info(self, application_id: int) -> dict:
+        return await self.algod_request('GET', '/applications/' + str(application_id))
+
+    async def pending_transaction_info(self, transaction_id: str) -> dict:
+        return await self.algod_request('GET', '/transactions/pending/' + transaction_id, {'format': 'json'})
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        res = await self.algod_request('GET', '/transactions/params')
+        return transaction.SuggestedParams(
+            res['fee'],
+            res['last-round'],
+            res['last-round'] + 1000,
+            res['genesis-hash'],
+            res['genesis-id'],
+            False,
+            res['consensus-version'],
+            res['min-fee'],
+        )
+
+    async def compile(self, source: str) -> dict:
+        return await self.algod_request(
+            'POST', '/teal/compile', {'sourcemap': False}, source.encode('utf-8'),
+            {'Content-Type': 'application/x-binary'})
+
+    async def send_transactions(self, txns: list) -> str:
+        serialized = b''.join(base64.b64decode(encoding.msgpack_encode(txn)) for txn in txns)
+        response = await self.algod_request(
+            'POST', '/transactions', None, serialized, {'Content-Type': 'application/x-binary'})
+        return response['txId']
+
+    async def send_transaction(self, txn) -> str:
+        return await self.send_transactions([txn])
+
+
+class AsyncKMDClient():
+    """
+    async counterpart of algosdk.kmd.KMDClient (subset used by the worker)
+    """
+
+    def __init__(self, kmd_token: str, kmd_address: str, transport: AsyncHTTPTransport = None):
+        self.kmd_token: str = kmd_token
+        self.kmd_address: str = kmd_address
+        self._transport = transport or AsyncHTTPTransport(kmd_address)
+
+    async def close(self):
+        await self._transport.close()
+
+    async def kmd_request(self, method: str, requrl: str, data: dict = None) -> dict:
+        header = {'Connection': 'keep-alive'}
+        if requrl not in constants.no_auth:
+            header[constants.kmd_auth_header] = self.kmd_token
+        if requrl not in constants.unversioned_paths:
+            requrl = '/v1' + requrl
+        body = None
+        if data:
+            body = json.dumps(data).encode('utf-8')
+
+        status, response = await self._transport.request(method, requrl, header, body)
+        text = response.decode('utf-8', errors='replace')
+        if status >= 400:
+            try:
+                raise error.KMDHTTPError(json.loads(text)['message'])
+            except (ValueError, KeyError):
+                raise error.KMDHTTPError(text)
+        return json.loads(text)
+
+    async def versions(self) -> list:
+        return (await self.kmd_request('GET', '/versions'))['versions']
+
+    async def list_wallets(self) -> list:
+        res = await self.kmd_request('GET', '/wallets')
+        return res.get('wallets', [])
+
+    async def init_wallet_handle(self, id: str, password: str) -> str:
+        res = await self.kmd_request('POST', '/wallet/init', {'wallet_id': id, 'wallet_password': password})
+        return res['wallet_handle_token']
+
+    async def release_wallet_handle(self, handle: str) -> bool:
+        result = await self.kmd_request('POST', '/wallet/release', {'wallet_handle_token': handle})
+        return result == {}
+
+    async def renew_wallet_handle(self, handle: str) -> dict:
+        return (await self.kmd_request('POST', '/wallet/renew', {'wallet_handle_token': handle}))['wallet_handle']
+
+    async def generate_key(self, handle: str, display_mnemonic: bool = True) -> str:
+        res = await self.kmd_request('POST', '/key', {'wallet_handle_token': handle})
+        return res['address']
+
+    async def export_key(self, handle: str, password: str, address: str) -> str:
+        res = await self.kmd_request('POST', '/key/export', {
+            'wallet_handle_token': handle, 'address': address, 'wallet_password': password})
+        return res['private_key']
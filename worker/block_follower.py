@@ -0,0 +1,291 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Block follower: reads every new block from algod once and keeps the grant index
+(see GrantIndex) up to date with the DOP application calls
+"""
+import time
+import base64
+import threading
+from typing import Callable, Optional
+
+import msgpack
+
+import algosdk                                      #   better type support (not necessary)
+from    algosdk                     import encoding
+from    algosdk                     import constants
+
+from grant_index import GrantIndex
+from event_stream import EventStream
+
+
+class BlockFollower():
+    """
+    a background thread reads the blocks (msgpack format) from the round following the
+    checkpoint of the index and extracts the operations on the DOP contracts:
+        create          application created with a known DOP approval program (see add_program)
+        optin           account opted in
+        closeout        account opted out (or cleared its local state)
+        subscribe       (from a subscriber)
+        unsubscribe     (from a subscriber)
+        grant           (from the creator, every foreign account is granted)
+        revoke          (from the creator, every foreign account is revoked)
+        setkey          (from the creator)
+        delete          application deleted
+        payment         funding payment (note starting with FUNDING_NOTE or paid to the linked account of a contract)
+    the operations of each block are published to the event stream (see EventStream) and then
+    applied to the index along with the checkpoint
+    the contracts created before the first indexed round are not known, unless they are
+    registered with watch (their earlier subscriptions and grants are not indexed)
+    """
+
+    RETRY_SECONDS: float = 1.0                      #   pause after a failed request (algod not reachable, ...)
+
+    #   OnCompletion values (see algosdk.future.transaction.OnComplete)
+    OC_NOOP: int    = 0
+    OC_OPTIN: int   = 1
+    OC_CLOSEOUT: int = 2
+    OC_CLEAR: int   = 3
+    OC_DELETE: int  = 5
+
+    CREATOR_OPS: tuple = ('grant', 'revoke', 'setkey')
+    SUBSCRIBER_OPS: tuple = ('subscribe', 'unsubscribe')
+    FUNDING_NOTE: bytes = b'DOP funds'              #   prefix of the note of the funding payments sent by the worker
+
+    def __init__(
+        self,
+        client: algosdk.v2client.algod.AlgodClient,
+        index: GrantIndex,
+        start_round: int = 0,                       #   first round to follow if the index has no checkpoint (0: last round)
+        on_round: Callable[[int], None] = None,     #   called for every round applied
+        events: EventStream = None                  #   receives the events of every round applied
+        ):
+        self._client = client
+        self._index: GrantIndex = index
+        self._events: EventStream = events
+        self._start_round: int = start_round
+        self._on_round = on_round
+
+        self._lock = threading.Lock()
+        self._programs: set = set()                 #   known DOP approval programs (compiled)
+        self._apps: dict = index.apps()             #   app_id -> (creator, linked)
+        self._thread: threading.Thread = None
+        self._running: bool = False
+        self._last_round: int = index.checkpoint()  #   last round applied
+
+    @property
+    def last_round(self) -> int:
+        return self._last_round
+
+    def add_program(self, approval_program: bytes):
+        """
+        the applications created with approval_program are DOP contracts
+        """
+        with self._lock:
+            self._programs.add(bytes(approval_program))
+
+    def watch(self, app_id: int, creator: str, linked: str = ''):
+        """
+        registers a DOP contract (for instance deployed by the worker) - idempotent
+        """
+        with self._lock:
+            if app_id in self._apps:
+                return
+            self._apps[app_id] = (creator, linked)
+        self._index.add_app(app_id, creator, linked, self._last_round)
+
+    def is_watched(self, app_id: int) -> bool:
+        with self._lock:
+            return app_id in self._apps
+
+    def start(self):
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self.__run, name='dop-block-follower', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._lock:
+            self._running = False
+        #   the thread might be blocked waiting for a round: do not wait for it
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    #--------------------------------------------------------------------
+    #   follower thread
+    #--------------------------------------------------------------------
+    def __run(self):
+        next_round: int = self._last_round + 1 if self._last_round > 0 else 0
+        while self._running:
+            try:
+                if next_round == 0:
+                    next_round = self._start_round if self._start_round > 0 else self._client.status()['last-round']
+                #   wait for the round (catching up does not wait)
+                last_round = self._client.status_after_block(next_round - 1)['last-round']
+                while self._running and next_round <= last_round:
+                    self.__follow(next_round)
+                    next_round += 1
+            except Exception:
+                #   algod not reachable (or transient error): retry
+                time.sleep(self.RETRY_SECONDS)
+
+    def __follow(self, round_number: int):
+        block = self.read_block(self._client, round_number)
+        operations = self.operations(block)
+        if self._events is not None:
+            #   before the checkpoint: the events are delivered at least once
+            self._events.publish(round_number, operations)
+        self._index.apply(round_number, operations)
+        self._last_round = round_number
+        if self._on_round is not None:
+            try:
+                self._on_round(round_number)
+            except Exception:
+                pass
+
+    @staticmethod
+    def read_block(client: algosdk.v2client.algod.AlgodClient, round_number: int) -> dict:
+        """
+        returns the block of round_number (the raw msgpack structure: addresses are 32 bytes values)
+        """
+        response = client.block_info(round_num=round_number, response_format='msgpack')
+        return msgpack.unpackb(response, raw=False, strict_map_key=False).get('block', {})
+
+    def operations(self, block: dict) -> list:
+        """
+        returns the operations on the DOP contracts held by the block, in order
+        {'op', 'txid', 'app_id', 'sender', 'accounts', 'args', 'linked' (create only), 'amount' (payment only)}
+        """
+        stibs: list = block.get('txns') or []
+        with self._lock:
+            linked_accounts: set = {linked for _, linked in self._apps.values() if linked != ''}
+
+        #   the group size of each group of the block (see the deposit group in dop.stateful.teal)
+        group_sizes: dict = {}
+        for stib in stibs:
+            group = stib.get('txn', {}).get('grp')
+            if group is not None:
+                group_sizes[group] = group_sizes.get(group, 0) + 1
+
+        operations: list = []
+        previous: dict = {}
+        for stib in stibs:
+            self.__collect(block, stib, previous, group_sizes, linked_accounts, operations, True)
+            previous = stib.get('txn', {})
+        return operations
+
+    @staticmethod
+    def txid(block: dict, stib: dict) -> str:
+        """
+        returns the id of a transaction of the block (the genesis hash and id are not stored
+        with the transactions of the block)
+        """
+        txn: dict = dict(stib.get('txn', {}))
+        if 'gh' in block:
+            txn['gh'] = block['gh']
+        if stib.get('hgi'):
+            txn['gen'] = block.get('gen', '')
+        to_sign = constants.txid_prefix + base64.b64decode(encoding.msgpack_encode(txn))
+        return base64.b32encode(encoding.checksum(to_sign)).decode().rstrip('=')
+
+    def __collect(
+        self
+    ,   block: dict
+    ,   stib: dict
+    ,   previous: dict
+    ,   group_sizes: dict
+    ,   linked_accounts: set
+    ,   operations: list
+    ,   outer: bool
+    ):
+        #   private method
+        txn: dict = stib.get('txn', {})
+        #   the inner transactions (an application calling a DOP contract) come after their outer transaction
+        inner: list = (stib.get('dt') or {}).get('itx') or []
+
+        operation = None
+        if txn.get('type') == 'appl':
+            operation = self.__operation(stib, txn, previous, group_sizes)
+        elif txn.get('type') == 'pay':
+            operation = self.__payment(txn, linked_accounts)
+        if operation is not None:
+            #   the ids of the inner transactions are not computed
+            operation['txid'] = self.txid(block, stib) if outer else ''
+            operations.append(operation)
+
+        inner_previous: dict = {}
+        for inner_stib in inner:
+            self.__collect(block, inner_stib, inner_previous, {}, linked_accounts, operations, False)
+            inner_previous = inner_stib.get('txn', {})
+
+    def __payment(self, txn: dict, linked_accounts: set) -> Optional[dict]:
+        #   private method
+        if txn.get('rcv') is None:
+            return None
+        receiver: str = encoding.encode_address(txn.get('rcv'))
+        if not (txn.get('note') or b'').startswith(self.FUNDING_NOTE) and receiver not in linked_accounts:
+            return None
+        return {
+            'op': 'payment'
+        ,   'app_id': 0
+        ,   'sender': encoding.encode_address(txn.get('snd'))
+        ,   'accounts': [receiver]
+        ,   'args': []
+        ,   'amount': txn.get('amt', 0)
+        }
+
+    def __operation(self, stib: dict, txn: dict, previous: dict, group_sizes: dict) -> Optional[dict]:
+        #   private method
+        sender: str = encoding.encode_address(txn.get('snd'))
+        app_id: int = txn.get('apid', 0)
+        args: list = txn.get('apaa') or []
+
+        if app_id == 0:
+            #   creation: the index of the new application is in the apply data
+            created: int = stib.get('apid', 0)
+            with self._lock:
+                known = txn.get('apap') in self._programs
+                if not known or created == 0:
+                    return None
+                #   the linked address is passed decoded (32 bytes), before 1.5 as its string
+                linked = ''
+                if args and len(args[0]) == 32:
+                    linked = encoding.encode_address(args[0])
+                elif args:
+                    linked = args[0].decode('utf-8', errors='replace')
+                self._apps.setdefault(created, (sender, linked))
+            return {'op': 'create', 'app_id': created, 'sender': sender, 'accounts': [], 'args': args, 'linked': linked}
+
+        with self._lock:
+            app = self._apps.get(app_id)
+            if app is None:
+                return None
+            creator, linked = app
+            if txn.get('apan', self.OC_NOOP) == self.OC_DELETE:
+                self._apps.pop(app_id, None)
+
+        accounts: list = [encoding.encode_address(account) for account in txn.get('apat') or []]
+        operation: dict = {'op': '', 'app_id': app_id, 'sender': sender, 'accounts': accounts, 'args': args}
+        on_complete: int = txn.get('apan', self.OC_NOOP)
+        if on_complete == self.OC_OPTIN:
+            operation['op'] = 'optin'
+        elif on_complete in (self.OC_CLOSEOUT, self.OC_CLEAR):
+            operation['op'] = 'closeout'
+        elif on_complete == self.OC_DELETE:
+            operation['op'] = 'delete'
+        elif on_complete == self.OC_NOOP and args:
+            #   a deposit (pay to the linked account + appl) does not change the local state
+            group = txn.get('grp')
+            if group is not None and group_sizes.get(group) == 2 and previous.get('grp') == group \
+                and previous.get('type') == 'pay' and linked != '' and previous.get('rcv') is not None \
+                and encoding.encode_address(previous.get('rcv')) == linked:
+                return None
+            op = args[0].decode('utf-8', errors='replace')
+            #   the creator logic and the subscriber logic are selected by the sender
+            if (sender == creator and op in self.CREATOR_OPS) or (sender != creator and op in self.SUBSCRIBER_OPS):
+                operation['op'] = op
+        return operation if operation['op'] != '' else None
@@ -0,0 +1,386 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Block driven tracker of the confirmation of the transactions sent by the worker
+"""
+import time
+import asyncio
+import threading
+import concurrent.futures
+from concurrent.futures import Future
+from typing import Callable, Optional, Tuple
+
+import algosdk                                      #   better type support (not necessary)
+
+from error import DopError
+from block_follower import BlockFollower
+
+
+class _Pending():
+    def __init__(self, txid: str, timeout: int, future: Future):
+        self.txid: str = txid
+        self.timeout: int = timeout                 #   max number of rounds to wait
+        self.future: Future = future
+        self.deadline: int = 0                      #   last round the transaction can be confirmed in (0: not set yet)
+        self.expires: float = 0.0                   #   wall clock guard (the node might stop producing rounds)
+
+
+class ConfirmationTracker():
+    """
+    a single background thread follows the rounds and resolves all the outstanding
+    transactions: for every new round the ids of the transactions in the block are
+    requested once (/v2/blocks/{round}/txids) and matched against the outstanding ones,
+    so the cost of the confirmation is O(rounds) instead of O(pending transactions x rounds)
+    if the node does not support the block txids endpoint (501, or BLOCK_MISSES consecutive
+    400/404 for committed rounds), the tracker falls back to checking each outstanding
+    transaction once per round (still one loop for all waiters); a single 400/404 (the block
+    is not available yet on the node that answered) makes the tracker retry the round
+
+    track() returns a Future resolved with the pending transaction information (as
+    returned by pending_transaction_info) or failed with an exception if the transaction
+    is rejected (pool error) or not confirmed within timeout rounds
+    """
+
+    ROUND_MAX_SECONDS: float = 20.0                 #   wall clock guard, per round of timeout
+    ROUND_SECONDS: float = 3.5                      #   initial estimate of the round duration (refined by observing the rounds)
+    BLOCK_MISSES: int = 3                           #   consecutive 400/404 of /blocks/{round}/txids before falling back
+
+    def __init__(
+        self,
+        client: algosdk.v2client.algod.AlgodClient,
+        on_round: Callable[[int], None] = None      #   called for every new round observed
+        ):
+        self._client = client
+        self._on_round = on_round
+
+        self._cond = threading.Condition()
+        self._pending: dict = {}                    #   txid -> list of _Pending
+        self._thread: threading.Thread = None
+        self._running: bool = False
+
+        self._last_round: int = 0                   #   last round known to be committed
+        self._last_round_at: float = 0.0
+        self._round_seconds: float = self.ROUND_SECONDS
+        self._block_txids: bool = True              #   False if the node does not support /blocks/{round}/txids
+        self._block_misses: int = 0                 #   consecutive 400/404 of /blocks/{round}/txids
+
+    @property
+    def last_round(self) -> int:
+        return self._last_round
+
+    def current_round(self) -> int:
+        """
+        returns an estimate of the current round: the last round observed plus the rounds
+        elapsed since then (0 if no round has been observed yet)
+        """
+        if self._last_round == 0:
+            return 0
+        return self._last_round + int((time.monotonic() - self._last_round_at) / self._round_seconds)
+
+    def notify_round(self, round_number: int):
+        """
+        a round has been observed by someone else (for instance in an algod response)
+        """
+        self.__set_last_round(round_number)
+
+    def outstanding(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self.__run, name='dop-confirmation-tracker', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            pending = self._pending
+            self._pending = {}
+            self._cond.notify_all()
+        for entries in pending.values():
+            for entry in entries:
+                self.__fail(entry, Exception('confirmation tracker stopped'))
+        #   the thread might be blocked waiting for a round: do not wait for it
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def track(self, txid: str, timeout: int) -> Future:
+        """
+        returns a Future resolved with the pending transaction information
+        timeout is the maximum number of rounds to wait (see workerAlgorand.wait_for_confirmation)
+        """
+        future: Future = Future()
+        entry = _Pending(txid, timeout, future)
+        entry.expires = time.monotonic() + timeout * self.ROUND_MAX_SECONDS
+        with self._cond:
+            if not self._running:
+                future.set_exception(Exception('confirmation tracker not running'))
+                return future
+            if self._last_round > 0 and self._pending:
+                #   the tracker is following the rounds: the deadline can be set right away
+                entry.deadline = self._last_round + timeout
+            self._pending.setdefault(txid, []).append(entry)
+            self._cond.notify_all()
+        return future
+
+    def wait(self, txid: str, timeout: int) -> dict:
+        """
+        blocking version of track (same semantic as workerAlgorand.wait_for_confirmation)
+        """
+        return self.track(txid, timeout).result()
+
+    #--------------------------------------------------------------------
+    #   tracker thread
+    #--------------------------------------------------------------------
+    def __run(self):
+        next_round: int = 0                         #   0: idle (not following the rounds)
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    next_round = 0
+                    self._cond.wait()
+                if not self._running:
+                    return
+
+            try:
+                if next_round == 0:
+                    #   (re)start following the rounds from the last committed one
+                    self.__set_last_round(self._client.status()['last-round'])
+                    next_round = self._last_round
+                    self.__set_deadlines()
+
+                if next_round > self._last_round:
+                    self.__set_last_round(self._client.status_after_block(next_round - 1)['last-round'])
+                    if next_round > self._last_round:
+                        continue
+                    self.__set_deadlines()
+
+                self.__process_round(next_round)
+                next_round += 1
+            except Exception:
+                #   algod not reachable (or transient error): retry
+                time.sleep(1.0)
+            self.__expire()
+
+    def __set_last_round(self, round_number: int):
+        if round_number > self._last_round:
+            now = time.monotonic()
+            if self._last_round > 0 and round_number == self._last_round + 1:
+                #   consecutive rounds: refine the estimate of the round duration
+                self._round_seconds = 0.9 * self._round_seconds + 0.1 * max(now - self._last_round_at, 0.5)
+            self._last_round = round_number
+            self._last_round_at = now
+            if self._on_round is not None:
+                try:
+                    self._on_round(round_number)
+                except Exception:
+                    pass
+
+    def __set_deadlines(self):
+        with self._cond:
+            for entries in self._pending.values():
+                for entry in entries:
+                    if entry.deadline == 0:
+                        entry.deadline = self._last_round + entry.timeout
+
+    def __snapshot(self) -> list:
+        with self._cond:
+            return list(self._pending.keys())
+
+    def __process_round(self, round_number: int):
+        if self._block_txids:
+            try:
+                response = self._client.algod_request('GET', '/blocks/{}/txids'.format(round_number))
+                block_txids = response.get('blockTxids') or []
+            except algosdk.error.AlgodHTTPError as e:
+                if e.code in (400, 404):
+                    self._block_misses += 1
+                if e.code == 501 or self._block_misses >= self.BLOCK_MISSES:
+                    #   the node does not implement the endpoint: fall back to per txn checks
+                    self._block_txids = False
+                    return self.__process_round(round_number)
+                #   the block is not available (yet) on the node that answered: the round is retried
+                raise
+            self._block_misses = 0
+
+            outstanding = set(self.__snapshot())
+            for txid in outstanding.intersection(block_txids):
+                self.__check(txid, round_number)
+
+        #   in block mode, the transactions not seen within their deadline get a final check
+        #   (the transaction might have been rejected by the pool)
+        #   in fallback mode every outstanding transaction is checked once per round
+        for txid in self.__snapshot():
+            with self._cond:
+                entries = self._pending.get(txid, [])
+                expired = any(e.deadline != 0 and e.deadline <= round_number for e in entries)
+            if expired or not self._block_txids:
+                self.__check(txid, 0, final=expired)
+
+    def __check(self, txid: str, confirmed_round: int, final: bool = False):
+        """
+        confirmed_round != 0: the transaction has been found in the block confirmed_round
+        """
+        try:
+            pending_txn = self._client.pending_transaction_info(txid)
+        except Exception:
+            if confirmed_round == 0:
+                if final:
+                    self.__resolve_expired(txid, Exception(
+                        'pending tx not found in timeout rounds'))
+                return
+            #   found in the block, but the pending info is not available anymore
+            pending_txn = {'confirmed-round': confirmed_round, 'pool-error': ''}
+            try:
+                pending_txn = self.block_confirmation(
+                    BlockFollower.read_block(self._client, confirmed_round), txid, confirmed_round)
+            except Exception:
+                pass
+
+        if pending_txn.get('confirmed-round', 0) > 0:
+            self.__resolve(txid, pending_txn)
+        elif pending_txn.get('pool-error'):
+            self.__resolve(txid, None, Exception('pool error: {}'.format(pending_txn['pool-error'])))
+        elif final:
+            self.__resolve_expired(txid, None)
+
+    @staticmethod
+    def block_confirmation(block: dict, txid: str, confirmed_round: int) -> dict:
+        """
+        returns the pending information of a transaction committed in block (read when algod does
+        not hold the pending information anymore): the confirmed round and, for an application
+        creation, the application index (apply data of the block)
+        """
+        pending_txn: dict = {'confirmed-round': confirmed_round, 'pool-error': ''}
+        for stib in block.get('txns') or []:
+            if BlockFollower.txid(block, stib) != txid:
+                continue
+            if stib.get('apid', 0) > 0:
+                pending_txn['application-index'] = stib['apid']
+            break
+        return pending_txn
+
+    def __resolve(self, txid: str, pending_txn: Optional[dict], exception: Exception = None):
+        with self._cond:
+            entries = self._pending.pop(txid, [])
+        for entry in entries:
+            if exception is None:
+                self.__succeed(entry, pending_txn)
+            else:
+                self.__fail(entry, exception)
+
+    def __resolve_expired(self, txid: str, exception: Exception):
+        with self._cond:
+            entries = self._pending.get(txid, [])
+            expired = [e for e in entries if e.deadline != 0 and e.deadline <= self._last_round]
+            remaining = [e for e in entries if e not in expired]
+            if remaining:
+                self._pending[txid] = remaining
+            else:
+                self._pending.pop(txid, None)
+        for entry in expired:
+            self.__fail(entry, exception or Exception(
+                'pending tx not found in timeout rounds, timeout value = : {}'.format(entry.timeout)))
+
+    def __expire(self):
+        #   wall clock guard: the node is not reachable or not producing rounds
+        now = time.monotonic()
+        with self._cond:
+            expired = []
+            for txid in list(self._pending.keys()):
+                entries = self._pending[txid]
+                keep = [e for e in entries if e.expires > now]
+                expired.extend(e for e in entries if e.expires <= now)
+                if keep:
+                    self._pending[txid] = keep
+                else:
+                    del self._pending[txid]
+        for entry in expired:
+            self.__fail(entry, Exception(
+                'pending tx not found in timeout rounds, timeout value = : {}'.format(entry.timeout)))
+
+    @staticmethod
+    def __succeed(entry: _Pending, pending_txn: dict):
+        if not entry.future.done():
+            entry.future.set_result(pending_txn)
+
+    @staticmethod
+    def __fail(entry: _Pending, exception: Exception):
+        if not entry.future.done():
+            entry.future.set_exception(exception)
+
+
+class OperationHandle():
+    """
+    handle of an operation sent without waiting for its confirmation
+    (see the *_nowait methods of workerAlgorand)
+    the handle can be polled (done), waited for (wait) or awaited (wait_async)
+    """
+
+    def __init__(self, txid: str, future: Future, wait_error: DopError):
+        self._txid: str = txid
+        self._future: Future = future
+        self._wait_error: DopError = wait_error     #   error returned if the transaction is not confirmed
+
+    @property
+    def txid(self) -> str:
+        return self._txid
+
+    @property
+    def future(self) -> Future:
+        return self._future
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    @property
+    def confirmed_round(self) -> int:
+        """
+        returns the round the transaction has been confirmed in (0 if not (yet) confirmed)
+        """
+        if not self._future.done() or self._future.exception() is not None:
+            return 0
+        return self._future.result().get('confirmed-round', 0)
+
+    @property
+    def pool_error(self) -> str:
+        """
+        returns the reason the transaction has not been confirmed (empty if not (yet) failed)
+        """
+        if not self._future.done() or self._future.exception() is None:
+            return ''
+        return str(self._future.exception())
+
+    def __outcome(self) -> Tuple[dict, DopError]:
+        if self._future.exception() is not None:
+            return {}, self._wait_error
+        return self._future.result(), DopError(0,"")
+
+    def wait(self, timeout: float = None) -> Tuple[dict, DopError]:
+        """
+        waits (at most timeout seconds, None: until the operation is resolved) and returns
+        the pending transaction information of the confirmed transaction
+        """
+        try:
+            concurrent.futures.wait([self._future], timeout=timeout)
+        except Exception:
+            pass
+        if not self._future.done():
+            return {}, DopError(309,"The operation has not been confirmed yet.")
+        return self.__outcome()
+
+    async def wait_async(self) -> Tuple[dict, DopError]:
+        """
+        same as wait, to be awaited from a coroutine
+        """
+        try:
+            await asyncio.wrap_future(self._future)
+        except Exception:
+            pass
+        return self.__outcome()
@@ -0,0 +1,121 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Typed events of the DOP transactions found by the block follower (see BlockFollower),
+delivered to the registered callbacks and queues
+"""
+import queue
+import threading
+from enum import Enum
+from typing import Callable
+
+
+class DopEventType(Enum):
+    APP_CREATED = 'create'
+    OPTIN       = 'optin'
+    CLOSEOUT    = 'closeout'
+    SUBSCRIBE   = 'subscribe'
+    UNSUBSCRIBE = 'unsubscribe'
+    GRANT       = 'grant'
+    REVOKE      = 'revoke'
+    SETKEY      = 'setkey'
+    APP_DELETED = 'delete'
+    FUNDING     = 'payment'
+
+
+class DopEvent():
+    """
+    a DOP transaction committed in round
+    txid is empty for the inner transactions (an application calling a DOP contract)
+    app_id is the application index (for APP_CREATED: the index of the new application, 0 for FUNDING)
+    accounts are the foreign accounts (GRANT, REVOKE) or the receiver (FUNDING)
+    """
+
+    def __init__(self, operation: dict, round: int):
+        self.type: DopEventType = DopEventType(operation['op'])
+        self.round: int = round
+        self.txid: str = operation.get('txid', '')
+        self.app_id: int = operation['app_id']
+        self.sender: str = operation['sender']
+        self.accounts: list = operation.get('accounts', [])
+        self.amount: int = operation.get('amount', 0)       #   microAlgo (FUNDING)
+        self.linked: str = operation.get('linked', '')      #   address of the stateless account (APP_CREATED)
+
+    def __repr__(self) -> str:
+        return 'DopEvent({}, round={}, txid={}, app_id={}, sender={})'.format(
+            self.type.name, self.round, self.txid, self.app_id, self.sender)
+
+
+class EventStream():
+    """
+    the events of a round are delivered (in order) before the round is checkpointed by the follower:
+    after a restart the rounds not checkpointed are followed again, so an event can be delivered
+    more than once (the consumers can use txid and round to discard the duplicates)
+    a callback raising an exception does not stop the delivery; a full queue drops the event
+    (see stats)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._callbacks: list = []
+        self._queues: list = []
+        self._delivered: int = 0
+        self._dropped: int = 0
+
+    def add_listener(self, callback: Callable[[DopEvent], None]):
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def remove_listener(self, callback: Callable[[DopEvent], None]):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def add_queue(self, maxsize: int = 0) -> queue.Queue:
+        """
+        returns a new queue receiving all the following events (maxsize 0: not bounded)
+        """
+        events = queue.Queue(maxsize)
+        with self._lock:
+            self._queues.append(events)
+        return events
+
+    def remove_queue(self, events: queue.Queue):
+        with self._lock:
+            if events in self._queues:
+                self._queues.remove(events)
+
+    def stats(self) -> dict:
+        """
+        returns the number of events delivered and dropped (full queues)
+        """
+        with self._lock:
+            return {'delivered': self._delivered, 'dropped': self._dropped}
+
+    def publish(self, round: int, operations: list):
+        """
+        delivers the events of the operations of round (see BlockFollower.operations)
+        """
+        with self._lock:
+            callbacks = list(self._callbacks)
+            queues = list(self._queues)
+        if not callbacks and not queues:
+            return
+
+        for operation in operations:
+            event = DopEvent(operation, round)
+            for callback in callbacks:
+                try:
+                    callback(event)
+                except Exception:
+                    pass
+            dropped = 0
+            for events in queues:
+                try:
+                    events.put_nowait(event)
+                except queue.Full:
+                    dropped += 1
+            with self._lock:
+                self._delivered += 1
+                self._dropped += dropped
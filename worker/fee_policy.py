@@ -0,0 +1,152 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Fee policy: the fee of each transaction is computed from the suggested fee per byte, the
+congestion of the transaction pool and the priority of the operation (see SuggestedParamsProvider)
+"""
+import threading
+from typing import Optional
+
+import msgpack
+
+import algosdk                                      #   better type support (not necessary)
+from    algosdk.future              import transaction
+
+
+class FeePolicy():
+    """
+    the fee of a transaction is the highest of
+        1)  the minimum fee of the protocol
+        2)  the suggested fee per byte (not 0 only when the pool of algod is congested) times the size
+        3)  when more transactions are pending than can be committed within the target rounds of the
+            operation, the fee per byte ranking the transaction within them times the size; the pool
+            is read once per round by a background thread, algod returns its top POOL_SAMPLE
+            transactions (highest priority first, not a uniform sample): the rank is known only if
+            the capacity of the target rounds is within them, otherwise 2) applies
+    and is capped by max_fee (but never below the minimum fee)
+    the size is the typical size of the signed transaction of the operation (see OPERATIONS); in a
+    group with pooled fees the payer pays the fee of every transaction of the group
+    """
+
+    BLOCK_CAPACITY: int = 5000                      #   transactions committed per round (estimate)
+    POOL_SAMPLE: int = 200                          #   pending transactions sampled per round
+
+    #   operation -> (target rounds, typical size (bytes) of the signed transaction)
+    OPERATIONS: dict = {
+        'grant':        (1, 400)
+    ,   'revoke':       (1, 400)
+    ,   'setkey':       (1, 400)
+    ,   'subscribe':    (2, 300)
+    ,   'unsubscribe':  (2, 300)
+    ,   'optin':        (2, 300)
+    ,   'optout':       (2, 300)
+    ,   'create':       (3, 1500)
+    ,   'payment':      (4, 300)
+    }
+    DEFAULT_OPERATION: tuple = (2, 400)
+
+    def __init__(
+        self,
+        client: algosdk.v2client.algod.AlgodClient = None,  #   None: the pool is not sampled
+        max_fee: int = 10000,                       #   cap (microAlgo) of the fee of a transaction
+        block_capacity: int = BLOCK_CAPACITY
+        ):
+        self._client = client
+        self._max_fee: int = max_fee
+        self._block_capacity: int = block_capacity
+
+        #   the state is replaced as a whole (under the lock) and read without the lock (see fee):
+        #   (suggested fee per byte, protocol minimum fee, pending transactions (total),
+        #    fee per byte of the sampled pending transactions (highest first))
+        self._lock = threading.Lock()
+        self._state: tuple = (0, 1000, 0, ())
+
+        #   the pool is sampled by a background thread (started by the first observe)
+        self._cond = threading.Condition(self._lock)
+        self._thread: threading.Thread = None
+        self._sample_due: bool = False
+        self._closed: bool = False
+
+    def observe(self, params: transaction.SuggestedParams):
+        """
+        new suggested params (params.fee is the suggested fee per byte): the pool is sampled again
+        by the background thread (the caller does not wait for algod)
+        """
+        with self._cond:
+            _, min_fee, pending, sample = self._state
+            self._state = (0 if params.flat_fee else params.fee, params.min_fee or min_fee, pending, sample)
+            if self._client is None or self._closed:
+                return
+            self._sample_due = True
+            self._cond.notify()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self.__run, name='dop-fee-sampler', daemon=True)
+                self._thread.start()
+
+    def close(self):
+        """
+        stops the background sampling of the pool
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread, self._thread = self._thread, None
+        #   the thread might be waiting for algod: do not wait for it
+        if thread is not None:
+            thread.join(timeout=1.0)
+
+    def __run(self):
+        while True:
+            with self._cond:
+                while not self._closed and not self._sample_due:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                self._sample_due = False
+            try:
+                self.observe_pool(self._client.pending_transactions(self.POOL_SAMPLE, response_format='msgpack'))
+            except Exception:
+                #   the last sample is kept
+                pass
+
+    def observe_pool(self, pending: bytes):
+        """
+        pending is the msgpack response of /v2/transactions/pending
+        """
+        response = msgpack.unpackb(pending, raw=False, strict_map_key=False)
+        sample: list = []
+        for signed_txn in response.get('top-transactions') or []:
+            size = len(msgpack.packb(signed_txn, use_bin_type=True))
+            sample.append(signed_txn.get('txn', {}).get('fee', 0) / max(size, 1))
+        sample.sort(reverse=True)
+        with self._lock:
+            fee_per_byte, min_fee, _, _ = self._state
+            self._state = (fee_per_byte, min_fee, response.get('total-transactions', len(sample)), tuple(sample))
+
+    def fee(self, op: str = '') -> int:
+        """
+        returns the fee (microAlgo) of a transaction of the operation op
+        """
+        target_rounds, size = self.OPERATIONS.get(op, self.DEFAULT_OPERATION)
+        fee_per_byte, min_fee, pending, sample = self._state
+        fee: int = max(min_fee, fee_per_byte * size)
+        capacity: int = self._block_capacity * target_rounds
+        if pending > capacity and capacity < len(sample):
+            #   the sample is the top of the pool: the transaction has to outbid the one at
+            #   position capacity (the last one committed within the target rounds)
+            fee = max(fee, int(sample[capacity] * size) + 1)
+        return min(fee, max(self._max_fee, min_fee))
+
+    def stats(self) -> dict:
+        """
+        returns the suggested fee per byte, the minimum fee, the pending transactions and the fee of every operation
+        """
+        fee_per_byte, min_fee, pending, _ = self._state
+        stats: dict = {
+            'fee_per_byte': fee_per_byte
+        ,   'min_fee': min_fee
+        ,   'pending': pending
+        }
+        stats['fees'] = {op: self.fee(op) for op in self.OPERATIONS}
+        return stats
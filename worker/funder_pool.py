@@ -0,0 +1,141 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Funder accounts sharing the funding of the new accounts (see workerAlgorand.set_starting_balance)
+"""
+import threading
+from typing import Optional
+
+import algosdk                                      #   better type support (not necessary)
+from    algosdk                     import account
+from    algosdk                     import mnemonic
+
+
+class Funder():
+    def __init__(self, funder_mnemonic: str):
+        self.mnemonic: str = funder_mnemonic
+        self.private_key: str = mnemonic.to_private_key(funder_mnemonic)
+        self.address: str = account.address_from_private_key(self.private_key)
+        self.balance: int = 0                       #   last known balance (microAlgo), decreased by the payments sent
+        self.in_flight: int = 0                     #   payments sent and not yet confirmed (or failed)
+        self.topping_up: bool = False               #   a top up from the master account is in progress
+
+
+class FunderPool():
+    """
+    the payments are routed across the funder accounts, so that they are not serialized on a
+    single sender: round robin (policy 'rr') or to the funder with the highest balance (policy 'balance')
+    the balance of a funder is read from algod when the pool is created (and after every top up or
+    failed payment) and decreased locally for every payment; the funders whose balance falls below
+    the threshold are returned by top_up_candidates (the worker tops them up from the master account)
+    """
+
+    POLICIES: tuple = ('rr', 'balance')
+
+    def __init__(
+        self,
+        client: algosdk.v2client.algod.AlgodClient,
+        funder_mnemonics: list,
+        policy: str = 'rr',
+        threshold: int = 1000000,                   #   a funder is topped up when its balance falls below threshold (microAlgo)
+        top_up: int = 10000000                      #   amount (microAlgo) of a top up
+        ):
+        """
+        raises an exception if a mnemonic is not valid or the policy is unknown
+        """
+        if policy not in self.POLICIES:
+            raise ValueError('unknown funder policy: ' + policy)
+        self._client = client
+        self._policy: str = policy
+        self._threshold: int = threshold
+        self._top_up: int = top_up
+
+        self._lock = threading.Lock()
+        self._funders: list = [Funder(funder_mnemonic) for funder_mnemonic in funder_mnemonics]
+        self._next: int = 0                         #   next funder (round robin)
+
+        for funder in self._funders:
+            self.refresh(funder)
+
+    def __len__(self) -> int:
+        return len(self._funders)
+
+    @property
+    def top_up_amount(self) -> int:
+        return self._top_up
+
+    def refresh(self, funder: Funder):
+        """
+        reads the balance of the funder from algod (the cached balance is kept if algod can not be reached)
+        """
+        try:
+            balance = self._client.account_info(funder.address).get('amount', 0)
+        except Exception:
+            return
+        with self._lock:
+            funder.balance = balance
+
+    def select(self, amount: int) -> Optional[Funder]:
+        """
+        returns the funder for a payment of amount microAlgo (fees included) - None if the pool is empty
+        the amount is reserved (until release) and the in flight count of the funder is increased
+        """
+        with self._lock:
+            if len(self._funders) == 0:
+                return None
+
+            if self._policy == 'balance':
+                funder = max(self._funders, key=lambda f: f.balance)
+            else:
+                #   round robin, skipping the funders that can not afford the payment (if any can)
+                funder = None
+                for step in range(len(self._funders)):
+                    candidate = self._funders[(self._next + step) % len(self._funders)]
+                    if candidate.balance >= amount:
+                        funder = candidate
+                        self._next = (self._next + step + 1) % len(self._funders)
+                        break
+                if funder is None:
+                    funder = max(self._funders, key=lambda f: f.balance)
+
+            funder.balance -= amount
+            funder.in_flight += 1
+            return funder
+
+    def release(self, funder: Funder, amount: int, confirmed: bool):
+        """
+        the payment (of amount microAlgo, see select) has been confirmed or has failed
+        """
+        with self._lock:
+            funder.in_flight -= 1
+            if not confirmed:
+                funder.balance += amount
+        if not confirmed:
+            self.refresh(funder)
+
+    def top_up_candidates(self) -> list:
+        """
+        returns the funders below the threshold that are not being topped up already
+        (they are marked as being topped up until topped_up is called)
+        """
+        with self._lock:
+            candidates = [f for f in self._funders if f.balance < self._threshold and not f.topping_up]
+            for funder in candidates:
+                funder.topping_up = True
+            return candidates
+
+    def topped_up(self, funder: Funder):
+        self.refresh(funder)
+        with self._lock:
+            funder.topping_up = False
+
+    def stats(self) -> list:
+        """
+        returns, for each funder, the address, the last known balance and the payments in flight
+        """
+        with self._lock:
+            return [
+                {'address': f.address, 'balance': f.balance, 'in_flight': f.in_flight}
+                for f in self._funders
+            ]
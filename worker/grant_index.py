@@ -0,0 +1,157 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Local (SQLite) index of the DOP contracts and of their subscribers, maintained by the
+block follower (see BlockFollower) and read by workerAlgorand.admin_get_grants
+"""
+import sqlite3
+import threading
+from typing import Optional
+
+
+class GrantIndex():
+    """
+    the index holds, for every DOP contract (application), its creator and linked (stateless)
+    account and, for every account opted in, the subscription and grant flags as set by the
+    contract (see dop.stateful.teal)
+    the operations of a block are applied in a single database transaction along with the
+    checkpoint (the last round applied), so the follower resumes from the checkpoint after a restart
+    """
+
+    SCHEMA: tuple = (
+        'CREATE TABLE IF NOT EXISTS checkpoint (id INTEGER PRIMARY KEY CHECK (id = 0), round INTEGER NOT NULL)'
+    ,   'CREATE TABLE IF NOT EXISTS apps ('
+        '   app_id INTEGER PRIMARY KEY, creator TEXT NOT NULL, linked TEXT NOT NULL DEFAULT \'\', round INTEGER NOT NULL)'
+    ,   'CREATE TABLE IF NOT EXISTS subscribers ('
+        '   app_id INTEGER NOT NULL, address TEXT NOT NULL,'
+        '   subscribed INTEGER NOT NULL DEFAULT 0, granted INTEGER NOT NULL DEFAULT 0, round INTEGER NOT NULL,'
+        '   PRIMARY KEY (app_id, address))'
+    )
+
+    def __init__(self, path: str):
+        """
+        path is the database file (':memory:' for an index that is not persisted)
+        raises sqlite3.Error if the database can not be opened
+        """
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            for statement in self.SCHEMA:
+                self._db.execute(statement)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def checkpoint(self) -> int:
+        """
+        returns the last round applied (0 if no round has been applied yet)
+        """
+        with self._lock:
+            row = self._db.execute('SELECT round FROM checkpoint WHERE id = 0').fetchone()
+            return row[0] if row is not None else 0
+
+    def apps(self) -> dict:
+        """
+        returns {app_id: (creator, linked)} of the indexed contracts
+        """
+        with self._lock:
+            return {
+                app_id: (creator, linked)
+                for app_id, creator, linked in self._db.execute('SELECT app_id, creator, linked FROM apps')
+            }
+
+    def creator(self, app_id: int) -> Optional[str]:
+        """
+        returns the creator of the contract, None if the contract is not indexed
+        """
+        with self._lock:
+            row = self._db.execute('SELECT creator FROM apps WHERE app_id = ?', (app_id,)).fetchone()
+            return row[0] if row is not None else None
+
+    def add_app(self, app_id: int, creator: str, linked: str = '', round: int = 0):
+        with self._lock, self._db:
+            self._db.execute(
+                'INSERT OR IGNORE INTO apps (app_id, creator, linked, round) VALUES (?, ?, ?, ?)'
+            ,   (app_id, creator, linked, round))
+
+    def grants(self, app_id: int) -> list:
+        """
+        returns the addresses of the granted accounts
+        """
+        with self._lock:
+            return [
+                row[0] for row in self._db.execute(
+                    'SELECT address FROM subscribers WHERE app_id = ? AND granted = 1 ORDER BY address', (app_id,))
+            ]
+
+    def subscribers(self, app_id: int) -> list:
+        """
+        returns {'address', 'subscribed', 'granted', 'round'} for every account opted in
+        (round is the last round the account was touched at)
+        """
+        with self._lock:
+            return [
+                {'address': address, 'subscribed': subscribed == 1, 'granted': granted == 1, 'round': round}
+                for address, subscribed, granted, round in self._db.execute(
+                    'SELECT address, subscribed, granted, round FROM subscribers WHERE app_id = ? ORDER BY address'
+                ,   (app_id,))
+            ]
+
+    def stats(self) -> dict:
+        """
+        returns the checkpoint round and the number of indexed contracts and subscribers
+        """
+        with self._lock:
+            row = self._db.execute('SELECT round FROM checkpoint WHERE id = 0').fetchone()
+            return {
+                'round': row[0] if row is not None else 0
+            ,   'apps': self._db.execute('SELECT COUNT(*) FROM apps').fetchone()[0]
+            ,   'subscribers': self._db.execute('SELECT COUNT(*) FROM subscribers').fetchone()[0]
+            }
+
+    def apply(self, round: int, operations: list):
+        """
+        applies the operations of the block round (see BlockFollower.operations) and moves the checkpoint
+        """
+        with self._lock, self._db:
+            for operation in operations:
+                self.__apply(round, operation)
+            self._db.execute('INSERT OR REPLACE INTO checkpoint (id, round) VALUES (0, ?)', (round,))
+
+    def __apply(self, round: int, operation: dict):
+        #   private method
+        op: str = operation['op']
+        app_id: int = operation['app_id']
+        sender: str = operation['sender']
+
+        if op == 'create':
+            self._db.execute(
+                'INSERT OR IGNORE INTO apps (app_id, creator, linked, round) VALUES (?, ?, ?, ?)'
+            ,   (app_id, sender, operation.get('linked', ''), round))
+        elif op == 'delete':
+            self._db.execute('DELETE FROM subscribers WHERE app_id = ?', (app_id,))
+            self._db.execute('DELETE FROM apps WHERE app_id = ?', (app_id,))
+        elif op == 'optin':
+            #   the local state is empty after the opt in
+            self._db.execute(
+                'INSERT OR REPLACE INTO subscribers (app_id, address, subscribed, granted, round) VALUES (?, ?, 0, 0, ?)'
+            ,   (app_id, sender, round))
+        elif op == 'closeout':
+            self._db.execute('DELETE FROM subscribers WHERE app_id = ? AND address = ?', (app_id, sender))
+        elif op in ('subscribe', 'unsubscribe'):
+            #   subscribe resets the grant (see op_subscribe)
+            subscribed = 1 if op == 'subscribe' else 0
+            self._db.execute(
+                'INSERT INTO subscribers (app_id, address, subscribed, granted, round) VALUES (?, ?, ?, 0, ?) '
+                'ON CONFLICT (app_id, address) DO UPDATE SET subscribed = excluded.subscribed, round = excluded.round'
+                + (', granted = 0' if op == 'subscribe' else '')
+            ,   (app_id, sender, subscribed, round))
+        elif op in ('grant', 'revoke'):
+            granted = 1 if op == 'grant' else 0
+            for address in operation.get('accounts', []):
+                self._db.execute(
+                    'INSERT INTO subscribers (app_id, address, subscribed, granted, round) VALUES (?, ?, 0, ?, ?) '
+                    'ON CONFLICT (app_id, address) DO UPDATE SET granted = excluded.granted, round = excluded.round'
+                ,   (app_id, address, granted, round))
@@ -0,0 +1,235 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Keep-alive HTTP connection pool and pooled algod/kmd clients
+the pooled clients are drop-in replacements of algosdk.v2client.algod.AlgodClient
+and algosdk.kmd.KMDClient: same methods, same responses and same exceptions
+"""
+import json
+import threading
+import http.client
+from urllib import parse
+from typing import Tuple, Optional
+
+from    algosdk                     import constants
+from    algosdk                     import error
+from    algosdk.v2client            import algod
+from    algosdk                     import kmd
+
+
+class HTTPConnectionPool():
+    """
+    pool of keep-alive HTTP/1.1 connections to a single host (http or https)
+    a connection is checked out for the duration of a request, so the pool can be
+    shared by many threads; up to pool_size idle connections are kept for reuse
+    at most max_concurrent requests are in progress at the same time (0: no limit): the
+    following ones wait for a slot (up to the request timeout), so a large pool of threads
+    does not open one connection per thread to the node
+    """
+
+    def __init__(
+        self,
+        address: str,                               #   http(s)://host:port[/prefix]
+        pool_size: int = 8,                         #   max number of idle connections kept
+        timeout: float = None,                      #   default request timeout (seconds, None: no timeout)
+        max_concurrent: int = 0                     #   max number of requests in progress (0: no limit)
+        ):
+        url = parse.urlsplit(address)
+        self._https: bool = url.scheme == 'https'
+        self._host: str = url.hostname or 'localhost'
+        self._port: int = url.port or (443 if self._https else 80)
+        self._prefix: str = url.path.rstrip('/')
+        self._pool_size: int = pool_size
+        self._timeout: Optional[float] = timeout
+        self._slots = threading.BoundedSemaphore(max_concurrent) if max_concurrent > 0 else None
+
+        self._lock = threading.Lock()
+        self._idle: list = []                       #   idle connections (LIFO: the most recent is the most likely alive)
+        self._new: int = 0                          #   connections opened
+        self._reused: int = 0                       #   requests served by an idle connection
+        self._active: int = 0                       #   requests in progress
+        self._waited: int = 0                       #   requests that waited for a slot (see max_concurrent)
+        self._closed: bool = False
+
+    def stats(self) -> dict:
+        """
+        returns the counters of the pool: connections opened, requests on reused connections, idle connections,
+        requests in progress and requests that waited for a slot
+        """
+        with self._lock:
+            return {
+                'new': self._new
+            ,   'reused': self._reused
+            ,   'idle': len(self._idle)
+            ,   'active': self._active
+            ,   'waited': self._waited
+            }
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            idle = self._idle
+            self._idle = []
+        for connection in idle:
+            connection.close()
+
+    def __checkout(self, timeout: Optional[float]) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._idle:
+                connection = self._idle.pop()
+                self._reused += 1
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+            self._new += 1
+
+        if self._https:
+            return http.client.HTTPSConnection(self._host, self._port, timeout=timeout), False
+        return http.client.HTTPConnection(self._host, self._port, timeout=timeout), False
+
+    def __checkin(self, connection: http.client.HTTPConnection):
+        with self._lock:
+            if not self._closed and len(self._idle) < self._pool_size:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        headers: dict = None,
+        body: bytes = None,
+        timeout: float = None,                      #   overrides the pool timeout for this request
+        limited: bool = True                        #   False: not counted in max_concurrent (long polls)
+        ) -> Tuple[int, bytes]:
+        """
+        returns (status code, response body)
+        exceptions (connection refused, timeout, ...) are propagated
+        """
+        timeout = timeout if timeout is not None else self._timeout
+        slots = self._slots if limited else None
+
+        if slots is not None and not slots.acquire(blocking=False):
+            with self._lock:
+                self._waited += 1
+            if not slots.acquire(timeout=timeout):
+                raise TimeoutError('no request slot available for ' + self._host)
+        with self._lock:
+            self._active += 1
+        try:
+            return self.__send(method, path, headers, body, timeout)
+        finally:
+            with self._lock:
+                self._active -= 1
+            if slots is not None:
+                slots.release()
+
+    def __send(
+        self,
+        method: str,
+        path: str,
+        headers: dict,
+        body: bytes,
+        timeout: Optional[float]
+        ) -> Tuple[int, bytes]:
+        for attempt in range(2):
+            connection, reused = self.__checkout(timeout)
+            try:
+                connection.request(method, self._prefix + path, body=body, headers=headers or {})
+                response = connection.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                #   the server closed the idle connection: retry once on a new connection
+                connection.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self.__checkin(connection)
+            return response.status, data
+
+
+class PooledAlgodClient(algod.AlgodClient):
+    """
+    AlgodClient sending its requests through an HTTPConnectionPool
+    every method accepts an optional timeout keyword (seconds)
+    the long polls (status_after_block) do not take a request slot of the pool
+    """
+
+    LONG_POLL: str = '/status/wait-for-block-after'
+
+    def __init__(self, algod_token: str, algod_address: str, pool: HTTPConnectionPool, headers: dict = None):
+        super().__init__(algod_token, algod_address, headers)
+        self._pool: HTTPConnectionPool = pool
+
+    def algod_request(self, method, requrl, params=None, data=None, headers=None, response_format="json", timeout=None):
+        header = {"User-Agent": "py-algorand-sdk"}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header.update({constants.algod_auth_header: self.algod_token})
+
+        limited: bool = not requrl.startswith(self.LONG_POLL)
+        if requrl not in constants.unversioned_paths:
+            requrl = "/v2" + requrl
+        if params:
+            requrl = requrl + "?" + parse.urlencode(params)
+
+        status, body = self._pool.request(method, requrl, header, data, timeout, limited)
+        if status >= 400:
+            message = body.decode("utf-8")
+            try:
+                message = json.loads(message)["message"]
+            except Exception:
+                pass
+            raise error.AlgodHTTPError(message, status)
+
+        if response_format == "json":
+            try:
+                return json.loads(body)
+            except Exception as e:
+                raise error.AlgodResponseError("Failed to parse JSON response from algod") from e
+        return body
+
+
+class PooledKMDClient(kmd.KMDClient):
+    """
+    KMDClient sending its requests through an HTTPConnectionPool
+    """
+
+    def __init__(self, kmd_token: str, kmd_address: str, pool: HTTPConnectionPool):
+        super().__init__(kmd_token, kmd_address)
+        self._pool: HTTPConnectionPool = pool
+
+    def kmd_request(self, method, requrl, params=None, data=None, timeout=None):
+        if requrl in constants.no_auth:
+            header = {}
+        else:
+            header = {constants.kmd_auth_header: self.kmd_token}
+
+        if requrl not in constants.unversioned_paths:
+            requrl = "/v1" + requrl
+        if params:
+            requrl = requrl + "?" + parse.urlencode(params)
+        if data:
+            data = json.dumps(data, indent=2).encode("utf-8")
+
+        status, body = self._pool.request(method, requrl, header, data, timeout)
+        text = body.decode("utf-8")
+        if status >= 400:
+            try:
+                raise error.KMDHTTPError(json.loads(text)["message"])
+            except (ValueError, KeyError):
+                raise error.KMDHTTPError(text)
+        return json.loads(text)
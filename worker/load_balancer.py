@@ -0,0 +1,287 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Health aware load balancing of the requests across many algod (or kmd) nodes
+the balanced clients are drop-in replacements of algosdk.v2client.algod.AlgodClient
+and algosdk.kmd.KMDClient (see http_pool)
+"""
+import time
+import random
+import threading
+from typing import Callable, Optional
+
+from    algosdk                     import error
+from    algosdk.v2client            import algod
+from    algosdk                     import kmd
+
+from http_pool import HTTPConnectionPool
+
+
+class Endpoint():
+    def __init__(self, address: str, client, pool: HTTPConnectionPool):
+        self.address: str = address
+        self.client = client                        #   PooledAlgodClient or PooledKMDClient
+        self.pool: HTTPConnectionPool = pool
+        self.latency: float = 0.0                   #   moving average of the response time (seconds, 0: not measured yet)
+        self.outstanding: int = 0                   #   requests in progress
+        self.failures: int = 0                      #   consecutive failures
+        self.ejected: bool = False
+        self.last_round: int = 0                    #   last round reported by the node (health probe)
+        self.requests: int = 0
+        self.errors: int = 0
+
+
+class EndpointBalancer():
+    """
+    reads are spread across the healthy endpoints with a probability inversely proportional to
+    their response time, writes go to the healthy endpoint with the least outstanding requests;
+    kmd requests stick to a single endpoint (the wallet handles are local to a node) and move to
+    the next healthy endpoint when it fails (see sticky)
+    an endpoint is ejected after max_failures consecutive failures or when its last round lags
+    more than max_lag rounds behind the most advanced endpoint; a background thread probes all
+    the endpoints every probe_interval seconds and re-admits the healthy ones
+    if every endpoint is ejected, all of them are used (the requests never stall on the balancer)
+    the reads of a block go to the endpoints known to have committed its round (last round
+    reported by the probes and by the status responses), if any
+    """
+
+    LATENCY_ALPHA: float = 0.2                      #   weight of the last sample in the moving average
+
+    def __init__(
+        self,
+        endpoints: list,
+        max_failures: int = 3,
+        max_lag: int = 4,                           #   0: the lag is not checked (kmd)
+        probe_interval: float = 5.0,                #   seconds
+        probe: Callable[[Endpoint], int] = None     #   returns the last round of the endpoint (raises if not healthy)
+        ):
+        self._endpoints: list = endpoints
+        self._max_failures: int = max(1, max_failures)
+        self._max_lag: int = max_lag
+        self._probe_interval: float = probe_interval
+        self._probe = probe
+
+        self._lock = threading.Lock()
+        self._sticky: int = 0                       #   index of the sticky endpoint
+        self._stop = threading.Event()
+        self._thread: threading.Thread = None
+
+    @property
+    def endpoints(self) -> list:
+        return self._endpoints
+
+    def start(self):
+        if self._probe is None or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.__run, name='dop-endpoint-probe', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def close(self):
+        self.stop()
+        for endpoint in self._endpoints:
+            endpoint.pool.close()
+
+    def __candidates(self, exclude: tuple) -> list:
+        candidates = [e for e in self._endpoints if not e.ejected and e not in exclude]
+        if not candidates:
+            candidates = [e for e in self._endpoints if e not in exclude] or self._endpoints
+        return candidates
+
+    def select(self, write: bool, exclude: tuple = (), min_round: int = 0) -> Endpoint:
+        """
+        returns the endpoint for a request (the endpoints in exclude are used only if there is no other)
+        min_round: the request reads the block of the round (see observe_round)
+        """
+        with self._lock:
+            candidates = self.__candidates(exclude)
+            if min_round > 0:
+                candidates = [e for e in candidates if e.last_round >= min_round] or candidates
+            if write:
+                return min(candidates, key=lambda e: (e.outstanding, e.latency))
+            measured = [e.latency for e in candidates if e.latency > 0]
+            default = min(measured) if measured else 1.0
+            #   the endpoints not measured yet are given the best latency (so they get measured)
+            weights = [1.0 / (e.latency if e.latency > 0 else default) for e in candidates]
+            return random.choices(candidates, weights)[0]
+
+    def sticky(self) -> Endpoint:
+        """
+        returns the sticky endpoint (moved to the next healthy endpoint if ejected)
+        """
+        with self._lock:
+            endpoint = self._endpoints[self._sticky]
+            if endpoint.ejected:
+                self.__move_sticky()
+            return self._endpoints[self._sticky]
+
+    def __move_sticky(self):
+        for step in range(1, len(self._endpoints) + 1):
+            index = (self._sticky + step) % len(self._endpoints)
+            if not self._endpoints[index].ejected:
+                self._sticky = index
+                return
+        self._sticky = (self._sticky + 1) % len(self._endpoints)
+
+    def fail_over(self, endpoint: Endpoint):
+        """
+        the sticky endpoint failed: the following requests go to the next healthy endpoint
+        """
+        with self._lock:
+            if self._endpoints[self._sticky] is endpoint:
+                self.__move_sticky()
+
+    def observe_round(self, endpoint: Endpoint, round_number: int):
+        """
+        the endpoint reported round_number as its last round (for instance in a status response)
+        """
+        with self._lock:
+            endpoint.last_round = max(endpoint.last_round, round_number)
+
+    def begin(self, endpoint: Endpoint):
+        with self._lock:
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+
+    def end(self, endpoint: Endpoint, seconds: Optional[float], ok: bool):
+        """
+        the request is completed: seconds is its response time (None: not significant, for
+        instance a long poll), ok is False if the endpoint failed (not reachable, 5xx, ...)
+        """
+        with self._lock:
+            endpoint.outstanding -= 1
+            if ok:
+                endpoint.failures = 0
+                if seconds is not None:
+                    endpoint.latency = seconds if endpoint.latency == 0 else \
+                        (1 - self.LATENCY_ALPHA) * endpoint.latency + self.LATENCY_ALPHA * seconds
+                return
+            endpoint.failures += 1
+            endpoint.errors += 1
+            if endpoint.failures >= self._max_failures:
+                endpoint.ejected = True
+
+    def stats(self) -> list:
+        """
+        returns, for each endpoint, address, state and counters
+        """
+        with self._lock:
+            return [
+                {
+                    'address': e.address
+                ,   'ejected': e.ejected
+                ,   'latency': e.latency
+                ,   'outstanding': e.outstanding
+                ,   'last_round': e.last_round
+                ,   'requests': e.requests
+                ,   'errors': e.errors
+                }
+                for e in self._endpoints
+            ]
+
+    def __run(self):
+        while not self._stop.wait(self._probe_interval):
+            self.probe_all()
+
+    def probe_all(self):
+        """
+        probes every endpoint and updates the ejected flags (see the class description)
+        """
+        for endpoint in self._endpoints:
+            try:
+                last_round = self._probe(endpoint)
+                with self._lock:
+                    endpoint.last_round = max(endpoint.last_round, last_round)
+                    endpoint.failures = 0
+            except Exception:
+                with self._lock:
+                    endpoint.failures = max(endpoint.failures + 1, self._max_failures)
+
+        with self._lock:
+            top_round = max(e.last_round for e in self._endpoints)
+            for endpoint in self._endpoints:
+                lagging = self._max_lag > 0 and top_round - endpoint.last_round > self._max_lag
+                endpoint.ejected = endpoint.failures >= self._max_failures or lagging
+
+
+class BalancedAlgodClient(algod.AlgodClient):
+    """
+    AlgodClient sending each request to an endpoint selected by an EndpointBalancer
+    (GET: read, any other method: write); a request failing on an endpoint (not reachable, 5xx)
+    is retried once on another endpoint - sending again a signed transaction is harmless
+    """
+
+    LONG_POLL: str = '/status/wait-for-block-after'  #   response time not significant
+    BLOCKS: str = '/blocks/'                        #   the block of a round: read from a node having it
+
+    def __init__(self, algod_token: str, algod_address: str, balancer: EndpointBalancer, headers: dict = None):
+        super().__init__(algod_token, algod_address, headers)
+        self._balancer: EndpointBalancer = balancer
+
+    def algod_request(self, method, requrl, params=None, data=None, headers=None, response_format="json", timeout=None):
+        write: bool = method != 'GET'
+        long_poll: bool = requrl.startswith(self.LONG_POLL)
+        block_round: int = 0
+        if requrl.startswith(self.BLOCKS):
+            round_text = requrl[len(self.BLOCKS):].split('/')[0]
+            block_round = int(round_text) if round_text.isdigit() else 0
+        tried: tuple = ()
+        while True:
+            endpoint = self._balancer.select(write, tried, block_round)
+            self._balancer.begin(endpoint)
+            started = time.monotonic()
+            try:
+                result = endpoint.client.algod_request(method, requrl, params, data, headers, response_format, timeout)
+            except error.AlgodHTTPError as e:
+                #   the node answered: only a server error counts as a failure of the endpoint
+                failed = (e.code or 0) >= 500
+                self._balancer.end(endpoint, None if long_poll else time.monotonic() - started, not failed)
+                if not failed or len(tried) > 0 or len(self._balancer.endpoints) < 2:
+                    raise
+                tried = (endpoint,)
+                continue
+            except Exception:
+                self._balancer.end(endpoint, None, False)
+                if len(tried) > 0 or len(self._balancer.endpoints) < 2:
+                    raise
+                tried = (endpoint,)
+                continue
+            self._balancer.end(endpoint, None if long_poll else time.monotonic() - started, True)
+            if isinstance(result, dict) and isinstance(result.get('last-round'), int):
+                self._balancer.observe_round(endpoint, result['last-round'])
+            return result
+
+
+class BalancedKMDClient(kmd.KMDClient):
+    """
+    KMDClient sending the requests to the sticky endpoint of an EndpointBalancer
+    if the endpoint is not reachable the balancer fails over and a KMDHTTPError is raised,
+    so that the wallet session initializes a new handle on the next endpoint (see WalletSession)
+    """
+
+    def __init__(self, kmd_token: str, kmd_address: str, balancer: EndpointBalancer):
+        super().__init__(kmd_token, kmd_address)
+        self._balancer: EndpointBalancer = balancer
+
+    def kmd_request(self, method, requrl, params=None, data=None, timeout=None):
+        endpoint = self._balancer.sticky()
+        self._balancer.begin(endpoint)
+        started = time.monotonic()
+        try:
+            result = endpoint.client.kmd_request(method, requrl, params, data, timeout)
+        except error.KMDHTTPError:
+            self._balancer.end(endpoint, time.monotonic() - started, True)
+            raise
+        except Exception as e:
+            self._balancer.end(endpoint, None, False)
+            self._balancer.fail_over(endpoint)
+            raise error.KMDHTTPError('kmd endpoint not reachable: ' + endpoint.address) from e
+        self._balancer.end(endpoint, time.monotonic() - started, True)
+        return result
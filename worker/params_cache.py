@@ -0,0 +1,98 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Round aware cache of the suggested transaction parameters (see /v2/transactions/params)
+"""
+import copy
+import time
+import threading
+
+import algosdk                                      #   better type support (not necessary)
+from    algosdk.future              import transaction
+
+from fee_policy import FeePolicy
+
+
+class SuggestedParamsProvider():
+    """
+    the suggested params are fetched from algod at most once per round (when a new
+    round is notified) or when they are older than ttl seconds
+    every caller receives its own copy, with the flat fee already applied (the fee of the
+    operation if a fee policy is provided, see FeePolicy)
+    the genesis hash and the genesis id are kept for the life of the connection
+    """
+
+    def __init__(
+        self,
+        client: algosdk.v2client.algod.AlgodClient,
+        ttl: float = 5.0,                           #   max age (seconds) of the cached params
+        fee: int = 1000,                            #   flat fee (microAlgo) applied to the params
+        fee_policy: FeePolicy = None                #   if provided, computes the fee of each operation
+        ):
+        self._client = client
+        self._ttl: float = ttl
+        self._fee: int = fee
+        self._fee_policy: FeePolicy = fee_policy
+        self._lock = threading.Lock()
+
+        self._params: transaction.SuggestedParams = None
+        self._fetched_at: float = 0.0
+        self._round: int = 0                        #   last round notified (or seen in the params)
+
+        self._genesis_hash: str = ''
+        self._genesis_id: str = ''
+
+    @property
+    def genesis_hash(self) -> str:
+        return self._genesis_hash
+
+    @property
+    def genesis_id(self) -> str:
+        return self._genesis_id
+
+    def notify_round(self, round_number: int):
+        """
+        a new round has been observed (for instance while waiting for a confirmation):
+        the cached params are refreshed the next time they are requested
+        """
+        if round_number > self._round:
+            self._round = round_number
+
+    def invalidate(self):
+        self._fetched_at = 0.0
+
+    def __stale(self) -> bool:
+        if self._params is None:
+            return True
+        if self._round > self._params.first:
+            return True
+        return (time.monotonic() - self._fetched_at) >= self._ttl
+
+    def params(self, op: str = '') -> transaction.SuggestedParams:
+        """
+        returns a copy of the suggested params, with the flat fee of the operation op applied
+        (see FeePolicy.OPERATIONS)
+        exceptions raised by the client are propagated
+        """
+        if self.__stale():
+            with self._lock:
+                #   another thread may have refreshed the params in the meanwhile
+                if self.__stale():
+                    params = self._client.suggested_params()
+                    if self._genesis_hash == '':
+                        self._genesis_hash = params.gh
+                        self._genesis_id = params.gen
+                    self._params = params
+                    self._fetched_at = time.monotonic()
+                    if params.first > self._round:
+                        self._round = params.first
+                    if self._fee_policy is not None:
+                        self._fee_policy.observe(params)
+
+        params = copy.copy(self._params)
+        params.gh = self._genesis_hash
+        params.gen = self._genesis_id
+        params.flat_fee = True
+        params.fee = self._fee if self._fee_policy is None else self._fee_policy.fee(op)
+        return params
@@ -0,0 +1,248 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Round versioned caches of the local state of the subscribers (see workerAlgorand.get_balance),
+of the global state of the contracts (see workerAlgorand.get_contract_state) and of the
+account information (see workerAlgorand.get_wallet_balances)
+"""
+import base64
+import threading
+import concurrent.futures
+from typing import Callable, Optional
+
+import algosdk                                      #   better type support (not necessary)
+from    algosdk                     import encoding
+
+
+class LocalStateCache():
+    """
+    the local state of an account for an application is read from algod once and served
+    from memory, keyed by (address, application index)
+    an entry is dropped when a transaction of the worker touching the pair is confirmed
+    (see invalidate) or when it is older than max_age rounds (the changes made by other
+    parties are therefore visible within max_age rounds)
+    """
+
+    def __init__(
+        self,
+        client: algosdk.v2client.algod.AlgodClient,
+        max_age: int = 4,                           #   max age (rounds) of an entry
+        current_round: Callable[[], int] = None,    #   returns the (estimated) current round
+        on_round: Callable[[int], None] = None      #   called with the round of every algod response
+        ):
+        self._client = client
+        self._max_age: int = max_age
+        self._current_round = current_round
+        self._on_round = on_round
+
+        self._lock = threading.Lock()
+        self._entries: dict = {}                    #   (address, app_id) -> (round, local state or None)
+        self._invalidations: int = 0                #   a read started before an invalidation is not cached
+
+    @staticmethod
+    def decode(key_values: list, address_keys: tuple = ()) -> dict:
+        """
+        decodes the key-value list returned by algod: base64 keys, uint values as int and
+        byte values as str (or base64 str if they are not valid utf-8)
+        the 32 bytes values of the address_keys are returned as addresses
+        """
+        state: dict = {}
+        for item in key_values or []:
+            key = base64.b64decode(item['key']).decode('utf-8', errors='replace')
+            value = item.get('value', {})
+            if value.get('type') == 2:
+                state[key] = value.get('uint', 0)
+                continue
+            raw = base64.b64decode(value.get('bytes', ''))
+            if key in address_keys and len(raw) == 32:
+                state[key] = encoding.encode_address(raw)
+                continue
+            try:
+                state[key] = raw.decode('utf-8')
+            except UnicodeDecodeError:
+                state[key] = value.get('bytes', '')
+        return state
+
+    def invalidate(self, address: str, app_id: int):
+        with self._lock:
+            self._entries.pop((address, app_id), None)
+            self._invalidations += 1
+
+    def get(self, address: str, app_id: int) -> Optional[dict]:
+        """
+        returns the decoded local state of address for app_id (None if address is not opted in)
+        exceptions raised by the client are propagated
+        """
+        key = (address, app_id)
+        entry = self._entries.get(key)
+        if entry is not None:
+            current_round = self._current_round() if self._current_round is not None else 0
+            if current_round == 0 or current_round - entry[0] <= self._max_age:
+                return entry[1]
+
+        invalidations = self._invalidations
+        response_round, state = self.__read(address, app_id)
+        if self._on_round is not None and response_round > 0:
+            self._on_round(response_round)
+        with self._lock:
+            if invalidations == self._invalidations:
+                self._entries[key] = (response_round, state)
+        return state
+
+    def __read(self, address: str, app_id: int):
+        try:
+            response = self._client.account_application_info(address, app_id)
+            local_state = response.get('app-local-state')
+            state = None if local_state is None else self.decode(local_state.get('key-value'))
+            return response.get('round', 0), state
+        except algosdk.error.AlgodHTTPError:
+            #   not opted in - or the node does not implement the endpoint: the account information is used
+            pass
+
+        response = self._client.account_info(address)
+        for local_state in response.get('apps-local-state', []):
+            if local_state.get('id') == app_id:
+                return response.get('round', 0), self.decode(local_state.get('key-value'))
+        return response.get('round', 0), None
+
+
+class GlobalStateCache():
+    """
+    the global state of a contract (see app_creation and op_setkey in dop.stateful.teal) is
+    read from algod once per round and served from memory; an entry is dropped when the
+    worker sends a setkey to the contract (see invalidate)
+    """
+
+    ADDRESS_KEYS: tuple = ('creator', 'linked')     #   global byte values holding a raw address
+
+    def __init__(
+        self,
+        client: algosdk.v2client.algod.AlgodClient,
+        current_round: Callable[[], int] = None,    #   returns the (estimated) current round
+        on_round: Callable[[int], None] = None      #   called with the round of every algod response
+        ):
+        self._client = client
+        self._current_round = current_round
+        self._on_round = on_round
+
+        self._lock = threading.Lock()
+        self._entries: dict = {}                    #   app_id -> (round, global state)
+        self._invalidations: int = 0
+
+    def invalidate(self, app_id: int):
+        with self._lock:
+            self._entries.pop(app_id, None)
+            self._invalidations += 1
+
+    def get(self, app_id: int) -> dict:
+        """
+        returns the decoded global state of the contract
+        exceptions raised by the client are propagated (the contract does not exist, ...)
+        """
+        entry = self._entries.get(app_id)
+        if entry is not None:
+            current_round = self._current_round() if self._current_round is not None else 0
+            if current_round != 0 and current_round <= entry[0]:
+                return entry[1]
+
+        invalidations = self._invalidations
+        current_round = self._current_round() if self._current_round is not None else 0
+        response = self._client.application_info(app_id)
+        state = LocalStateCache.decode(response.get('params', {}).get('global-state'), self.ADDRESS_KEYS)
+        #   application_info does not return the round: the state is valid for the current round
+        if self._on_round is not None and response.get('round', 0) > 0:
+            self._on_round(response['round'])
+        with self._lock:
+            if invalidations == self._invalidations:
+                self._entries[app_id] = (max(current_round, response.get('round', 0)), state)
+        return state
+
+
+class AccountCache():
+    """
+    the account information (see summary) is read from algod at most once per round: the lookups
+    are run by a bounded pool of threads and concurrent lookups of the same address share a single
+    request; an entry is dropped when a transaction of the worker sending from (or paying to) the
+    account is confirmed (see invalidate)
+    """
+
+    def __init__(
+        self,
+        client: algosdk.v2client.algod.AlgodClient,
+        max_workers: int = 8,                       #   max number of concurrent requests
+        current_round: Callable[[], int] = None,    #   returns the (estimated) current round
+        on_round: Callable[[int], None] = None      #   called with the round of every algod response
+        ):
+        self._client = client
+        self._current_round = current_round
+        self._on_round = on_round
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix='dop-account-cache')
+
+        self._lock = threading.Lock()
+        self._entries: dict = {}                    #   address -> (round, summary)
+        self._in_flight: dict = {}                  #   address -> (Future, invalidations when the request started)
+        self._invalidations: int = 0
+
+    @staticmethod
+    def summary(account_info: dict) -> dict:
+        """
+        returns amount, min balance (microAlgo) and ids of the applications the account has opted in
+        """
+        return {
+            'amount': account_info.get('amount', 0)
+        ,   'min-balance': account_info.get('min-balance', 0)
+        ,   'apps': [app.get('id') for app in account_info.get('apps-local-state', [])]
+        }
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    def invalidate(self, address: str):
+        with self._lock:
+            self._entries.pop(address, None)
+            self._invalidations += 1
+
+    def lookup(self, address: str) -> concurrent.futures.Future:
+        """
+        returns a Future resolved with the summary of the account (or failed with the exception
+        raised by the client)
+        """
+        #   the entries are replaced, never changed: a hit does not take the lock
+        entry = self._entries.get(address)
+        if entry is not None:
+            current_round = self._current_round() if self._current_round is not None else 0
+            if current_round != 0 and current_round <= entry[0]:
+                future = concurrent.futures.Future()
+                future.set_result(entry[1])
+                return future
+
+        with self._lock:
+            #   a request started before an invalidation is not shared
+            in_flight = self._in_flight.get(address)
+            if in_flight is not None and in_flight[1] == self._invalidations:
+                return in_flight[0]
+            future = self._executor.submit(self.__read, address, self._invalidations)
+            self._in_flight[address] = (future, self._invalidations)
+            return future
+
+    def get(self, address: str) -> dict:
+        return self.lookup(address).result()
+
+    def __read(self, address: str, invalidations: int) -> dict:
+        try:
+            current_round = self._current_round() if self._current_round is not None else 0
+            account_info = self._client.account_info(address)
+            account_summary = self.summary(account_info)
+            if self._on_round is not None and account_info.get('round', 0) > 0:
+                self._on_round(account_info['round'])
+            with self._lock:
+                if invalidations == self._invalidations:
+                    self._entries[address] = (max(current_round, account_info.get('round', 0)), account_summary)
+            return account_summary
+        finally:
+            with self._lock:
+                in_flight = self._in_flight.get(address)
+                if in_flight is not None and in_flight[1] == invalidations:
+                    del self._in_flight[address]
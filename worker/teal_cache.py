@@ -0,0 +1,272 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Content addressed cache of the TEAL compile results (see /v2/teal/compile)
+"""
+import os
+import json
+import hashlib
+import base64
+import threading
+from typing import Optional
+
+import algosdk                                      #   better type support (not necessary)
+from    algosdk                     import encoding
+from    algosdk                     import logic
+
+
+class TealCompileCache():
+    """
+    the compile result of a TEAL source is cached in memory and (if a cache folder
+    is provided) persisted on disk, one json file per entry
+    an entry is keyed by the sha256 of the algod build and of the TEAL source:
+    the same source is therefore compiled once per process - or once per node upgrade
+    if the cache folder is kept between restarts
+    NOTE:   the compile endpoint requires EnableDeveloperAPI (node configuration file)
+    """
+
+    def __init__(self, cache_folder: str = ''):
+        self._folder: str = cache_folder            #   empty string: memory only
+        self._lock = threading.Lock()
+        self._compiled: dict = {}                   #   key -> compile response {'hash':..., 'result':...}
+        self._sources: dict = {}                    #   path -> (mtime, source)
+        self._templates: dict = {}                  #   key -> StatelessTemplate (None if the template can not be patched)
+        self._algod_build: str = ''
+
+        if self._folder != '':
+            try:
+                os.makedirs(self._folder, exist_ok=True)
+            except Exception:
+                #   the cache folder can not be created: memory only
+                self._folder = ''
+
+    def algod_build(self, client: algosdk.v2client.algod.AlgodClient) -> str:
+        """
+        returns the build (version) of the algod node - retrieved once
+        """
+        if self._algod_build != '':
+            return self._algod_build
+
+        self.set_algod_build(client.versions())
+        return self._algod_build
+
+    def set_algod_build(self, versions: dict):
+        """
+        sets the build of the algod node from the response of /versions
+        (for the callers that retrieve it on their own, see AsyncWorkerAlgorand)
+        """
+        build: dict = versions.get('build', {})
+        self._algod_build = '{}.{}.{}-{}'.format(
+            build.get('major', 0),
+            build.get('minor', 0),
+            build.get('build_number', 0),
+            build.get('commit_hash', ''))
+
+    def source(self, path: str) -> Optional[str]:
+        """
+        returns the content of the TEAL source file (None if the file can not be read)
+        the file is read again only if its modification time changes
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except Exception:
+            return None
+
+        cached = self._sources.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                teal_source = f.read()
+        except Exception:
+            return None
+
+        self._sources[path] = (mtime, teal_source)
+        return teal_source
+
+    def key(self, client: algosdk.v2client.algod.AlgodClient, teal_source: str) -> str:
+        h = hashlib.sha256()
+        h.update(self.algod_build(client).encode('utf-8'))
+        h.update(b'\x00')
+        h.update(teal_source.encode('utf-8'))
+        return h.hexdigest()
+
+    def compile(self, client: algosdk.v2client.algod.AlgodClient, teal_source: str) -> dict:
+        """
+        returns the compile response ({'hash': program address, 'result': base64 bytecode})
+        algod is called only on a cache miss; exceptions raised by the client are propagated
+        """
+        key = self.key(client, teal_source)
+
+        compile_response = self.cached(key)
+        if compile_response is None:
+            compile_response = self.put(key, client.compile(teal_source))
+        return compile_response
+
+    def cached(self, key: str) -> Optional[dict]:
+        """
+        returns the compile response cached (in memory or on disk) for key, None if not cached
+        """
+        compile_response = self._compiled.get(key)
+        if compile_response is not None:
+            return compile_response
+
+        compile_response = self.__load(key)
+        if compile_response is not None:
+            with self._lock:
+                self._compiled[key] = compile_response
+        return compile_response
+
+    def put(self, key: str, response: dict) -> dict:
+        """
+        caches the compile response returned by algod for key
+        """
+        compile_response = {'hash': response['hash'], 'result': response['result']}
+        self.__store(key, compile_response)
+        with self._lock:
+            self._compiled[key] = compile_response
+        return compile_response
+
+    def template(
+        self,
+        client: algosdk.v2client.algod.AlgodClient,
+        teal_template: str,
+        macro: str
+        ) -> Optional['StatelessTemplate']:
+        """
+        returns the StatelessTemplate for the teal template (prepared once per template source)
+        returns None if the template can not be patched (the caller has to compile each instance)
+        """
+        key = self.key(client, macro + '\x00' + teal_template)
+        if key in self._templates:
+            return self._templates[key]
+
+        stateless_template = StatelessTemplate(teal_template, macro)
+        if not stateless_template.prepare(client, self):
+            stateless_template = None
+
+        with self._lock:
+            self._templates[key] = stateless_template
+        return stateless_template
+
+    def __path(self, key: str) -> str:
+        return os.path.join(self._folder, key + '.json')
+
+    def __load(self, key: str) -> Optional[dict]:
+        if self._folder == '':
+            return None
+        try:
+            with open(self.__path(key), 'r', encoding='utf-8') as f:
+                compile_response = json.load(f)
+            if 'hash' in compile_response and 'result' in compile_response:
+                return compile_response
+        except Exception:
+            pass
+        return None
+
+    def __store(self, key: str, compile_response: dict):
+        if self._folder == '':
+            return
+        #   write to a temporary file and rename, so that concurrent processes
+        #   sharing the folder never read a partially written entry
+        tmp_path = self.__path(key) + '.' + str(os.getpid()) + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(compile_response, f)
+            os.replace(tmp_path, self.__path(key))
+        except Exception:
+            #   the disk cache is best effort
+            try:
+                os.remove(tmp_path)
+            except Exception:
+                pass
+
+
+class StatelessTemplate():
+    """
+    the stateless smart contract is generated from a template by replacing a macro with
+    an address; as the template is fixed, the bytecode of two instances differs only in
+    the 32 bytes of the embedded address
+    the template is compiled (once) with a placeholder address: the bytecode of an instance
+    is then obtained by patching the public key of the address at the placeholder offset,
+    and the address of the instance is computed locally as sha512/256("Program" + bytecode)
+    """
+
+    def __init__(self, teal_template: str, macro: str):
+        self._teal_template: str = teal_template
+        self._macro: str = macro
+        self._program: bytes = b''              #   bytecode compiled with the placeholder address
+        self._offset: int = -1                  #   offset of the placeholder public key in the bytecode
+
+    @staticmethod
+    def placeholder(index: int) -> bytes:
+        #   an arbitrary (but valid) public key, unlikely to collide with any other constant
+        return hashlib.sha256('dop.account.placeholder.{}'.format(index).encode('utf-8')).digest()
+
+    def prepare(self, client: algosdk.v2client.algod.AlgodClient, compile_cache: TealCompileCache) -> bool:
+        """
+        compiles the template with two different placeholder addresses and checks, bit for bit
+        against algod, that patching the first bytecode gives the second bytecode and its address
+        returns False if the template can not be patched (macro not found, not a single occurrence, ...)
+        """
+        if self._macro not in self._teal_template:
+            return False
+
+        try:
+            compiled_a = compile_cache.compile(client, self.placeholder_source(0))
+            compiled_b = compile_cache.compile(client, self.placeholder_source(1))
+        except Exception:
+            return False
+
+        return self.check(compiled_a, compiled_b)
+
+    def placeholder_source(self, index: int) -> str:
+        """
+        returns the teal source of the instance embedding the placeholder address index
+        """
+        return self._teal_template.replace(self._macro, encoding.encode_address(self.placeholder(index)))
+
+    def check(self, compiled_a: dict, compiled_b: dict) -> bool:
+        """
+        checks the compile responses of placeholder_source(0) and placeholder_source(1)
+        and sets the offset of the placeholder (see prepare)
+        """
+        if self._macro not in self._teal_template:
+            return False
+
+        pk_a = self.placeholder(0)
+        pk_b = self.placeholder(1)
+
+        program_a = base64.b64decode(compiled_a['result'])
+        program_b = base64.b64decode(compiled_b['result'])
+
+        offset = program_a.find(pk_a)
+        if offset < 0 or program_a.find(pk_a, offset + 1) >= 0:
+            #   the placeholder must appear exactly once
+            return False
+
+        self._program = program_a
+        self._offset = offset
+
+        #   the locally computed instances must match algod output
+        if logic.address(program_a) != compiled_a['hash']:
+            return False
+        if self.program(pk_b) != program_b or logic.address(program_b) != compiled_b['hash']:
+            self._offset = -1
+            return False
+
+        return True
+
+    def program(self, public_key: bytes) -> bytes:
+        """
+        returns the bytecode of the instance embedding public_key
+        """
+        return self._program[:self._offset] + public_key + self._program[self._offset + 32:]
+
+    def address(self, address: str) -> str:
+        """
+        returns the address of the instance embedding address (raises an exception if address is not valid)
+        """
+        return logic.address(self.program(encoding.decode_address(address)))
@@ -0,0 +1,78 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Unit tests of AccountPool
+python -m unittest test_account_pool     (from the worker folder)
+"""
+
+import time
+import itertools
+import unittest
+
+from account_pool import AccountPool
+
+
+class AccountPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.counter = itertools.count()
+
+    def generate(self):
+        index = next(self.counter)
+        return ('ADDRESS{}'.format(index), 'mnemonic {}'.format(index))
+
+    def wait_depth(self, pool: AccountPool, depth: int):
+        deadline = time.monotonic() + 5.0
+        while pool.depth() != depth and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_default_watermarks_fill_at_start(self):
+        #   apmin=0 (default), apmax=5: the pool is filled when it starts
+        pool = AccountPool(self.generate, 0, 5)
+        pool.start()
+        try:
+            self.wait_depth(pool, 5)
+            self.assertEqual(pool.stats()['depth'], 5)
+            self.assertEqual(pool.stats()['generated'], 5)
+        finally:
+            pool.stop()
+
+    def test_refill_when_empty(self):
+        pool = AccountPool(self.generate, 0, 2)
+        pool.start()
+        try:
+            self.wait_depth(pool, 2)
+            self.assertIsNotNone(pool.pop())
+            time.sleep(0.1)
+            #   one account left: above the low watermark, not refilled
+            self.assertEqual(pool.depth(), 1)
+            self.assertIsNotNone(pool.pop())
+            self.wait_depth(pool, 2)
+            self.assertEqual(pool.stats()['generated'], 4)
+        finally:
+            pool.stop()
+
+    def test_refill_below_low_watermark(self):
+        pool = AccountPool(self.generate, 3, 4)
+        pool.start()
+        try:
+            self.wait_depth(pool, 4)
+            pool.pop()
+            pool.pop()
+            self.wait_depth(pool, 4)
+            self.assertEqual(pool.stats()['hits'], 2)
+            self.assertEqual(pool.stats()['generated'], 6)
+        finally:
+            pool.stop()
+
+    def test_not_enabled(self):
+        pool = AccountPool(self.generate, 0, 0)
+        pool.start()
+        self.assertIsNone(pool.pop())
+        self.assertEqual(pool.stats()['misses'], 1)
+        pool.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
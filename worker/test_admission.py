@@ -0,0 +1,166 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Unit tests of AdmissionController and AsyncAdmission
+python -m unittest test_admission     (from the worker folder)
+"""
+
+import time
+import asyncio
+import threading
+import unittest
+
+from admission import AdmissionController
+from admission import AdmissionRejected
+from admission import AsyncAdmission
+
+
+class FastController(AdmissionController):
+    COOLDOWN: float = 0.05
+
+
+class AdmissionControllerTest(unittest.TestCase):
+
+    def test_additive_increase(self):
+        controller = AdmissionController(window=4, max_window=6)
+        #   one transaction per window of confirmed transactions
+        controller.acquire(4)
+        controller.release(4, True, rounds=1)
+        self.assertEqual(controller.stats()['window'], 5)
+        for _ in range(10):
+            controller.acquire(1)
+            controller.release(1, True, rounds=1)
+        self.assertEqual(controller.stats()['window'], 6)
+
+    def test_multiplicative_decrease(self):
+        controller = FastController(window=64)
+        controller.acquire(8)
+        controller.release(4, False, congested=True)
+        self.assertEqual(controller.stats()['window'], 32)
+        #   one congestion event: a single decrease within the cooldown
+        controller.release(4, False, congested=True)
+        self.assertEqual(controller.stats()['window'], 32)
+        time.sleep(FastController.COOLDOWN)
+        controller.acquire(1)
+        controller.release(1, False, congested=True)
+        self.assertEqual(controller.stats()['window'], 16)
+        self.assertEqual(controller.stats()['decreases'], 2)
+        self.assertEqual(controller.stats()['in_flight'], 0)
+
+    def test_delay_decrease(self):
+        controller = FastController(window=10)
+        controller.acquire(1)
+        controller.release(1, True, rounds=AdmissionController.TARGET_ROUNDS + 1)
+        self.assertEqual(controller.stats()['window'], 8)
+
+    def test_min_window(self):
+        controller = FastController(window=1)
+        controller.acquire(1)
+        controller.release(1, False, congested=True)
+        self.assertEqual(controller.stats()['window'], 1)
+        #   a request larger than the window is admitted when nothing is in flight
+        self.assertTrue(controller.try_acquire(16))
+        self.assertFalse(controller.try_acquire(1))
+
+    def test_congestion(self):
+        self.assertTrue(AdmissionController.congestion(Exception('TransactionPool.Remember: transaction pool is full')))
+        self.assertTrue(AdmissionController.congestion(Exception('pending tx not found in timeout rounds, timeout value = : 4')))
+        self.assertFalse(AdmissionController.congestion(Exception('overspend (account X)')))
+
+    def test_queue_fifo(self):
+        controller = AdmissionController(window=1)
+        controller.acquire(1)
+        admitted: list = []
+
+        def sender(name: str):
+            controller.acquire(1)
+            admitted.append(name)
+
+        threads: list = []
+        for name in ('first', 'second'):
+            threads.append(threading.Thread(target=sender, args=(name,)))
+            threads[-1].start()
+            while controller.queue_depth() < len(threads):
+                time.sleep(0.001)
+        self.assertFalse(controller.try_acquire(1))
+
+        #   not confirmed: the window is unchanged and one sender at a time is admitted
+        controller.release(1, False)
+        threads[0].join(5)
+        self.assertEqual(admitted, ['first'])
+        controller.release(1, False)
+        threads[1].join(5)
+        self.assertEqual(admitted, ['first', 'second'])
+
+    def test_deadline(self):
+        controller = AdmissionController(window=1)
+        controller.acquire(1)
+        started = time.monotonic()
+        with self.assertRaises(AdmissionRejected):
+            controller.acquire(1, time.monotonic() + 0.05)
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+        self.assertEqual(controller.stats()['rejected'], 1)
+        self.assertEqual(controller.queue_depth(), 0)
+
+    def test_queue_full(self):
+        controller = AdmissionController(window=1, max_queue=1)
+        controller.acquire(1)
+        thread = threading.Thread(target=self.__acquire_quietly, args=(controller, time.monotonic() + 5))
+        thread.start()
+        while controller.queue_depth() < 1:
+            time.sleep(0.001)
+        with self.assertRaises(AdmissionRejected):
+            controller.acquire(1)
+        controller.release(1, True, rounds=1)
+        thread.join(5)
+        self.assertEqual(controller.stats()['in_flight'], 1)
+
+    @staticmethod
+    def __acquire_quietly(controller: AdmissionController, deadline: float):
+        try:
+            controller.acquire(1, deadline)
+        except AdmissionRejected:
+            pass
+
+
+class AsyncAdmissionTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_waiters_admitted_on_release(self):
+        admission = AsyncAdmission(AdmissionController(window=1))
+        await admission.acquire(1)
+        waiter = asyncio.ensure_future(admission.acquire(1))
+        await asyncio.sleep(0)
+        self.assertEqual(admission.queue_depth(), 1)
+        self.assertFalse(waiter.done())
+        admission.release(1, True, rounds=1)
+        await asyncio.wait_for(waiter, 5)
+        self.assertEqual(admission.stats()['in_flight'], 1)
+
+    async def test_deadline(self):
+        admission = AsyncAdmission(AdmissionController(window=1))
+        await admission.acquire(1)
+        with self.assertRaises(AdmissionRejected):
+            await admission.acquire(1, time.monotonic() + 0.05)
+        self.assertEqual(admission.queue_depth(), 0)
+        self.assertEqual(admission.stats()['rejected'], 1)
+
+    async def test_queue_full(self):
+        admission = AsyncAdmission(AdmissionController(window=1), max_queue=1)
+        await admission.acquire(1)
+        waiter = asyncio.ensure_future(admission.acquire(1))
+        await asyncio.sleep(0)
+        with self.assertRaises(AdmissionRejected):
+            await admission.acquire(1)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        #   the cancelled waiter left the queue: the slot goes to the next one
+        self.assertEqual(admission.queue_depth(), 0)
+        admission.release(1, True, rounds=1)
+        await admission.acquire(1)
+        self.assertEqual(admission.stats()['in_flight'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Unit tests of AsyncHTTPTransport and AsyncAlgodClient (against a local asyncio server)
+python -m unittest test_async_transport     (from the worker folder)
+"""
+
+import json
+import asyncio
+import unittest
+
+from algosdk.error import AlgodHTTPError
+
+from async_transport import AsyncHTTPTransport
+from async_transport import AsyncAlgodClient
+
+
+class Server():
+    """
+    keep-alive HTTP/1.1 server answering with canned responses:
+    /v2/status (content length), /v2/chunked (chunked encoding), /v2/close (connection closed),
+    /v2/slow (after 0.1 seconds), anything else is not found
+    """
+
+    def __init__(self):
+        self.connections: int = 0
+        self.active: int = 0
+        self.max_active: int = 0
+        self._server = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self.__serve, '127.0.0.1', 0)
+        return 'http://127.0.0.1:{}'.format(self._server.sockets[0].getsockname()[1])
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def __serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readuntil(b'\r\n')
+                length = 0
+                while True:
+                    line = await reader.readuntil(b'\r\n')
+                    if line == b'\r\n':
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    if name.strip().lower() == 'content-length':
+                        length = int(value)
+                await reader.readexactly(length)
+
+                path = request_line.decode('latin-1').split(' ')[1]
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+                if path.startswith('/v2/slow'):
+                    await asyncio.sleep(0.1)
+                self.active -= 1
+                writer.write(self.__response(path))
+                await writer.drain()
+                if path.startswith('/v2/close'):
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        writer.close()
+
+    @staticmethod
+    def __response(path: str) -> bytes:
+        body = json.dumps({'last-round': 10}).encode('utf-8')
+        if path.startswith('/v2/chunked'):
+            return (b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+                + b'%x\r\n' % 5 + body[:5] + b'\r\n'
+                + b'%x\r\n' % (len(body) - 5) + body[5:] + b'\r\n'
+                + b'0\r\n\r\n')
+        if path.startswith('/v2/close'):
+            return b'HTTP/1.1 200 OK\r\nConnection: close\r\nContent-Length: %d\r\n\r\n' % len(body) + body
+        if path.startswith('/v2/status') or path.startswith('/v2/slow'):
+            return b'HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n' % len(body) + body
+        body = json.dumps({'message': 'not found'}).encode('utf-8')
+        return b'HTTP/1.1 404 Not Found\r\nContent-Length: %d\r\n\r\n' % len(body) + body
+
+
+class AsyncHTTPTransportTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = Server()
+        self.address = await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.stop()
+
+    async def test_connection_reused(self):
+        transport = AsyncHTTPTransport(self.address, pool_size=2, timeout=5)
+        for path in ('/v2/status', '/v2/chunked', '/v2/status'):
+            status, body = await transport.request('GET', path)
+            self.assertEqual(status, 200)
+            self.assertEqual(json.loads(body), {'last-round': 10})
+        self.assertEqual(self.server.connections, 1)
+        await transport.close()
+
+    async def test_connection_closed(self):
+        transport = AsyncHTTPTransport(self.address, pool_size=2, timeout=5)
+        self.assertEqual((await transport.request('GET', '/v2/close'))[0], 200)
+        self.assertEqual((await transport.request('GET', '/v2/status'))[0], 200)
+        self.assertEqual(self.server.connections, 2)
+        await transport.close()
+
+    async def test_max_concurrent(self):
+        transport = AsyncHTTPTransport(self.address, pool_size=4, timeout=5, max_concurrent=2)
+        responses = await asyncio.gather(*[transport.request('GET', '/v2/slow') for _ in range(5)])
+        self.assertTrue(all(status == 200 for status, _ in responses))
+        self.assertEqual(self.server.max_active, 2)
+        await transport.close()
+
+    async def test_timeout(self):
+        transport = AsyncHTTPTransport(self.address, pool_size=2, timeout=0.02)
+        with self.assertRaises(asyncio.TimeoutError):
+            await transport.request('GET', '/v2/slow')
+        #   the timeout of the request overrides the transport timeout
+        self.assertEqual((await transport.request('GET', '/v2/slow', timeout=5))[0], 200)
+        await transport.close()
+
+    async def test_algod_client(self):
+        client = AsyncAlgodClient('token', self.address, AsyncHTTPTransport(self.address, timeout=5))
+        self.assertEqual(await client.status(), {'last-round': 10})
+        with self.assertRaises(AlgodHTTPError) as context:
+            await client.account_info('UNKNOWN')
+        self.assertEqual(context.exception.code, 404)
+        self.assertEqual(str(context.exception), 'not found')
+        self.assertEqual(self.server.connections, 1)
+        await client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
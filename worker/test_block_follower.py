@@ -0,0 +1,194 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Unit tests of BlockFollower
+python -m unittest test_block_follower     (from the worker folder)
+"""
+
+import time
+import base64
+import threading
+import unittest
+
+import msgpack
+
+from algosdk                     import account
+from algosdk                     import encoding
+from algosdk.future              import transaction
+
+from block_follower import BlockFollower
+from grant_index import GrantIndex
+from event_stream import EventStream
+from event_stream import DopEventType
+
+
+APPROVAL_PROGRAM: bytes = b'\x03dop approval'
+PARAMS = transaction.SuggestedParams(1000, 100, 1100, 'SGFzaA==', 'test', True)
+
+
+def block(round_number: int, stibs: list) -> bytes:
+    """
+    msgpack response of /v2/blocks/{round}?format=msgpack holding the transactions
+    stibs is a list of (transaction, apply data): the genesis hash and id are stored in the block header
+    """
+    txns: list = []
+    for txn, apply_data in stibs:
+        stib: dict = {'txn': txn.dictify(), 'sig': bytes(64), 'hgi': True}
+        stib['txn'].pop('gh', None)
+        stib['txn'].pop('gen', None)
+        stib.update(apply_data)
+        txns.append(stib)
+    header: dict = {'rnd': round_number, 'gh': base64.b64decode(PARAMS.gh), 'gen': PARAMS.gen, 'txns': txns}
+    return msgpack.packb({'block': header}, use_bin_type=True)
+
+
+class FakeAlgod():
+    """
+    algod serving the blocks (round -> msgpack response), the last round is the last block
+    """
+
+    def __init__(self, blocks: dict):
+        self.blocks: dict = blocks
+        self.requested: list = []
+
+    def status(self) -> dict:
+        return {'last-round': max(self.blocks)}
+
+    def status_after_block(self, round_number: int) -> dict:
+        if round_number >= max(self.blocks):
+            time.sleep(0.05)
+        return {'last-round': max(self.blocks)}
+
+    def block_info(self, round_num: int, response_format: str = 'json') -> bytes:
+        self.requested.append(round_num)
+        return self.blocks[round_num]
+
+
+class BlockFollowerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.creator_key, self.creator = account.generate_account()
+        self.linked = account.generate_account()[1]
+        self.subscribers: list = [account.generate_account()[1] for _ in range(3)]
+        self.index = GrantIndex(':memory:')
+        self.addCleanup(self.index.close)
+
+        self.create_txn = transaction.ApplicationCreateTxn(
+            self.creator, PARAMS, transaction.OnComplete.NoOpOC, APPROVAL_PROGRAM, b'\x03clear',
+            transaction.StateSchema(0, 4), transaction.StateSchema(2, 2),
+            [encoding.decode_address(self.linked)])
+
+        #   a deposit: pay to the linked account and application call in a group of two
+        deposit = [
+            transaction.PaymentTxn(self.subscribers[0], PARAMS, self.linked, 100000)
+        ,   transaction.ApplicationNoOpTxn(self.subscribers[0], PARAMS, 7, [b'subscribe'])
+        ]
+        transaction.assign_group_id(deposit)
+
+        self.round_101 = [
+            (transaction.ApplicationOptInTxn(self.subscribers[0], PARAMS, 7), {})
+        ,   (transaction.ApplicationOptInTxn(self.subscribers[1], PARAMS, 7), {})
+        ,   (transaction.ApplicationNoOpTxn(self.subscribers[0], PARAMS, 7, [b'subscribe']), {})
+        ,   (transaction.ApplicationNoOpTxn(self.subscribers[1], PARAMS, 7, [b'subscribe']), {})
+        ,   (deposit[0], {})
+        ,   (deposit[1], {})
+            #   the grant logic is selected by the sender: a subscriber can not grant
+        ,   (transaction.ApplicationNoOpTxn(self.subscribers[1], PARAMS, 7, [b'grant'], [self.subscribers[1]]), {})
+        ,   (transaction.ApplicationNoOpTxn(self.creator, PARAMS, 7, [b'grant'], self.subscribers[:2]), {})
+            #   not a DOP contract
+        ,   (transaction.ApplicationNoOpTxn(self.creator, PARAMS, 8, [b'grant'], self.subscribers[:2]), {})
+        ,   (transaction.PaymentTxn(self.creator, PARAMS, self.subscribers[2], 200000, note=b'DOP funds 1a2b:0'), {})
+        ,   (transaction.PaymentTxn(self.creator, PARAMS, self.subscribers[2], 200000, note=b'other'), {})
+        ]
+        self.round_102 = [
+            (transaction.ApplicationNoOpTxn(self.creator, PARAMS, 7, [b'revoke'], [self.subscribers[1]]), {})
+        ,   (transaction.ApplicationCloseOutTxn(self.subscribers[0], PARAMS, 7), {})
+        ]
+        self.client = FakeAlgod({
+            100: block(100, [(self.create_txn, {'apid': 7})])
+        ,   101: block(101, self.round_101)
+        ,   102: block(102, self.round_102)
+        })
+        self.follower = BlockFollower(self.client, self.index, start_round=100)
+        self.follower.add_program(APPROVAL_PROGRAM)
+
+    def test_operations(self):
+        operations = self.follower.operations(BlockFollower.read_block(self.client, 100))
+        self.assertEqual(operations, [{'op': 'create', 'app_id': 7, 'sender': self.creator, 'accounts': [],
+            'args': self.create_txn.app_args, 'linked': self.linked, 'txid': self.create_txn.get_txid()}])
+
+        operations = self.follower.operations(BlockFollower.read_block(self.client, 101))
+        self.assertEqual([(o['op'], o['sender']) for o in operations], [
+            ('optin', self.subscribers[0])
+        ,   ('optin', self.subscribers[1])
+        ,   ('subscribe', self.subscribers[0])
+        ,   ('subscribe', self.subscribers[1])
+            #   the deposit group: the payment to the linked account only
+        ,   ('payment', self.subscribers[0])
+        ,   ('grant', self.creator)
+        ,   ('payment', self.creator)
+        ])
+        self.assertEqual(operations[4]['accounts'], [self.linked])
+        self.assertEqual(operations[4]['amount'], 100000)
+        self.assertEqual(operations[5]['accounts'], self.subscribers[:2])
+        self.assertEqual(operations[6]['accounts'], [self.subscribers[2]])
+        #   the transaction ids are computed from the block
+        self.assertEqual([o['txid'] for o in operations], [txn.get_txid() for txn, _ in
+            (self.round_101[0], self.round_101[1], self.round_101[2], self.round_101[3], self.round_101[4],
+             self.round_101[7], self.round_101[9])])
+
+    def test_unknown_program(self):
+        follower = BlockFollower(self.client, self.index)
+        self.assertEqual(follower.operations(BlockFollower.read_block(self.client, 100)), [])
+        self.assertEqual(follower.operations(BlockFollower.read_block(self.client, 101))[0]['op'], 'payment')
+
+    def test_watch(self):
+        follower = BlockFollower(self.client, self.index)
+        follower.watch(7, self.creator, self.linked)
+        self.assertTrue(follower.is_watched(7))
+        self.assertEqual(len(follower.operations(BlockFollower.read_block(self.client, 101))), 7)
+
+    def test_follow(self):
+        rounds: list = []
+        applied = threading.Event()
+        follower = BlockFollower(self.client, self.index, 100, lambda r: (rounds.append(r), r == 102 and applied.set()))
+        follower.add_program(APPROVAL_PROGRAM)
+        follower.start()
+        self.assertTrue(applied.wait(5))
+        follower.stop()
+        self.assertEqual(rounds, [100, 101, 102])
+        self.assertEqual(self.index.checkpoint(), 102)
+        self.assertEqual(self.index.grants(7), [])
+        self.assertEqual(self.index.subscribers(7), [
+            {'address': self.subscribers[1], 'subscribed': True, 'granted': False, 'round': 102}])
+
+    def test_events(self):
+        stream = EventStream()
+        events = stream.add_queue()
+        applied = threading.Event()
+        follower = BlockFollower(self.client, self.index, 100, lambda r: r == 102 and applied.set(), stream)
+        follower.add_program(APPROVAL_PROGRAM)
+        follower.start()
+        self.assertTrue(applied.wait(5))
+        follower.stop()
+        received = [events.get_nowait() for _ in range(events.qsize())]
+        self.assertEqual([event.round for event in received], [100] + [101] * 7 + [102] * 2)
+        self.assertEqual(received[0].type, DopEventType.APP_CREATED)
+        self.assertEqual([event.type for event in received[-2:]], [DopEventType.REVOKE, DopEventType.CLOSEOUT])
+
+    def test_resume_from_checkpoint(self):
+        self.index.apply(100, self.follower.operations(BlockFollower.read_block(self.client, 100)))
+        self.client.requested = []
+        applied = threading.Event()
+        follower = BlockFollower(self.client, self.index, 0, lambda r: r == 102 and applied.set())
+        follower.start()
+        self.assertTrue(applied.wait(5))
+        follower.stop()
+        self.assertEqual(self.client.requested, [101, 102])
+        #   the contract created in the checkpointed rounds is known from the index
+        self.assertEqual(self.index.stats()['subscribers'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Unit tests of ConfirmationTracker
+python -m unittest test_confirmation_tracker     (from the worker folder)
+"""
+
+import threading
+import unittest
+from concurrent.futures import Future
+
+from algosdk.error import AlgodHTTPError
+
+from confirmation_tracker import ConfirmationTracker
+from confirmation_tracker import OperationHandle
+from error import DopError
+
+
+class FakeAlgod():
+    """
+    a node producing a round per status_after_block: txid is committed in round confirmed_round,
+    the block txids endpoint answers with the codes in errors (one per request) before the blocks
+    """
+
+    def __init__(self, confirmed_round: int, errors: list = None):
+        self.confirmed_round: int = confirmed_round
+        self.errors: list = list(errors or [])
+        self.block_requests: int = 0
+        self.pending_requests: int = 0
+        self._round: int = 10
+        self._lock = threading.Lock()
+
+    def status(self) -> dict:
+        return {'last-round': self._round}
+
+    def status_after_block(self, round_number: int) -> dict:
+        with self._lock:
+            self._round = max(self._round, round_number + 1)
+            return {'last-round': self._round}
+
+    def algod_request(self, method: str, requrl: str, *args, **kwargs) -> dict:
+        with self._lock:
+            self.block_requests += 1
+            if self.errors:
+                raise AlgodHTTPError('block not available', self.errors.pop(0))
+        round_number = int(requrl.split('/')[2])
+        return {'blockTxids': ['TXID'] if round_number == self.confirmed_round else []}
+
+    def pending_transaction_info(self, txid: str) -> dict:
+        with self._lock:
+            self.pending_requests += 1
+            confirmed = self._round >= self.confirmed_round
+        return {'confirmed-round': self.confirmed_round if confirmed else 0, 'pool-error': ''}
+
+
+class ConfirmationTrackerTest(unittest.TestCase):
+
+    def track(self, client: FakeAlgod) -> ConfirmationTracker:
+        tracker = ConfirmationTracker(client)
+        tracker.start()
+        self.addCleanup(tracker.stop)
+        return tracker
+
+    def test_block_mode(self):
+        client = FakeAlgod(13)
+        tracker = self.track(client)
+        self.assertEqual(tracker.track('TXID', 10).result(timeout=10)['confirmed-round'], 13)
+        #   the transaction is checked once, in the round of its block
+        self.assertEqual(client.pending_requests, 1)
+        self.assertTrue(tracker._block_txids)
+
+    def test_transient_not_found_retries_the_round(self):
+        client = FakeAlgod(12, [404])
+        tracker = self.track(client)
+        self.assertEqual(tracker.track('TXID', 10).result(timeout=10)['confirmed-round'], 12)
+        self.assertTrue(tracker._block_txids)
+
+    def test_not_implemented_falls_back(self):
+        client = FakeAlgod(12, [501])
+        tracker = self.track(client)
+        self.assertEqual(tracker.track('TXID', 10).result(timeout=10)['confirmed-round'], 12)
+        self.assertFalse(tracker._block_txids)
+
+    def test_repeated_not_found_falls_back(self):
+        client = FakeAlgod(12, [404] * ConfirmationTracker.BLOCK_MISSES)
+        tracker = self.track(client)
+        self.assertEqual(tracker.track('TXID', 10).result(timeout=20)['confirmed-round'], 12)
+        self.assertFalse(tracker._block_txids)
+
+
+class OperationHandleTest(unittest.TestCase):
+
+    def test_outcomes(self):
+        future = Future()
+        handle = OperationHandle('TXID', future, DopError(306,"wait error"))
+        self.assertFalse(handle.done())
+        self.assertEqual(handle.confirmed_round, 0)
+        self.assertEqual(handle.wait(0.01)[1].code, 309)
+
+        future.set_result({'confirmed-round': 12, 'pool-error': ''})
+        pending_txn, err = handle.wait()
+        self.assertFalse(err.isError())
+        self.assertEqual(handle.confirmed_round, 12)
+        self.assertEqual(handle.txid, 'TXID')
+
+    def test_failed(self):
+        future = Future()
+        future.set_exception(Exception('pool error: overspend'))
+        handle = OperationHandle('TXID', future, DopError(306,"wait error"))
+        self.assertEqual(handle.wait()[1].code, 306)
+        self.assertEqual(handle.confirmed_round, 0)
+        self.assertIn('overspend', handle.pool_error)
+
+
+if __name__ == '__main__':
+    unittest.main()
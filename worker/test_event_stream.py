@@ -0,0 +1,83 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Unit tests of EventStream
+python -m unittest test_event_stream     (from the worker folder)
+"""
+
+import queue
+import unittest
+
+from event_stream import DopEvent
+from event_stream import DopEventType
+from event_stream import EventStream
+
+
+OPERATIONS: list = [
+    {'op': 'create', 'txid': 'T1', 'app_id': 7, 'sender': 'CREATOR', 'accounts': [], 'args': [], 'linked': 'LINKED'}
+,   {'op': 'grant', 'txid': 'T2', 'app_id': 7, 'sender': 'CREATOR', 'accounts': ['S1', 'S2'], 'args': []}
+,   {'op': 'payment', 'txid': 'T3', 'app_id': 0, 'sender': 'FUNDER', 'accounts': ['S1'], 'args': [], 'amount': 100000}
+]
+
+
+class EventStreamTest(unittest.TestCase):
+
+    def setUp(self):
+        self.stream = EventStream()
+
+    def test_event(self):
+        events = [DopEvent(operation, 101) for operation in OPERATIONS]
+        self.assertEqual([event.type for event in events], [DopEventType.APP_CREATED, DopEventType.GRANT, DopEventType.FUNDING])
+        self.assertEqual(events[0].linked, 'LINKED')
+        self.assertEqual(events[1].accounts, ['S1', 'S2'])
+        self.assertEqual(events[2].amount, 100000)
+        self.assertEqual(events[2].round, 101)
+        with self.assertRaises(ValueError):
+            DopEvent({'op': 'deposit', 'app_id': 7, 'sender': 'S1'}, 101)
+
+    def test_listeners_in_order(self):
+        received: list = []
+        self.stream.add_listener(lambda event: received.append((event.round, event.txid)))
+        self.stream.publish(101, OPERATIONS[:2])
+        self.stream.publish(102, OPERATIONS[2:])
+        self.assertEqual(received, [(101, 'T1'), (101, 'T2'), (102, 'T3')])
+        self.assertEqual(self.stream.stats(), {'delivered': 3, 'dropped': 0})
+
+    def test_failing_listener(self):
+        received: list = []
+
+        def failing(event: DopEvent):
+            raise RuntimeError('listener failure')
+
+        self.stream.add_listener(failing)
+        self.stream.add_listener(received.append)
+        self.stream.publish(101, OPERATIONS)
+        self.assertEqual(len(received), 3)
+
+        self.stream.remove_listener(received.append)
+        self.stream.publish(102, OPERATIONS)
+        self.assertEqual(len(received), 3)
+
+    def test_queues(self):
+        unbounded = self.stream.add_queue()
+        bounded = self.stream.add_queue(2)
+        self.stream.publish(101, OPERATIONS)
+        self.assertEqual(unbounded.qsize(), 3)
+        self.assertEqual([bounded.get_nowait().txid for _ in range(2)], ['T1', 'T2'])
+        with self.assertRaises(queue.Empty):
+            bounded.get_nowait()
+        self.assertEqual(self.stream.stats(), {'delivered': 3, 'dropped': 1})
+
+        self.stream.remove_queue(unbounded)
+        self.stream.publish(102, OPERATIONS[:1])
+        self.assertEqual(unbounded.qsize(), 3)
+        self.assertEqual(bounded.qsize(), 1)
+
+    def test_no_consumer(self):
+        self.stream.publish(101, OPERATIONS)
+        self.assertEqual(self.stream.stats(), {'delivered': 0, 'dropped': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
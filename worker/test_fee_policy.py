@@ -0,0 +1,70 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Unit tests of FeePolicy
+python -m unittest test_fee_policy     (from the worker folder)
+"""
+
+import unittest
+
+import msgpack
+
+from algosdk.future import transaction
+
+from fee_policy import FeePolicy
+
+
+def pool(fees: list, total: int = 0) -> bytes:
+    """
+    msgpack response of /v2/transactions/pending holding transactions paying fees (highest first)
+    """
+    signed_txns: list = [{'txn': {'fee': fee, 'type': 'pay'}} for fee in sorted(fees, reverse=True)]
+    return msgpack.packb({'top-transactions': signed_txns, 'total-transactions': total or len(fees)}, use_bin_type=True)
+
+
+def per_byte(fee: int) -> float:
+    """
+    fee per byte of a transaction of pool (see FeePolicy.observe_pool)
+    """
+    return fee / len(msgpack.packb({'txn': {'fee': fee, 'type': 'pay'}}, use_bin_type=True))
+
+
+class FeePolicyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = FeePolicy(None, max_fee=1000000, block_capacity=10)
+        self.policy.observe(transaction.SuggestedParams(0, 1, 100, 'SGFzaA==', 'test', False, min_fee=1000))
+
+    def test_not_congested(self):
+        self.policy.observe_pool(pool([5000] * 5))
+        self.assertEqual(self.policy.fee('grant'), 1000)
+
+    def test_cutoff_within_sample(self):
+        #   50 pending, 10 committed per round: a grant (1 round) outbids the 11th transaction,
+        #   a payment (4 rounds) the 41st
+        fees: list = [3000 - 20 * index for index in range(50)]
+        self.policy.observe_pool(pool(fees))
+        self.assertEqual(self.policy.fee('grant'), int(per_byte(fees[10]) * 400) + 1)
+        self.assertEqual(self.policy.fee('payment'), int(per_byte(fees[40]) * 300) + 1)
+
+    def test_cutoff_beyond_sample(self):
+        #   the top 20 of a pool of 5000: the rank of a grant (10) is in the sample, the rank of
+        #   a creation (30) is not and the top of the pool does not set its fee
+        self.policy.observe_pool(pool([3000] * 20, 5000))
+        self.assertEqual(self.policy.fee('grant'), int(per_byte(3000) * 400) + 1)
+        self.assertEqual(self.policy.fee('create'), 1000)
+
+    def test_suggested_fee_per_byte(self):
+        self.policy.observe(transaction.SuggestedParams(10, 1, 100, 'SGFzaA==', 'test', False, min_fee=1000))
+        self.assertEqual(self.policy.fee('create'), 15000)
+        self.assertEqual(self.policy.fee('grant'), 4000)
+
+    def test_cap(self):
+        self.policy = FeePolicy(None, max_fee=2000, block_capacity=1)
+        self.policy.observe_pool(pool([100000] * 10))
+        self.assertEqual(self.policy.fee('grant'), 2000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Unit tests of GrantIndex
+python -m unittest test_grant_index     (from the worker folder)
+"""
+
+import os
+import tempfile
+import unittest
+
+from grant_index import GrantIndex
+
+
+def operation(op: str, app_id: int, sender: str, accounts: list = None, **kwargs) -> dict:
+    """
+    an operation as returned by BlockFollower.operations
+    """
+    result = {'op': op, 'txid': '', 'app_id': app_id, 'sender': sender, 'accounts': accounts or [], 'args': []}
+    result.update(kwargs)
+    return result
+
+
+class GrantIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = GrantIndex(':memory:')
+        self.addCleanup(self.index.close)
+        self.index.apply(100, [operation('create', 7, 'CREATOR', linked='LINKED')])
+
+    def test_create(self):
+        self.assertEqual(self.index.apps(), {7: ('CREATOR', 'LINKED')})
+        self.assertEqual(self.index.creator(7), 'CREATOR')
+        self.assertIsNone(self.index.creator(8))
+        self.assertEqual(self.index.checkpoint(), 100)
+
+    def test_subscribe_grant_revoke(self):
+        self.index.apply(101, [
+            operation('optin', 7, 'S1')
+        ,   operation('optin', 7, 'S2')
+        ,   operation('subscribe', 7, 'S1')
+        ,   operation('subscribe', 7, 'S2')
+        ])
+        self.assertEqual(self.index.grants(7), [])
+        self.index.apply(102, [operation('grant', 7, 'CREATOR', ['S1', 'S2'])])
+        self.assertEqual(self.index.grants(7), ['S1', 'S2'])
+        self.index.apply(103, [operation('revoke', 7, 'CREATOR', ['S2'])])
+        self.assertEqual(self.index.grants(7), ['S1'])
+        self.assertEqual(self.index.subscribers(7), [
+            {'address': 'S1', 'subscribed': True, 'granted': True, 'round': 102}
+        ,   {'address': 'S2', 'subscribed': True, 'granted': False, 'round': 103}
+        ])
+        self.assertEqual(self.index.stats(), {'round': 103, 'apps': 1, 'subscribers': 2})
+
+    def test_subscribe_resets_grant(self):
+        self.index.apply(101, [operation('optin', 7, 'S1'), operation('subscribe', 7, 'S1')])
+        self.index.apply(102, [operation('grant', 7, 'CREATOR', ['S1'])])
+        self.index.apply(103, [operation('unsubscribe', 7, 'S1')])
+        self.assertEqual(self.index.grants(7), ['S1'])
+        self.index.apply(104, [operation('subscribe', 7, 'S1')])
+        self.assertEqual(self.index.grants(7), [])
+
+    def test_closeout(self):
+        self.index.apply(101, [operation('optin', 7, 'S1'), operation('subscribe', 7, 'S1')])
+        self.index.apply(102, [operation('grant', 7, 'CREATOR', ['S1'])])
+        self.index.apply(103, [operation('closeout', 7, 'S1')])
+        self.assertEqual(self.index.grants(7), [])
+        self.assertEqual(self.index.subscribers(7), [])
+        #   opting in again starts from an empty local state
+        self.index.apply(104, [operation('optin', 7, 'S1')])
+        self.assertEqual(self.index.subscribers(7), [{'address': 'S1', 'subscribed': False, 'granted': False, 'round': 104}])
+
+    def test_delete(self):
+        self.index.apply(101, [operation('optin', 7, 'S1'), operation('delete', 7, 'CREATOR')])
+        self.assertEqual(self.index.apps(), {})
+        self.assertEqual(self.index.stats()['subscribers'], 0)
+
+    def test_add_app(self):
+        self.index.add_app(8, 'CREATOR')
+        self.index.add_app(8, 'OTHER')
+        self.index.apply(101, [operation('create', 7, 'OTHER')])
+        self.assertEqual(self.index.apps(), {7: ('CREATOR', 'LINKED'), 8: ('CREATOR', '')})
+
+    def test_checkpoint_resume(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'grants.db')
+            index = GrantIndex(path)
+            index.apply(100, [operation('create', 7, 'CREATOR')])
+            index.apply(101, [operation('optin', 7, 'S1'), operation('subscribe', 7, 'S1')])
+            index.apply(102, [operation('grant', 7, 'CREATOR', ['S1'])])
+            index.close()
+
+            #   after a restart the index resumes from the last round applied
+            index = GrantIndex(path)
+            self.assertEqual(index.checkpoint(), 102)
+            self.assertEqual(index.grants(7), ['S1'])
+            index.apply(103, [operation('revoke', 7, 'CREATOR', ['S1'])])
+            self.assertEqual(index.checkpoint(), 103)
+            self.assertEqual(index.grants(7), [])
+            index.close()
+
+    def test_failed_round_not_applied(self):
+        #   the operations of a round and the checkpoint are applied in the same database transaction
+        with self.assertRaises(KeyError):
+            self.index.apply(101, [operation('optin', 7, 'S1'), {'op': 'subscribe'}])
+        self.assertEqual(self.index.checkpoint(), 100)
+        self.assertEqual(self.index.subscribers(7), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
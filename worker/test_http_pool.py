@@ -0,0 +1,126 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Unit tests of HTTPConnectionPool and PooledAlgodClient (against a local http server)
+python -m unittest test_http_pool     (from the worker folder)
+"""
+
+import json
+import time
+import threading
+import unittest
+import http.server
+
+from algosdk.error import AlgodHTTPError
+
+from http_pool import HTTPConnectionPool
+from http_pool import PooledAlgodClient
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    """
+    keep-alive handler: /v2/status answers at once, /v2/slow after 0.1 seconds, anything else is not found
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        if self.path.startswith('/v2/slow'):
+            time.sleep(0.1)
+        if self.path.startswith('/v2/status') or self.path.startswith('/v2/slow'):
+            self.reply(200, {'last-round': 10})
+        else:
+            self.reply(404, {'message': 'not found'})
+
+    def reply(self, status: int, response: dict):
+        body = json.dumps(response).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server() -> http.server.ThreadingHTTPServer:
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class HTTPConnectionPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = start_server()
+        self.address = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connection_reused(self):
+        pool = HTTPConnectionPool(self.address, pool_size=2, timeout=5)
+        self.addCleanup(pool.close)
+        for _ in range(3):
+            status, body = pool.request('GET', '/v2/status')
+            self.assertEqual(status, 200)
+            self.assertEqual(json.loads(body), {'last-round': 10})
+        stats = pool.stats()
+        self.assertEqual(stats['new'], 1)
+        self.assertEqual(stats['reused'], 2)
+        self.assertEqual(stats['idle'], 1)
+        self.assertEqual(self.server.connections, 1)
+        pool.close()
+        self.assertEqual(pool.stats()['idle'], 0)
+
+    def test_max_concurrent(self):
+        pool = HTTPConnectionPool(self.address, pool_size=4, timeout=5, max_concurrent=1)
+        self.addCleanup(pool.close)
+        threads = [threading.Thread(target=pool.request, args=('GET', '/v2/slow')) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = pool.stats()
+        #   one request at a time: a single connection is opened and the others wait for it
+        self.assertEqual(stats['new'], 1)
+        self.assertEqual(stats['waited'], 2)
+        self.assertEqual(stats['active'], 0)
+
+    def test_slot_timeout(self):
+        pool = HTTPConnectionPool(self.address, pool_size=4, timeout=0.02, max_concurrent=1)
+        self.addCleanup(pool.close)
+        thread = threading.Thread(target=pool.request, args=('GET', '/v2/slow', None, None, 5))
+        thread.start()
+        time.sleep(0.02)
+        with self.assertRaises(TimeoutError):
+            pool.request('GET', '/v2/status')
+        #   the long polls do not take a slot
+        self.assertEqual(pool.request('GET', '/v2/status', limited=False)[0], 200)
+        thread.join()
+
+    def test_algod_client(self):
+        pool = HTTPConnectionPool(self.address, timeout=5)
+        self.addCleanup(pool.close)
+        client = PooledAlgodClient('token', self.address, pool)
+        self.assertEqual(client.status(), {'last-round': 10})
+        with self.assertRaises(AlgodHTTPError) as context:
+            client.account_info('UNKNOWN')
+        self.assertEqual(context.exception.code, 404)
+        self.assertEqual(str(context.exception), 'not found')
+        self.assertEqual(pool.stats()['new'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Unit tests of EndpointBalancer and BalancedAlgodClient
+python -m unittest test_load_balancer     (from the worker folder)
+"""
+
+import unittest
+
+from algosdk.error import AlgodHTTPError
+from algosdk.error import KMDHTTPError
+
+from load_balancer import Endpoint
+from load_balancer import EndpointBalancer
+from load_balancer import BalancedAlgodClient
+from load_balancer import BalancedKMDClient
+
+
+class FakeNode():
+    """
+    algod node answering the status and the block txids of the rounds it has committed
+    (or raising error, if set)
+    """
+
+    def __init__(self, last_round: int):
+        self.last_round: int = last_round
+        self.requests: list = []
+        self.error: Exception = None
+
+    def algod_request(self, method, requrl, params=None, data=None, headers=None, response_format="json", timeout=None):
+        self.requests.append(requrl)
+        if self.error is not None:
+            raise self.error
+        if requrl.startswith('/status'):
+            return {'last-round': self.last_round}
+        return {'blockTxids': []}
+
+
+class LoadBalancerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.nodes: list = [FakeNode(100), FakeNode(96)]
+        self.endpoints: list = [Endpoint('http://node{}'.format(index), node, None) for index, node in enumerate(self.nodes)]
+        self.balancer = EndpointBalancer(self.endpoints, max_lag=10)
+        self.client = BalancedAlgodClient('', 'http://node0', self.balancer)
+
+    def test_block_reads_go_to_nodes_having_the_round(self):
+        #   the status responses report the last round of each node
+        for _ in range(20):
+            self.client.algod_request('GET', '/status')
+        self.assertEqual([endpoint.last_round for endpoint in self.endpoints], [100, 96])
+
+        for _ in range(20):
+            self.client.algod_request('GET', '/blocks/99/txids')
+        self.assertFalse(any(requrl.startswith('/blocks/') for requrl in self.nodes[1].requests))
+
+        #   a round no node is known to have: any node
+        for _ in range(40):
+            self.client.algod_request('GET', '/blocks/101/txids')
+        self.assertTrue(any(requrl.startswith('/blocks/101') for requrl in self.nodes[1].requests))
+
+    def test_lag_ejection(self):
+        balancer = EndpointBalancer(self.endpoints, max_lag=2, probe=lambda endpoint: endpoint.client.last_round)
+        balancer.probe_all()
+        self.assertEqual([endpoint.ejected for endpoint in self.endpoints], [False, True])
+        self.assertTrue(all(balancer.select(False) is self.endpoints[0] for _ in range(20)))
+
+        #   re-admitted once caught up
+        self.nodes[1].last_round = 99
+        balancer.probe_all()
+        self.assertEqual([endpoint.ejected for endpoint in self.endpoints], [False, False])
+
+    def test_probe_failure_ejection(self):
+        def probe(endpoint: Endpoint) -> int:
+            if endpoint.client.error is not None:
+                raise endpoint.client.error
+            return endpoint.client.last_round
+
+        balancer = EndpointBalancer(self.endpoints, max_lag=10, probe=probe)
+        self.nodes[0].error = ConnectionRefusedError()
+        balancer.probe_all()
+        self.assertEqual([endpoint.ejected for endpoint in self.endpoints], [True, False])
+        self.nodes[0].error = None
+        balancer.probe_all()
+        self.assertEqual([endpoint.ejected for endpoint in self.endpoints], [False, False])
+
+    def test_failure_ejection(self):
+        balancer = EndpointBalancer(self.endpoints, max_failures=2)
+        for ok in (False, True, False):
+            balancer.begin(self.endpoints[1])
+            balancer.end(self.endpoints[1], None, ok)
+        #   the failures must be consecutive
+        self.assertFalse(self.endpoints[1].ejected)
+        balancer.begin(self.endpoints[1])
+        balancer.end(self.endpoints[1], None, False)
+        self.assertTrue(self.endpoints[1].ejected)
+        self.assertEqual(balancer.stats()[1]['errors'], 3)
+        self.assertTrue(all(balancer.select(True) is self.endpoints[0] for _ in range(10)))
+
+        #   every endpoint ejected: all of them are used
+        self.endpoints[0].ejected = True
+        self.assertIn(balancer.select(False), self.endpoints)
+
+    def test_retry_on_server_error(self):
+        self.nodes[0].error = AlgodHTTPError('internal error', 503)
+        for _ in range(100):
+            self.assertEqual(self.client.algod_request('GET', '/status'), {'last-round': 96})
+        #   ejected after max_failures: the failing node is not tried anymore
+        self.assertTrue(self.endpoints[0].ejected)
+        self.assertEqual(len(self.nodes[0].requests), 3)
+
+        #   a client error is not retried (and is not a failure of the node)
+        self.nodes[0].error = None
+        self.nodes[1].error = AlgodHTTPError('not found', 404)
+        self.endpoints[0].ejected = True
+        with self.assertRaises(AlgodHTTPError):
+            self.client.algod_request('GET', '/accounts/UNKNOWN')
+        self.assertEqual(len(self.nodes[0].requests), 3)
+        self.assertEqual(self.endpoints[1].failures, 0)
+
+    def test_writes_to_least_outstanding(self):
+        self.balancer.begin(self.endpoints[0])
+        self.assertIs(self.balancer.select(True), self.endpoints[1])
+        self.balancer.end(self.endpoints[0], 0.01, True)
+        self.balancer.begin(self.endpoints[1])
+        self.assertIs(self.balancer.select(True), self.endpoints[0])
+
+
+class FakeKMD():
+
+    def __init__(self):
+        self.reachable: bool = True
+        self.requests: int = 0
+
+    def kmd_request(self, method, requrl, params=None, data=None, timeout=None):
+        self.requests += 1
+        if not self.reachable:
+            raise ConnectionRefusedError()
+        return {'versions': ['v1']}
+
+
+class BalancedKMDClientTest(unittest.TestCase):
+
+    def test_sticky_fail_over(self):
+        nodes: list = [FakeKMD(), FakeKMD()]
+        balancer = EndpointBalancer([Endpoint('http://kmd{}'.format(index), node, None) for index, node in enumerate(nodes)], max_lag=0)
+        client = BalancedKMDClient('', 'http://kmd0', balancer)
+        for _ in range(5):
+            client.kmd_request('GET', '/versions')
+        self.assertEqual([node.requests for node in nodes], [5, 0])
+
+        #   the sticky node fails: KMDHTTPError (the wallet handle is renewed) and the next requests go to the other node
+        nodes[0].reachable = False
+        with self.assertRaises(KMDHTTPError):
+            client.kmd_request('GET', '/versions')
+        client.kmd_request('GET', '/versions')
+        self.assertEqual([node.requests for node in nodes], [6, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
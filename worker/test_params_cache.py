@@ -0,0 +1,79 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Unit tests of SuggestedParamsProvider
+python -m unittest test_params_cache     (from the worker folder)
+"""
+
+import time
+import unittest
+
+from algosdk.future import transaction
+
+from params_cache import SuggestedParamsProvider
+
+
+class FakeAlgod():
+
+    def __init__(self):
+        self.round: int = 10
+        self.calls: int = 0
+
+    def suggested_params(self) -> transaction.SuggestedParams:
+        self.calls += 1
+        return transaction.SuggestedParams(0, self.round, self.round + 1000, 'SGFzaA==', 'test', False, min_fee=1000)
+
+
+class SuggestedParamsProviderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = FakeAlgod()
+        self.provider = SuggestedParamsProvider(self.client, ttl=60.0, fee=2000)
+
+    def test_fetched_once_per_round(self):
+        params = self.provider.params()
+        self.assertEqual(params.first, 10)
+        self.assertEqual(params.fee, 2000)
+        self.assertTrue(params.flat_fee)
+        self.provider.params()
+        self.assertEqual(self.client.calls, 1)
+
+        #   a round already seen does not refresh the params
+        self.provider.notify_round(10)
+        self.provider.params()
+        self.assertEqual(self.client.calls, 1)
+
+        self.client.round = 11
+        self.provider.notify_round(11)
+        self.assertEqual(self.provider.params().first, 11)
+        self.assertEqual(self.client.calls, 2)
+
+    def test_ttl(self):
+        provider = SuggestedParamsProvider(self.client, ttl=0.05)
+        provider.params()
+        provider.params()
+        self.assertEqual(self.client.calls, 1)
+        time.sleep(0.06)
+        provider.params()
+        self.assertEqual(self.client.calls, 2)
+
+    def test_invalidate(self):
+        self.provider.params()
+        self.provider.invalidate()
+        self.provider.params()
+        self.assertEqual(self.client.calls, 2)
+
+    def test_copies(self):
+        #   a caller changing its params does not change the params of the others
+        params = self.provider.params()
+        params.fee = 0
+        params.first = 0
+        self.assertEqual(self.provider.params().fee, 2000)
+        self.assertEqual(self.provider.params().first, 10)
+        self.assertEqual(self.provider.genesis_hash, 'SGFzaA==')
+        self.assertEqual(self.provider.genesis_id, 'test')
+
+
+if __name__ == '__main__':
+    unittest.main()
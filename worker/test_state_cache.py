@@ -0,0 +1,213 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Unit tests of LocalStateCache, GlobalStateCache and AccountCache
+python -m unittest test_state_cache     (from the worker folder)
+"""
+
+import base64
+import threading
+import unittest
+
+from algosdk.error import AlgodHTTPError
+
+from state_cache import LocalStateCache
+from state_cache import GlobalStateCache
+from state_cache import AccountCache
+
+
+def key_value(key: str, value) -> dict:
+    """
+    an item of the key-value list returned by algod
+    """
+    if isinstance(value, int):
+        return {'key': base64.b64encode(key.encode()).decode(), 'value': {'type': 2, 'uint': value}}
+    return {'key': base64.b64encode(key.encode()).decode(), 'value': {'type': 1, 'bytes': base64.b64encode(value).decode()}}
+
+
+class FakeAlgod():
+    """
+    algod holding the local state of the accounts opted in (address -> {app_id: key-value list})
+    and the global state of the contracts (app_id -> key-value list)
+    """
+
+    def __init__(self):
+        self.round: int = 10
+        self.local_states: dict = {}
+        self.global_states: dict = {}
+        self.reads: int = 0
+        self.account_reads: int = 0
+        self.lock = threading.Lock()
+        self.on_read = None                         #   called while a request is in progress
+        self.application_endpoint: bool = True      #   False: account_application_info is not implemented
+
+    def account_application_info(self, address: str, app_id: int) -> dict:
+        self.reads += 1
+        if self.on_read is not None:
+            self.on_read()
+        if not self.application_endpoint or app_id not in self.local_states.get(address, {}):
+            raise AlgodHTTPError('account application info not found', 404)
+        return {'round': self.round, 'app-local-state': {'id': app_id, 'key-value': self.local_states[address][app_id]}}
+
+    def application_info(self, app_id: int) -> dict:
+        self.reads += 1
+        if app_id not in self.global_states:
+            raise AlgodHTTPError('application does not exist', 404)
+        return {'id': app_id, 'params': {'global-state': self.global_states[app_id]}}
+
+    def account_info(self, address: str) -> dict:
+        if self.on_read is not None:
+            self.on_read()
+        if address == 'UNKNOWN':
+            raise AlgodHTTPError('invalid address', 400)
+        with self.lock:
+            self.account_reads += 1
+        return {'round': self.round, 'amount': 5000000, 'min-balance': 100000, 'apps-local-state': [
+            {'id': app_id, 'key-value': key_values} for app_id, key_values in self.local_states.get(address, {}).items()]}
+
+
+class LocalStateCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = FakeAlgod()
+        self.client.local_states['SUBSCRIBER'] = {7: [key_value('subscription', 1), key_value('kid', b'k1')]}
+        self.round: int = 10
+        self.observed: list = []
+        self.cache = LocalStateCache(self.client, 4, lambda: self.round, self.observed.append)
+
+    def test_decode(self):
+        state = LocalStateCache.decode([
+            key_value('grant', 1), key_value('key', b'secret'), key_value('raw', b'\xff\xfe'), key_value('creator', bytes(32))
+        ], ('creator',))
+        self.assertEqual(state['grant'], 1)
+        self.assertEqual(state['key'], 'secret')
+        self.assertEqual(state['raw'], base64.b64encode(b'\xff\xfe').decode())
+        self.assertEqual(state['creator'], 'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAY5HFKQ')
+        self.assertEqual(LocalStateCache.decode(None), {})
+
+    def test_round_age(self):
+        self.assertEqual(self.cache.get('SUBSCRIBER', 7), {'subscription': 1, 'kid': 'k1'})
+        self.assertEqual(self.observed, [10])
+
+        #   served from memory up to max_age rounds after the round of the response
+        self.client.local_states['SUBSCRIBER'][7] = [key_value('subscription', 0)]
+        self.round = 14
+        self.assertEqual(self.cache.get('SUBSCRIBER', 7)['subscription'], 1)
+        self.assertEqual(self.client.reads, 1)
+
+        self.round = 15
+        self.assertEqual(self.cache.get('SUBSCRIBER', 7), {'subscription': 0})
+        self.assertEqual(self.client.reads, 2)
+
+    def test_invalidate(self):
+        self.cache.get('SUBSCRIBER', 7)
+        self.client.local_states['SUBSCRIBER'][7] = [key_value('subscription', 1), key_value('grant', 1)]
+        self.cache.invalidate('SUBSCRIBER', 7)
+        self.assertEqual(self.cache.get('SUBSCRIBER', 7)['grant'], 1)
+        self.assertEqual(self.client.reads, 2)
+
+    def test_invalidated_while_reading(self):
+        #   a read started before an invalidation may return the previous state: it is not cached
+        self.client.on_read = lambda: self.cache.invalidate('SUBSCRIBER', 7)
+        self.cache.get('SUBSCRIBER', 7)
+        self.client.on_read = None
+        self.cache.get('SUBSCRIBER', 7)
+        self.cache.get('SUBSCRIBER', 7)
+        self.assertEqual(self.client.reads, 2)
+
+    def test_not_opted_in(self):
+        self.assertIsNone(self.cache.get('OTHER', 7))
+        self.assertIsNone(self.cache.get('OTHER', 7))
+        self.assertEqual(self.client.reads, 1)
+
+    def test_account_info_fallback(self):
+        self.client.application_endpoint = False
+        self.assertEqual(self.cache.get('SUBSCRIBER', 7), {'subscription': 1, 'kid': 'k1'})
+
+
+class GlobalStateCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = FakeAlgod()
+        self.client.global_states[7] = [key_value('creator', bytes(32)), key_value('kid', b'k1')]
+        self.round: int = 10
+        self.cache = GlobalStateCache(self.client, lambda: self.round)
+
+    def test_once_per_round(self):
+        state = self.cache.get(7)
+        self.assertEqual(state['creator'], 'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAY5HFKQ')
+        self.assertEqual(state['kid'], 'k1')
+        self.cache.get(7)
+        self.assertEqual(self.client.reads, 1)
+
+        self.client.global_states[7] = [key_value('kid', b'k2')]
+        self.round = 11
+        self.assertEqual(self.cache.get(7), {'kid': 'k2'})
+        self.assertEqual(self.client.reads, 2)
+
+    def test_invalidate(self):
+        self.cache.get(7)
+        self.client.global_states[7] = [key_value('kid', b'k2')]
+        self.cache.invalidate(7)
+        self.assertEqual(self.cache.get(7), {'kid': 'k2'})
+
+    def test_round_unknown(self):
+        #   without a round estimate the state is read every time
+        cache = GlobalStateCache(self.client)
+        cache.get(7)
+        cache.get(7)
+        self.assertEqual(self.client.reads, 2)
+
+    def test_not_found(self):
+        with self.assertRaises(AlgodHTTPError):
+            self.cache.get(8)
+
+
+class AccountCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = FakeAlgod()
+        self.client.local_states['SUBSCRIBER'] = {7: [], 8: []}
+        self.round: int = 10
+        self.cache = AccountCache(self.client, 4, lambda: self.round)
+        self.addCleanup(self.cache.close)
+
+    def test_summary(self):
+        self.assertEqual(self.cache.get('SUBSCRIBER'), {'amount': 5000000, 'min-balance': 100000, 'apps': [7, 8]})
+
+    def test_concurrent_lookups_shared(self):
+        #   the lookups of the same address started while the request is in progress share it
+        release = threading.Event()
+        self.client.on_read = lambda: release.wait(5)
+        futures = [self.cache.lookup('SUBSCRIBER') for _ in range(5)]
+        other = self.cache.lookup('OTHER')
+        release.set()
+        self.assertTrue(all(future.result(5)['amount'] == 5000000 for future in futures))
+        other.result(5)
+        self.assertEqual(self.client.account_reads, 2)
+
+    def test_once_per_round(self):
+        self.cache.get('SUBSCRIBER')
+        self.cache.get('SUBSCRIBER')
+        self.assertEqual(self.client.account_reads, 1)
+        self.round = 11
+        self.cache.get('SUBSCRIBER')
+        self.assertEqual(self.client.account_reads, 2)
+
+    def test_invalidate(self):
+        self.cache.get('SUBSCRIBER')
+        self.cache.invalidate('SUBSCRIBER')
+        self.cache.get('SUBSCRIBER')
+        self.assertEqual(self.client.account_reads, 2)
+
+    def test_error(self):
+        with self.assertRaises(AlgodHTTPError):
+            self.cache.get('UNKNOWN')
+        #   the failed lookup is not cached
+        with self.assertRaises(AlgodHTTPError):
+            self.cache.lookup('UNKNOWN').result(5)
+
+
+if __name__ == '__main__':
+    unittest.main()
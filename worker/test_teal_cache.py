@@ -0,0 +1,135 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Unit tests of TealCompileCache and StatelessTemplate
+python -m unittest test_teal_cache     (from the worker folder)
+"""
+
+import os
+import base64
+import tempfile
+import unittest
+
+from algosdk import encoding
+
+from teal_cache import TealCompileCache
+from teal_cache import StatelessTemplate
+
+
+MACRO = '_RECEIVERADDRESS_'
+
+#   compile responses (/v2/teal/compile) of dop.account.teal.template, keyed by the address replacing the macro:
+#   the TEAL v3 bytecode (intcblock and bytecblock in order of first use) and its program address
+CREATOR = 'RZQEK4SSLR6SUW26XPTED2ROQXSWUGHAVWVL3YXZPXDZCSEXV4Z4GA6GDY'
+COMPILED = {
+    CREATOR: {
+        'result': 'AyAHAgEABmTIAaCNBiYBII5gRXJSXH0qW1675kHqLoXlahjgraq94vl9x5FIl68zMgQiD0AAKTIEIxJAAAIkQzMAECMSQAAKMwAQJRJAAA0kQzMABygTQAAlIQRDIQVDMwAQIxNAABczARAlE0AADzMBGCQSQAAHMwAIIQYPQyRD',
+        'hash': 'MSCJ24223WDOKKALDOII4OCFUYG5YJ2LBHK6A56O5W4KU2EPOOKWY6DSPM'},
+    #   StatelessTemplate.placeholder(0)
+    'GMZ7PBTZQ4ZRXCTOHVHQG5M5GJEZNU7MPWBX3QBXJNG5ABZW47YBBPCBZY': {
+        'result': 'AyAHAgEABmTIAaCNBiYBIDMz94Z5hzMbim49TwN1nTJJltPsfYN9wDdLTdAHNufwMgQiD0AAKTIEIxJAAAIkQzMAECMSQAAKMwAQJRJAAA0kQzMABygTQAAlIQRDIQVDMwAQIxNAABczARAlE0AADzMBGCQSQAAHMwAIIQYPQyRD',
+        'hash': 'QLU6WE5HJQIXEK6JNHGKCOUATOVUGUQPSM77XIZOBONEVURONZC6PCZO6I'},
+    #   StatelessTemplate.placeholder(1)
+    'ORFH3OUNYLFG2KGPPLHKZHCNAWNMCYZJTE4OKJU5X4LC27M7QVFXESHB4A': {
+        'result': 'AyAHAgEABmTIAaCNBiYBIHRKfbqNwsptKM96zqycTQWawWMpmTjlJp2/Fi19n4VLMgQiD0AAKTIEIxJAAAIkQzMAECMSQAAKMwAQJRJAAA0kQzMABygTQAAlIQRDIQVDMwAQIxNAABczARAlE0AADzMBGCQSQAAHMwAIIQYPQyRD',
+        'hash': 'C5HPBUOTQ5AWQXSFSMYLIBA4LW6SL7JXOK7SFMWOB7MV4SZVON4MAWWDCQ'},
+}
+
+
+def template_source() -> str:
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dop.account.teal.template'), 'r') as f:
+        return f.read()
+
+
+class FakeAlgod():
+    """
+    algod client answering /v2/teal/compile with the recorded responses
+    """
+
+    def __init__(self, compiled: dict):
+        self._compiled = compiled
+        self.compiles = 0
+
+    def versions(self) -> dict:
+        return {'build': {'major': 3, 'minor': 0, 'build_number': 0, 'commit_hash': 'test'}}
+
+    def compile(self, source: str) -> dict:
+        self.compiles += 1
+        for address, response in self._compiled.items():
+            if address in source:
+                return dict(response)
+        raise Exception('no compile response recorded')
+
+
+class StatelessTemplateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = FakeAlgod(COMPILED)
+        self.cache = TealCompileCache()
+
+    def test_placeholders(self):
+        for index in (0, 1):
+            self.assertIn(encoding.encode_address(StatelessTemplate.placeholder(index)), COMPILED)
+
+    def test_instance_matches_compile(self):
+        stateless_template = self.cache.template(self.client, template_source(), MACRO)
+        self.assertIsNotNone(stateless_template)
+        self.assertEqual(self.client.compiles, 2)
+
+        #   the instance of the creator is computed locally, bit for bit equal to the compile response
+        self.assertEqual(
+            stateless_template.program(encoding.decode_address(CREATOR)),
+            base64.b64decode(COMPILED[CREATOR]['result']))
+        self.assertEqual(stateless_template.address(CREATOR), COMPILED[CREATOR]['hash'])
+        self.assertEqual(self.client.compiles, 2)
+
+    def test_template_prepared_once(self):
+        stateless_template = self.cache.template(self.client, template_source(), MACRO)
+        self.assertIs(self.cache.template(self.client, template_source(), MACRO), stateless_template)
+        self.assertEqual(self.client.compiles, 2)
+
+    def test_hash_mismatch(self):
+        compiled = dict(COMPILED)
+        compiled['ORFH3OUNYLFG2KGPPLHKZHCNAWNMCYZJTE4OKJU5X4LC27M7QVFXESHB4A'] = {
+            'result': COMPILED['ORFH3OUNYLFG2KGPPLHKZHCNAWNMCYZJTE4OKJU5X4LC27M7QVFXESHB4A']['result'],
+            'hash': COMPILED[CREATOR]['hash']}
+        self.assertIsNone(self.cache.template(FakeAlgod(compiled), template_source(), MACRO))
+
+    def test_macro_not_found(self):
+        client = FakeAlgod(COMPILED)
+        self.assertIsNone(self.cache.template(client, template_source().replace(MACRO, CREATOR), MACRO))
+        self.assertEqual(client.compiles, 0)
+
+    def test_compile_error(self):
+        self.assertIsNone(self.cache.template(FakeAlgod({}), template_source(), MACRO))
+
+    def test_invalid_address(self):
+        stateless_template = self.cache.template(self.client, template_source(), MACRO)
+        with self.assertRaises(Exception):
+            stateless_template.address('NOTANADDRESS')
+
+
+class TealCompileCacheTest(unittest.TestCase):
+
+    def test_compiled_once_per_source(self):
+        client = FakeAlgod(COMPILED)
+        cache = TealCompileCache()
+        source = template_source().replace(MACRO, CREATOR)
+        self.assertEqual(cache.compile(client, source), COMPILED[CREATOR])
+        self.assertEqual(cache.compile(client, source), COMPILED[CREATOR])
+        self.assertEqual(client.compiles, 1)
+
+    def test_persisted(self):
+        source = template_source().replace(MACRO, CREATOR)
+        with tempfile.TemporaryDirectory() as folder:
+            TealCompileCache(folder).compile(FakeAlgod(COMPILED), source)
+
+            #   a new process sharing the folder does not call algod
+            client = FakeAlgod(COMPILED)
+            self.assertEqual(TealCompileCache(folder).compile(client, source), COMPILED[CREATOR])
+            self.assertEqual(client.compiles, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
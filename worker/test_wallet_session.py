@@ -0,0 +1,118 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Unit tests of WalletSession
+python -m unittest test_wallet_session     (from the worker folder)
+"""
+
+import unittest
+
+from algosdk import account
+from algosdk import mnemonic
+from algosdk.error import KMDHTTPError
+
+from wallet_session import WalletSession
+
+
+class FakeKMD():
+    """
+    in-memory kmd holding a single wallet; a handle is valid until expire is called
+    """
+
+    def __init__(self, expires_seconds: int = 60):
+        self.expires_seconds: int = expires_seconds
+        self.calls: dict = {}
+        self.released: list = []
+        self._handles: set = set()
+        self._keys: dict = {}
+
+    def __count(self, name: str):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def expire(self):
+        self._handles = set()
+
+    def list_wallets(self) -> list:
+        self.__count('list_wallets')
+        return [{'name': 'other', 'id': 'id-0'}, {'name': 'dop', 'id': 'id-1'}]
+
+    def init_wallet_handle(self, wallet_id: str, password: str) -> str:
+        self.__count('init_wallet_handle')
+        handle = 'handle-{}'.format(self.calls['init_wallet_handle'])
+        self._handles.add(handle)
+        return handle
+
+    def renew_wallet_handle(self, handle: str) -> dict:
+        self.__count('renew_wallet_handle')
+        if handle not in self._handles:
+            raise KMDHTTPError('handle does not exist')
+        return {'expires_seconds': self.expires_seconds}
+
+    def release_wallet_handle(self, handle: str) -> bool:
+        self.released.append(handle)
+        self._handles.discard(handle)
+        return True
+
+    def generate_key(self, handle: str, display_mnemonic: bool = True) -> str:
+        if handle not in self._handles:
+            raise KMDHTTPError('handle does not exist')
+        private_key, address = account.generate_account()
+        self._keys[address] = private_key
+        return address
+
+    def export_key(self, handle: str, password: str, address: str) -> str:
+        if handle not in self._handles:
+            raise KMDHTTPError('handle does not exist')
+        return self._keys[address]
+
+
+class WalletSessionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = FakeKMD()
+        self.session = WalletSession(self.client, 'dop', 'password')
+
+    def test_handle_shared(self):
+        self.assertEqual(self.session.wallet_id(), 'id-1')
+        for _ in range(3):
+            address = self.session.generate_key()
+            self.assertEqual(account.address_from_private_key(
+                mnemonic.to_private_key(self.session.export_mnemonic(address))), address)
+        self.assertEqual(self.client.calls, {'list_wallets': 1, 'init_wallet_handle': 1})
+
+    def test_handle_renewed(self):
+        #   the handle expires within RENEW_MARGIN: renewed instead of initialized again
+        session = WalletSession(self.client, 'dop', 'password', lifetime=WalletSession.RENEW_MARGIN / 2)
+        handle = session.handle()
+        self.assertEqual(session.handle(), handle)
+        self.assertEqual(self.client.calls['renew_wallet_handle'], 1)
+        self.assertEqual(self.client.calls['init_wallet_handle'], 1)
+        #   kmd reported the lifetime of the renewed handle: no more renewals
+        session.handle()
+        self.assertEqual(self.client.calls['renew_wallet_handle'], 1)
+
+    def test_handle_expired(self):
+        #   kmd restarted: the request is retried once with a new handle (and the wallet id resolved again)
+        self.session.generate_key()
+        self.client.expire()
+        self.session.generate_key()
+        self.assertEqual(self.client.calls['init_wallet_handle'], 2)
+        self.assertEqual(self.client.calls['list_wallets'], 2)
+
+    def test_wallet_not_found(self):
+        session = WalletSession(self.client, 'missing', 'password')
+        self.assertEqual(session.handle(), '')
+        with self.assertRaises(KeyError):
+            session.generate_key()
+
+    def test_close(self):
+        handle = self.session.handle()
+        self.session.close()
+        self.assertEqual(self.client.released, [handle])
+        self.session.close()
+        self.assertEqual(self.client.released, [handle])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,376 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Unit tests of workerAlgorand against an in-memory algod (no node required)
+python -m unittest test_worker_algorand     (from the worker folder)
+"""
+
+import base64
+import contextlib
+import io
+import threading
+import unittest
+
+from algosdk                     import account
+from algosdk                     import encoding
+from algosdk                     import mnemonic
+from algosdk.error               import AlgodHTTPError
+from algosdk.future              import transaction
+from algosdk.future.transaction  import PaymentTxn
+
+from worker_algorand import workerAlgorand
+from params_cache import SuggestedParamsProvider
+from confirmation_tracker import ConfirmationTracker
+from state_cache import LocalStateCache
+from state_cache import GlobalStateCache
+from state_cache import AccountCache
+
+
+class FakeAlgod():
+    """
+    in-memory algod: every transaction sent is confirmed in the next round
+    """
+
+    def __init__(self, approval_program: bytes = b'dop'):
+        self.approval_program = approval_program    #   approval program of the deployed contracts
+        self.groups: list = []                      #   the groups sent (lists of signed transactions)
+        self._round: int = 10
+        self._confirmed: dict = {}                  #   txid -> (confirmed round, application index)
+        self._app_id: int = 100
+        self._lock = threading.Lock()
+        self.state_reads: int = 0
+
+    def status(self) -> dict:
+        return {'last-round': self._round}
+
+    def status_after_block(self, round_number: int) -> dict:
+        with self._lock:
+            self._round = max(self._round, round_number + 1)
+            return {'last-round': self._round}
+
+    def algod_request(self, method: str, requrl: str, *args, **kwargs):
+        #   /blocks/{round}/txids
+        round_number = int(requrl.split('/')[2])
+        with self._lock:
+            return {'blockTxids': [txid for txid, (confirmed_round, _) in self._confirmed.items() if confirmed_round == round_number]}
+
+    def suggested_params(self) -> transaction.SuggestedParams:
+        return transaction.SuggestedParams(1000, self._round, self._round + 1000, 'SGFzaA==', 'test', False)
+
+    def compile(self, source: str) -> dict:
+        #   every program (and stateless account) is the same: the stateless address depends only on the creator
+        return {'result': base64.b64encode(b'dop').decode(), 'hash': encoding.encode_address(bytes(32))}
+
+    def account_application_info(self, address: str, app_id: int) -> dict:
+        with self._lock:
+            self.state_reads += 1
+        return {'round': self._round, 'app-local-state': {'id': app_id, 'key-value': []}}
+
+    def application_info(self, app_id: int) -> dict:
+        return {'id': app_id, 'params': {'approval-program': base64.b64encode(self.approval_program).decode()}}
+
+    def send_transactions(self, signed_txns: list) -> str:
+        with self._lock:
+            txids: list = [signed_txn.get_txid() for signed_txn in signed_txns]
+            if any(txid in self._confirmed for txid in txids):
+                raise AlgodHTTPError('transaction already in ledger', 400)
+            self.groups.append(signed_txns)
+            for signed_txn, txid in zip(signed_txns, txids):
+                app_id: int = 0
+                if isinstance(signed_txn.transaction, transaction.ApplicationCreateTxn):
+                    self._app_id += 1
+                    app_id = self._app_id
+                self._confirmed[txid] = (self._round + 1, app_id)
+        return signed_txns[0].get_txid()
+
+    def send_transaction(self, signed_txn) -> str:
+        return self.send_transactions([signed_txn])
+
+    def pending_transaction_info(self, txid: str) -> dict:
+        with self._lock:
+            confirmed_round, app_id = self._confirmed.get(txid, (0, 0))
+        if confirmed_round == 0 or confirmed_round > self._round:
+            return {'confirmed-round': 0, 'pool-error': ''}
+        return {'confirmed-round': confirmed_round, 'pool-error': '', 'application-index': app_id}
+
+
+class WorkerAlgorandTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = FakeAlgod()
+        self.worker = workerAlgorand()
+        self.worker.init('')
+        #   the connections of open are replaced by the in-memory algod
+        self.worker._i_algod_client = self.client
+        self.worker._i_params = SuggestedParamsProvider(self.client)
+        self.worker._i_tracker = ConfirmationTracker(self.client, self.worker._i_params.notify_round)
+        self.worker._i_tracker.start()
+        self.worker._i_teal_approval_program_path = __file__
+        self.worker._i_teal_clear_program_path = __file__
+        self.worker._i_stateless_teal_template_path = __file__
+        self.worker._i_teal_cache = None
+
+        private_key, self.publisher_address = account.generate_account()
+        self.publisher_passw = mnemonic.from_private_key(private_key)
+        self.subscribers: list = [account.generate_account()[1] for _ in range(6)]
+
+    def tearDown(self):
+        self.worker._i_tracker.stop()
+
+    def test_init_masks_secrets(self):
+        worker = workerAlgorand()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            worker.init('fndmne={};ownmne={};fndpol=low'.format(self.publisher_passw, self.publisher_passw))
+        self.assertNotIn(self.publisher_passw, out.getvalue())
+        self.assertIn('fndmne:[*****]', out.getvalue())
+        self.assertIn('fndpol:[low]', out.getvalue())
+        self.assertEqual(worker._i_config['fndmne'], self.publisher_passw)
+
+    def test_deposit_receiver_matches_linked(self):
+        #   the deposit branch of dop.stateful.teal compares gtxn 0 Receiver with global "linked"
+        linked_address = account.generate_account()[1]
+        params = self.client.suggested_params()
+        create_txn = workerAlgorand.stateful_create_txn(params, self.publisher_address, b'dop', b'clear', linked_address)
+        deposit_txn = PaymentTxn(self.subscribers[0], params, linked_address, 1000)
+        self.assertEqual(create_txn.dictify()['apaa'][0], deposit_txn.dictify()['rcv'])
+        self.assertEqual(encoding.encode_address(create_txn.app_args[0]), linked_address)
+
+    def test_grant_many_grouped(self):
+        txids, err = self.worker.grant_many('', self.publisher_passw, '7', self.subscribers)
+        self.assertFalse(err.isError())
+        self.assertEqual(len(txids), 2)
+        self.assertEqual([len(group) for group in self.client.groups], [2])
+
+    def test_grant_many_encoded_address(self):
+        #   the contract address returned by deploy_contract (%smart_contract_address%@%app_id%)
+        contract_address: str = encoding.encode_address(bytes(32)) + '@7'
+        txids, err = self.worker.grant_many('', self.publisher_passw, contract_address, self.subscribers)
+        self.assertFalse(err.isError())
+        self.assertTrue(all(signed_txn.transaction.index == 7 for signed_txn in self.client.groups[0]))
+        txid, err = self.worker.revoke('', self.publisher_passw, contract_address, self.subscribers[0])
+        self.assertFalse(err.isError())
+        txids, err = self.worker.grant_many('', self.publisher_passw, 'ADDR@x', self.subscribers)
+        self.assertEqual(err.code, 11)
+
+    def test_grant_many_legacy_contract(self):
+        #   contract deployed with a previous approval program: one account per call and per group
+        self.client.approval_program = b'dop 1.4'
+        txids, err = self.worker.grant_many('', self.publisher_passw, '7', self.subscribers)
+        self.assertFalse(err.isError())
+        self.assertEqual(len(txids), len(self.subscribers))
+        self.assertEqual([len(group) for group in self.client.groups], [1] * len(self.subscribers))
+        self.assertTrue(all(len(group[0].transaction.accounts) == 1 for group in self.client.groups))
+
+        self.worker.begin_transaction()
+        txids, err = self.worker.grant_many('', self.publisher_passw, '7', self.subscribers)
+        self.worker.rollback()
+        self.assertEqual(err.code, 218)
+
+    def test_transaction_legacy_contract(self):
+        #   the application calls to a contract deployed with a previous approval program are not buffered
+        self.client.approval_program = b'dop 1.4'
+        subscriber_private_key, _ = account.generate_account()
+        subscriber_psw = mnemonic.from_private_key(subscriber_private_key)
+
+        self.worker.begin_transaction()
+        err = self.worker.algorand_sub_optin(subscriber_psw, '7')
+        self.assertEqual(err.code, 218)
+        txid, err = self.worker.grant('', self.publisher_passw, '7', self.subscribers[0])
+        self.assertEqual(err.code, 218)
+        err = self.worker.commit()
+        self.assertFalse(err.isError())
+        self.assertEqual(self.client.groups, [])
+
+        #   outside a transaction each call is sent on its own
+        txid, err = self.worker.grant('', self.publisher_passw, '7', self.subscribers[0])
+        self.assertFalse(err.isError())
+        self.assertEqual([len(group) for group in self.client.groups], [1])
+
+    def test_grant_nowait(self):
+        handles: list = []
+        for subscriber in self.subscribers[:3]:
+            handle, err = self.worker.grant_nowait('', self.publisher_passw, '7', subscriber)
+            self.assertFalse(err.isError())
+            handles.append(handle)
+        self.assertEqual([len(group) for group in self.client.groups], [1, 1, 1])
+        for handle in handles:
+            pending_txn, err = handle.wait(10)
+            self.assertFalse(err.isError())
+            self.assertTrue(handle.done())
+            self.assertEqual(handle.confirmed_round, pending_txn['confirmed-round'])
+            self.assertEqual(handle.pool_error, '')
+
+        #   not available while a transaction is open
+        self.worker.begin_transaction()
+        handle, err = self.worker.grant_nowait('', self.publisher_passw, '7', self.subscribers[0])
+        self.worker.rollback()
+        self.assertIsNone(handle)
+        self.assertEqual(err.code, 212)
+
+    def test_own_transactions_invalidate_state(self):
+        tracker = self.worker._i_tracker
+        self.worker._i_state_cache = LocalStateCache(self.client, 4, tracker.current_round, tracker.notify_round)
+        self.worker._i_contract_cache = GlobalStateCache(self.client, tracker.current_round, tracker.notify_round)
+        self.worker._i_account_cache = AccountCache(self.client, 2, tracker.current_round, tracker.notify_round)
+        self.addCleanup(self.worker._i_account_cache.close)
+
+        for subscriber in self.subscribers[:2]:
+            response, err = self.worker.get_balance('', subscriber, '7')
+            self.assertFalse(err.isError())
+            self.worker.get_balance('', subscriber, '7')
+        self.assertEqual(self.client.state_reads, 2)
+
+        #   the grant touches the local state of the subscriber granted only
+        txid, err = self.worker.grant('', self.publisher_passw, '7', self.subscribers[0])
+        self.assertFalse(err.isError())
+        self.worker.get_balance('', self.subscribers[0], '7')
+        self.worker.get_balance('', self.subscribers[1], '7')
+        self.assertEqual(self.client.state_reads, 3)
+
+    def test_transaction_grouped(self):
+        self.worker.begin_transaction()
+        for subscriber in self.subscribers[:2]:
+            txid, err = self.worker.grant('', self.publisher_passw, '7', subscriber)
+            self.assertFalse(err.isError())
+        err = self.worker.commit()
+        self.assertFalse(err.isError())
+        self.assertEqual([len(group) for group in self.client.groups], [2])
+        self.assertEqual(len(self.worker.committed_txids()), 2)
+
+    def test_shared_across_threads(self):
+        #   one worker, many threads: each thread has its own transaction buffer
+        committed: dict = {}
+        errors: list = []
+
+        def sender(index: int):
+            subscribers: list = [account.generate_account()[1] for _ in range(2)]
+            self.worker.begin_transaction()
+            for subscriber in subscribers:
+                txid, err = self.worker.grant('', self.publisher_passw, '7', subscriber)
+                errors.append(err)
+            errors.append(self.worker.commit())
+            committed[index] = (subscribers, self.worker.committed_txids())
+            #   outside the transaction the calls of the thread are sent on their own
+            txid, err = self.worker.revoke('', self.publisher_passw, '7', subscribers[0])
+            errors.append(err)
+
+        threads: list = [threading.Thread(target=sender, args=(index,)) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(30)
+        self.assertTrue(all(not err.isError() for err in errors))
+        self.assertEqual(sorted(len(group) for group in self.client.groups), [1] * 8 + [2] * 8)
+
+        #   every committed group holds the grants of a single thread
+        groups: dict = {tuple(signed_txn.get_txid() for signed_txn in group): group for group in self.client.groups}
+        for subscribers, txids in committed.values():
+            group = groups[tuple(txids)]
+            self.assertEqual([signed_txn.transaction.accounts for signed_txn in group], [[subscriber] for subscriber in subscribers])
+        txids: list = [signed_txn.get_txid() for group in self.client.groups for signed_txn in group]
+        self.assertEqual(len(set(txids)), 24)
+
+    def test_configuration_read_only_while_open(self):
+        self.worker._i_open = True
+        self.addCleanup(setattr, self.worker, '_i_open', False)
+        self.assertEqual(self.worker.init('').code, 36)
+        self.assertEqual(self.worker.open().code, 37)
+
+    def test_set_starting_balances_duplicates(self):
+        #   the same (address, amount) twice in a batch and again in a later call
+        owner_private_key, _ = account.generate_account()
+        self.worker._own_mnemonic = mnemonic.from_private_key(owner_private_key)
+        balances: list = [(self.subscribers[0], 100000)] * 3
+        results, err = self.worker.set_starting_balances(balances)
+        self.assertFalse(err.isError())
+        self.assertTrue(all(not item_err.isError() for _, item_err in results))
+        txid = self.worker.set_starting_balance(self.subscribers[0], 100000)
+        self.assertNotEqual(txid, "")
+        txid = self.worker.set_starting_balance(self.subscribers[0], 100000)
+        self.assertNotEqual(txid, "")
+        txids: list = [signed_txn.get_txid() for group in self.client.groups for signed_txn in group]
+        self.assertEqual(len(txids), 5)
+        self.assertEqual(len(set(txids)), 5)
+
+    def test_onboard_subscriber(self):
+        owner_private_key, _ = account.generate_account()
+        self.worker._own_mnemonic = mnemonic.from_private_key(owner_private_key)
+        subscriber_private_key, _ = account.generate_account()
+        subscriber_psw = mnemonic.from_private_key(subscriber_private_key)
+
+        txid, err = self.worker.onboard_subscriber('', subscriber_psw, '7', 100000)
+        self.assertFalse(err.isError())
+        self.assertEqual([len(group) for group in self.client.groups], [3])
+        self.assertEqual(txid, self.client.groups[0][-1].get_txid())
+
+    def test_onboard_offboard_encoded_address(self):
+        #   the contract address returned by deploy_contract (%smart_contract_address%@%app_id%)
+        owner_private_key, _ = account.generate_account()
+        self.worker._own_mnemonic = mnemonic.from_private_key(owner_private_key)
+        subscriber_private_key, _ = account.generate_account()
+        subscriber_psw = mnemonic.from_private_key(subscriber_private_key)
+        contract_address: str = self.subscribers[0] + '@7'
+
+        txid, err = self.worker.onboard_subscriber('', subscriber_psw, contract_address, 100000)
+        self.assertFalse(err.isError())
+        txid, err = self.worker.offboard_subscriber('', subscriber_psw, contract_address, self.publisher_address)
+        self.assertFalse(err.isError())
+        self.assertEqual([len(group) for group in self.client.groups], [3, 3])
+        self.assertEqual(self.client.groups[1][0].transaction.index, 7)
+
+        txid, err = self.worker.onboard_subscriber('', subscriber_psw, 'ADDRESS@seven', 100000)
+        self.assertEqual(err.code, 11)
+
+    def test_onboard_subscriber_legacy_contract(self):
+        #   previous approval programs reject groups of 3: the transactions are sent one at a time
+        self.client.approval_program = b'dop 1.4'
+        owner_private_key, _ = account.generate_account()
+        self.worker._own_mnemonic = mnemonic.from_private_key(owner_private_key)
+        subscriber_private_key, _ = account.generate_account()
+        subscriber_psw = mnemonic.from_private_key(subscriber_private_key)
+
+        txid, err = self.worker.onboard_subscriber('', subscriber_psw, '7', 100000)
+        self.assertFalse(err.isError())
+        self.assertEqual([len(group) for group in self.client.groups], [1, 1, 1])
+        self.assertTrue(all(group[0].transaction.fee > 0 for group in self.client.groups))
+        self.assertEqual(txid, self.client.groups[-1][0].get_txid())
+
+        self.worker.begin_transaction()
+        txid, err = self.worker.onboard_subscriber('', subscriber_psw, '7', 100000)
+        self.worker.rollback()
+        self.assertEqual(err.code, 218)
+
+    def test_set_keys_legacy_contracts(self):
+        #   the calls to 1.5 contracts are grouped, the calls to older contracts are sent alone
+        self.worker._i_grouped_apps[9] = False
+        keys: list = [(7, 'k7', '1'), (9, 'k9', '1'), (8, 'k8', '1')]
+        results, err = self.worker.set_keys('', self.publisher_passw, keys)
+        self.assertFalse(err.isError())
+        self.assertEqual(len(results), len(keys))
+        self.assertTrue(all(confirmed_round > 0 for confirmed_round, _ in results))
+        self.assertEqual(sorted(len(group) for group in self.client.groups), [1, 2])
+        single = [group for group in self.client.groups if len(group) == 1][0]
+        self.assertEqual(single[0].transaction.index, 9)
+
+    def test_deploy_contracts_same_publisher(self):
+        #   same publisher, same params: the notes keep the transactions (and their ids) distinct
+        owner_private_key, _ = account.generate_account()
+        self.worker._own_mnemonic = mnemonic.from_private_key(owner_private_key)
+        contracts: list = [(self.publisher_address, self.publisher_passw, 0, 0)] * 2
+        results, err = self.worker.deploy_contracts(contracts, 100000)
+        self.assertFalse(err.isError())
+        self.assertEqual(len({contract for contract, _ in results}), 2)
+        txids: list = [signed_txn.get_txid() for group in self.client.groups for signed_txn in group]
+        self.assertEqual(len(txids), 4)
+        self.assertEqual(len(set(txids)), 4)
+
+        contract, err = self.worker.deploy_contract(self.publisher_address, self.publisher_passw, 0, 0)
+        self.assertFalse(err.isError())
+        contract, err = self.worker.deploy_contract(self.publisher_address, self.publisher_passw, 0, 0)
+        self.assertFalse(err.isError())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+Unit tests of AsyncWorkerAlgorand (on top of an in-memory transport)
+python -m unittest test_worker_algorand_async     (from the worker folder)
+"""
+
+import io
+import json
+import base64
+import asyncio
+import unittest
+
+import msgpack
+
+from algosdk                     import account
+from algosdk                     import encoding
+from algosdk                     import mnemonic
+from algosdk.future              import transaction
+
+from async_transport import AsyncAlgodClient
+from fee_policy import FeePolicy
+from teal_cache import TealCompileCache
+from worker_algorand_async import AsyncWorkerAlgorand
+from worker_algorand_async import _AsyncConfirmationTracker
+
+
+class MemoryTransport():
+    """
+    in-memory algod behind AsyncHTTPTransport.request: every transaction sent is confirmed in the next round
+    """
+
+    def __init__(self, approval_program: bytes = b'dop'):
+        self.approval_program = approval_program    #   approval program of the deployed contracts
+        self.groups: list = []                      #   the groups sent (lists of signed transactions)
+        self._round: int = 10
+        self._confirmed: dict = {}                  #   txid -> confirmed round
+
+    async def close(self):
+        pass
+
+    async def request(self, method: str, path: str, headers: dict = None, body: bytes = None,
+                      timeout: float = None, limited: bool = True):
+        path = path.split('?')[0]
+        if path == '/v2/status':
+            return self.__json({'last-round': self._round})
+        if path.startswith('/v2/status/wait-for-block-after/'):
+            await asyncio.sleep(0.01)
+            self._round = max(self._round, int(path.split('/')[-1]) + 1)
+            return self.__json({'last-round': self._round})
+        if path == '/versions':
+            return self.__json({'build': {'major': 3, 'minor': 0, 'build_number': 0, 'commit_hash': 'test'}})
+        if path == '/v2/transactions/params':
+            return self.__json({'fee': 0, 'min-fee': 1000, 'last-round': self._round, 'genesis-hash': 'SGFzaA==',
+                'genesis-id': 'test', 'consensus-version': 'test'})
+        if path == '/v2/teal/compile':
+            #   every program is the same (see test_worker_algorand.FakeAlgod)
+            return self.__json({'result': base64.b64encode(b'dop').decode(), 'hash': encoding.encode_address(bytes(32))})
+        if path.startswith('/v2/applications/'):
+            return self.__json({'id': int(path.split('/')[-1]),
+                'params': {'approval-program': base64.b64encode(self.approval_program).decode()}})
+        if path.startswith('/v2/blocks/') and path.endswith('/txids'):
+            round_number = int(path.split('/')[3])
+            return self.__json({'blockTxids': [txid for txid, r in self._confirmed.items() if r == round_number]})
+        if path.startswith('/v2/transactions/pending/'):
+            confirmed_round = self._confirmed.get(path.split('/')[-1], 0)
+            if confirmed_round == 0 or confirmed_round > self._round:
+                return self.__json({'confirmed-round': 0, 'pool-error': ''})
+            return self.__json({'confirmed-round': confirmed_round, 'pool-error': ''})
+        if path == '/v2/transactions' and method == 'POST':
+            return self.__send(body)
+        return 404, b'{"message": "not found"}'
+
+    def __send(self, body: bytes):
+        signed_txns: list = [transaction.SignedTransaction.undictify(obj)
+            for obj in msgpack.Unpacker(io.BytesIO(body), raw=False, strict_map_key=False)]
+        txids: list = [signed_txn.get_txid() for signed_txn in signed_txns]
+        if any(txid in self._confirmed for txid in txids):
+            return 400, b'{"message": "transaction already in ledger"}'
+        self.groups.append(signed_txns)
+        for txid in txids:
+            self._confirmed[txid] = self._round + 1
+        return self.__json({'txId': txids[0]})
+
+    @staticmethod
+    def __json(response: dict):
+        return 200, json.dumps(response).encode('utf-8')
+
+
+class AsyncWorkerAlgorandTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.transport = MemoryTransport()
+        self.worker = AsyncWorkerAlgorand()
+        self.worker.init('')
+        #   the connections of open are replaced by the in-memory transport
+        self.worker._i_algod_client = AsyncAlgodClient('', 'http://localhost', self.transport)
+        self.worker._i_params_lock = asyncio.Lock()
+        self.worker._i_fee_policy = FeePolicy(None, 10000)
+        self.worker._i_teal_cache = TealCompileCache()
+        self.worker._i_teal_cache.set_algod_build(await self.worker._i_algod_client.versions())
+        self.worker._i_tracker = _AsyncConfirmationTracker(self.worker._i_algod_client)
+        self.worker._i_tracker.start()
+        self.worker._i_worker._i_teal_approval_program_path = __file__
+
+        private_key, self.publisher_address = account.generate_account()
+        self.publisher_passw = mnemonic.from_private_key(private_key)
+        self.subscribers: list = [account.generate_account()[1] for _ in range(6)]
+        self.contract_address = encoding.encode_address(bytes(32)) + '@7'
+
+    async def asyncTearDown(self):
+        await self.worker._i_tracker.stop()
+
+    async def test_grant_many_encoded_address(self):
+        txids, err = await self.worker.grant_many('', self.publisher_passw, self.contract_address, self.subscribers)
+        self.assertFalse(err.isError())
+        self.assertEqual(len(txids), 2)
+        self.assertEqual([len(group) for group in self.transport.groups], [2])
+        self.assertTrue(all(signed_txn.transaction.index == 7 for signed_txn in self.transport.groups[0]))
+
+        txid, err = await self.worker.revoke('', self.publisher_passw, self.contract_address, self.subscribers[0])
+        self.assertFalse(err.isError())
+        self.assertEqual(self.transport.groups[-1][0].transaction.index, 7)
+
+        txids, err = await self.worker.grant_many('', self.publisher_passw, 'ADDR@x', self.subscribers)
+        self.assertEqual(err.code, 11)
+
+    async def test_grant_many_legacy_contract(self):
+        #   contract deployed with a previous approval program: one account per call and per group
+        self.transport.approval_program = b'dop 1.4'
+        txids, err = await self.worker.grant_many('', self.publisher_passw, self.contract_address, self.subscribers)
+        self.assertFalse(err.isError())
+        self.assertEqual([len(group) for group in self.transport.groups], [1] * len(self.subscribers))
+
+    async def test_transaction_legacy_contract(self):
+        self.transport.approval_program = b'dop 1.4'
+        self.worker.begin_transaction()
+        txid, err = await self.worker.grant('', self.publisher_passw, '7', self.subscribers[0])
+        self.assertEqual(err.code, 218)
+        txids, err = await self.worker.grant_many('', self.publisher_passw, '7', self.subscribers)
+        self.assertEqual(err.code, 218)
+        err = await self.worker.commit()
+        self.assertFalse(err.isError())
+        self.assertEqual(self.transport.groups, [])
+
+    async def test_transaction_grouped(self):
+        self.worker.begin_transaction()
+        for subscriber in self.subscribers[:2]:
+            txid, err = await self.worker.grant('', self.publisher_passw, '7', subscriber)
+            self.assertFalse(err.isError())
+        err = await self.worker.commit()
+        self.assertFalse(err.isError())
+        self.assertEqual([len(group) for group in self.transport.groups], [2])
+        self.assertEqual(len(self.worker.committed_txids()), 2)
+
+    async def test_set_starting_balance_duplicates(self):
+        owner_private_key, _ = account.generate_account()
+        self.worker._own_mnemonic = mnemonic.from_private_key(owner_private_key)
+        txids: list = await asyncio.gather(*[self.worker.set_starting_balance(self.subscribers[0], 100000) for _ in range(3)])
+        self.assertTrue(all(txid != "" for txid in txids))
+        self.assertEqual(len(set(txids)), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+KMD wallet session: cached wallet id and a single (renewed) wallet handle
+"""
+import time
+import threading
+
+import algosdk                                      #   better type support (not necessary)
+from    algosdk                     import mnemonic
+
+
+class WalletSession():
+    """
+    the wallet id is resolved once and a single wallet handle is shared by all the callers:
+    the handle is renewed (renew_wallet_handle) when it is about to expire and released on close
+    if the handle expired anyway (kmd restarted, worker idle for longer than the handle lifetime)
+    a new handle is initialized and the request is retried once
+    """
+
+    RENEW_MARGIN: float = 10.0                      #   the handle is renewed when it expires within RENEW_MARGIN seconds
+
+    def __init__(
+        self,
+        client: algosdk.kmd.KMDClient,
+        wallet_name: str,
+        wallet_password: str,
+        lifetime: float = 60.0                      #   handle lifetime assumed until kmd reports it (kmd default: 60 seconds)
+        ):
+        self._client = client
+        self._wallet_name: str = wallet_name
+        self._wallet_password: str = wallet_password
+        self._lifetime: float = lifetime
+
+        self._lock = threading.Lock()
+        self._wallet_id: str = ''
+        self._handle: str = ''
+        self._expires: float = 0.0                  #   monotonic time the handle expires at
+
+    def wallet_id(self) -> str:
+        """
+        returns the id of the wallet (empty string if there is no wallet named wallet_name)
+        exceptions raised by the client are propagated
+        """
+        if self._wallet_id != '':
+            return self._wallet_id
+
+        for wallet in self._client.list_wallets():
+            if wallet.get("name") == self._wallet_name:
+                self._wallet_id = wallet.get("id")
+                break
+        return self._wallet_id
+
+    def handle(self) -> str:
+        """
+        returns a valid wallet handle (empty string if the wallet does not exist)
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._handle != '' and now < self._expires - self.RENEW_MARGIN:
+                return self._handle
+
+            if self._handle != '' and now < self._expires:
+                try:
+                    renewed = self._client.renew_wallet_handle(self._handle)
+                    self._expires = now + float(renewed.get('expires_seconds', self._lifetime))
+                    return self._handle
+                except Exception:
+                    #   not valid anymore: a new handle is initialized
+                    pass
+
+            self._handle = ''
+            wallet_id = self.wallet_id()
+            if wallet_id == '':
+                return ''
+            self._handle = self._client.init_wallet_handle(wallet_id, self._wallet_password)
+            self._expires = now + self._lifetime
+            return self._handle
+
+    def __invalidate(self, handle: str):
+        #   private method
+        with self._lock:
+            if self._handle == handle:
+                self._handle = ''
+                self._expires = 0.0
+                #   kmd might have failed over to another node (see BalancedKMDClient): the wallet id is resolved again
+                self._wallet_id = ''
+
+    def __call(self, request):
+        #   private method
+        #   runs request(handle), retrying once with a new handle
+        handle = self.handle()
+        if handle == '':
+            raise KeyError('wallet not found: ' + self._wallet_name)
+        try:
+            return request(handle)
+        except algosdk.error.KMDHTTPError:
+            self.__invalidate(handle)
+            handle = self.handle()
+            return request(handle)
+
+    def generate_key(self) -> str:
+        """
+        creates a new account in the wallet and returns its address
+        """
+        return self.__call(lambda handle: self._client.generate_key(handle, False))
+
+    def export_mnemonic(self, address: str) -> str:
+        """
+        returns the mnemonic of the private key of the account address
+        """
+        account_key = self.__call(
+            lambda handle: self._client.export_key(handle, self._wallet_password, address))
+        return mnemonic.from_private_key(account_key)
+
+    def close(self):
+        with self._lock:
+            handle = self._handle
+            self._handle = ''
+            self._expires = 0.0
+        if handle != '':
+            try:
+                self._client.release_wallet_handle(handle)
+            except Exception:
+                pass
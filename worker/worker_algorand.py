@@ -3,8 +3,15 @@
 #   date:   24/10/2022
 #   author: georgiana-bud
 import os
+import time
+import sqlite3
+import copy
+import types
 import base64
-from typing import Tuple, Type, Optional, Union
+import tempfile
+import threading
+import concurrent.futures
+from typing import Callable, Tuple, Type, Optional, Union
 
 
  
@@ -20,8 +27,8 @@ from typing import Tuple, Type, Optional, Union
 import  algosdk                                      #   better type support (not necessary)                
 from    algosdk                     import mnemonic                                  
 from    algosdk                     import account
+from    algosdk                     import encoding
 from    algosdk.v2client            import algod
-from    algosdk.wallet              import Wallet
 from    algosdk                     import kmd
 from    algosdk.future              import transaction
 from    algosdk.future.transaction  import PaymentTxn
@@ -31,6 +38,31 @@ from    algosdk.future.transaction  import ApplicationOptInTxn
 from    algosdk.future.transaction  import ApplicationCloseOutTxn
 
 from error import DopError 
+from teal_cache import TealCompileCache
+from params_cache import SuggestedParamsProvider
+from fee_policy import FeePolicy
+from admission import AdmissionController
+from admission import AdmissionRejected
+from confirmation_tracker import ConfirmationTracker
+from confirmation_tracker import OperationHandle
+from http_pool import HTTPConnectionPool
+from http_pool import PooledAlgodClient
+from http_pool import PooledKMDClient
+from load_balancer import Endpoint
+from load_balancer import EndpointBalancer
+from load_balancer import BalancedAlgodClient
+from load_balancer import BalancedKMDClient
+from wallet_session import WalletSession
+from account_pool import AccountPool
+from funder_pool import Funder
+from funder_pool import FunderPool
+from state_cache import LocalStateCache
+from state_cache import GlobalStateCache
+from state_cache import AccountCache
+from grant_index import GrantIndex
+from block_follower import BlockFollower
+from event_stream import EventStream
+from event_stream import DopEvent
 
 #   class workerAlgorand
 #   the following methods have to be implemented
@@ -41,31 +73,103 @@ from error import DopError
 #   (x) create_user
 #   (x) deploy_contract
 #   (x) get_wallet_balance
+#   (x) get_wallet_balances     NOTE:   many accounts (amount, min balance, applications), cached per round
 #   (x) subscribe
 #   (x) unsubscribe
 #   balance                 NOTE:   not in first implementation
-#   (x) get_balance         NOTE:   not fully implemented (product related balance)
-#   admin_get_grants        NOTE:   not in first implementation - to be moved to chain 2 (offchain)
+#   (x) get_balance         NOTE:   read from the local state of the subscriber (credit and debit not on chain yet)
+#   (x) admin_get_grants    NOTE:   read from the local grant index kept by the block follower (bfdb)
+#   (x) get_subscribers     NOTE:   Algorand specific - subscribers of a contract (grant index)
+#   (x) add_event_listener  NOTE:   Algorand specific - events of the DOP transactions (block follower), see also event_queue
 #   get_receipt             NOTE:   to be removed - to be considered a private/provider specific method
 #   set_starting_balance    
+#   (x) set_starting_balances   NOTE:   many accounts funded with grouped payments (pooled fees)
+#   (x) deploy_contracts        NOTE:   many contracts created with grouped creations (optionally funded)
+#   (x) onboard_subscriber      NOTE:   Algorand specific - payment + optin + subscribe in a single group
+#   (x) offboard_subscriber     NOTE:   Algorand specific - unsubscribe + optout (+ account closing) in a single group
 #   (x) grant
 #   (x) revoke
+#   (x) grant_many          NOTE:   Algorand specific - many subscribers granted in a single submission
+#   (x) revoke_many         NOTE:   Algorand specific
+#   (x) get_contract_state  NOTE:   Algorand specific - global state (key, kid, linked, creator) without transactions
+#   (x) set_keys            NOTE:   Algorand specific - key rotation over many contracts (grouped setkey calls)
+#   (x) *_nowait            NOTE:   non blocking versions of subscribe, unsubscribe, grant, revoke,
+#                                   algorand_sub_optin, algorand_sub_optout and set_starting_balance
+
+
+class _Operation():
+    """
+    a transaction ready to be signed and sent, along with the errors to be returned
+    if the transaction can not be sent or is not confirmed
+    """
+    def __init__(self, txn: transaction.Transaction, private_key: str, send_error: DopError, wait_error: DopError):
+        self.txn = txn
+        self.private_key: str = private_key
+        self.send_error: DopError = send_error
+        self.wait_error: DopError = wait_error
 
 
 class workerAlgorand():
+
+    MAX_GROUP_SIZE: int = 16            #   max number of transactions in an atomic group (protocol limit)
+    MAX_APP_ACCOUNTS: int = 4           #   max number of foreign accounts in an application call (protocol limit)
+    ADMISSION_RETRY_SECONDS: float = 1.0    #   pause before sending again the transactions rejected by a full pool
+    SECRET_PARAMETERS: tuple = ('usrwpwd', 'ownmne', 'fndmne')     #   never printed (see init)
     
     def __init__ (self):
-        pass
+        #   open and close are serialized (see open)
+        self._i_lock            = threading.RLock()
+        self._i_open: bool      = False
 
 
     def begin_transaction(self) -> DopError:
+        """
+        Opens a buffer (per calling thread) collecting the transactions of the following
+        operations (subscribe, unsubscribe, grant, revoke, grant_many, revoke_many,
+        algorand_sub_optin, algorand_sub_optout, set_starting_balance) until commit or rollback
+        NOTE:   while the buffer is open the operations are not sent: they return an empty
+                transaction id (the id depends on the group the transaction is assigned to
+                at commit time - see committed_txids); the transactions of each operation
+                are kept in the same atomic group (see pack_groups)
+        NOTE:   the contracts deployed with dop.stateful.teal before version 1.5 reject the
+                groups: their application calls can not be buffered (error 218)
+        """
+        if getattr(self._i_local, 'buffer', None) is not None:
+            return DopError(210,"A transaction is already open.")
+        self._i_local.buffer = []
+        self._i_local.txids = []
         return DopError(0,"")
 
     def rollback(self) -> DopError:
+        """
+        Discards the buffered transactions (nothing has been sent)
+        """
+        self._i_local.buffer = None
         return DopError(0,"")
 
     def commit(self) -> DopError:
-        return DopError(0,"")
+        """
+        Sends the buffered operations as atomic groups (see pack_groups) and waits
+        once for their confirmation; without an open buffer commit does nothing
+        """
+        buffer: list = getattr(self._i_local, 'buffer', None)
+        self._i_local.buffer = None
+        if not buffer:
+            return DopError(0,"")
+
+        txids, err = self.__send_groups(
+            buffer
+        ,   DopError(211,"An exception occurred when sending the transaction groups.")
+        ,   DopError(308,"An exception occurred while waiting for confirmation of the transaction groups.")
+        )
+        self._i_local.txids = txids
+        return err
+
+    def committed_txids(self) -> list:
+        """
+        returns the ids of the transactions sent by the last commit (of the calling thread)
+        """
+        return list(getattr(self._i_local, 'txids', []))
 
     def __wallet_id(
         self,
@@ -75,39 +179,15 @@ class workerAlgorand():
         """
             returns the wallet id of the wallet named wallet_name
         """
-        if self._i_kmd_client == None:
+        if self._i_kmd_client == None or self._i_wallet_session == None:
             return "",DopError(2,"Missing value for kmd client.")
 
-        wallets = self._i_kmd_client.list_wallets()
-        for arrayitem in wallets:
-            if arrayitem.get("name") == wallet_name:
-                walletid = arrayitem.get("id")
-                return walletid,DopError(0,'')
-                break
+        #   the wallet id is retrieved (list_wallets) once and cached by the wallet session
+        walletid = self._i_wallet_session.wallet_id()
+        if walletid != '':
+            return walletid,DopError(0,'')
         return '',DopError(101,"The wallet id for the specified wallet name could not be retrieved.")
 
-    def __account_mnemonic(
-        self,
-        wallet_name: str,
-        wallet_password: str,
-        account_address: str
-        ) -> Tuple[str, DopError]:
-
-        if self._i_kmd_client == None:
-            return "",DopError(2,"Missing value for kmd client.")
-
-        err: DopError
-        wallet_id, err = self.__wallet_id(wallet_name)
-        if err.isError():
-            return "",err
-
-        wallet_handle = self._i_kmd_client.init_wallet_handle(wallet_id, wallet_password)
-        account_key = self._i_kmd_client.export_key(wallet_handle, wallet_password, account_address )
-        key_mnemonic = mnemonic.from_private_key(account_key)
-
-        #   check for error, exceptions, etc.
-        return key_mnemonic, DopError(0,"")
-
 
 
 
@@ -116,6 +196,7 @@ class workerAlgorand():
         client: algosdk.v2client.algod.AlgodClient
     ,   teal_template_path: str                 #   the absolute path of the teal contract template
     ,   creator_address: str                    #   the address of the creator of the smart contract
+    ,   compile_cache: TealCompileCache = None  #   if provided, the compile results are cached
         ) -> Tuple[str, DopError]:
         """
             creates the stateless smart contract
@@ -134,18 +215,37 @@ class workerAlgorand():
 
         #   read the template
         teal_template: str = ""
-        try:
-            with open(teal_template_path, 'r', encoding='utf-8') as f:
-                teal_template = f.read()
-        except Exception:
-            return "",DopError(3,"Teal template file not found.")
+        if compile_cache is not None:
+            teal_template = compile_cache.source(teal_template_path)
+            if teal_template is None:
+                return "",DopError(3,"Teal template file not found.")
+        else:
+            try:
+                with open(teal_template_path, 'r', encoding='utf-8') as f:
+                    teal_template = f.read()
+            except Exception:
+                return "",DopError(3,"Teal template file not found.")
+
+        #   the bytecode of the stateless contract differs only in the 32 bytes of the creator
+        #   address, so (when a compile cache is provided) the template is compiled once and
+        #   the address is computed locally - no compile round trip per creator
+        if compile_cache is not None:
+            stateless_template = compile_cache.template(client, teal_template, '_RECEIVERADDRESS_')
+            if stateless_template is not None:
+                try:
+                    return stateless_template.address(creator_address),DopError(0,"")
+                except Exception:
+                    return "",DopError(4,"Error compiling teal source.")
 
         #   now the _RECEIVERADDRESS_ nacro has to be substituted with creator_address
         teal_source = teal_template.replace('_RECEIVERADDRESS_', creator_address)
 
         
         try:
-            compile_response = client.compile(teal_source)
+            if compile_cache is not None:
+                compile_response = compile_cache.compile(client, teal_source)
+            else:
+                compile_response = client.compile(teal_source)
             #   return base64.b64decode(compile_response['result'])
             #   compile_response example
             #   {
@@ -163,6 +263,39 @@ class workerAlgorand():
         #           check if the stateless smart contract needs to be immediately funded
         return smart_contract_address,DopError(0,"")
 
+    @staticmethod
+    def teal_program(
+        client: algosdk.v2client.algod.AlgodClient
+    ,   teal_path: str                          #   the absolute path of the teal source
+    ,   compile_cache: TealCompileCache = None  #   if provided, the compile results are cached
+        ) -> Tuple[bytes, DopError]:
+        """
+            reads and compiles the teal source file
+            if successful   -> returns the compiled program (bytecode)
+            otherwise       -> returns empty bytes
+        """
+        teal_source: str = ""
+        if compile_cache is not None:
+            teal_source = compile_cache.source(teal_path)
+            if teal_source is None:
+                return b"",DopError(3,"Teal file not found.")
+        else:
+            try:
+                with open(teal_path, 'r', encoding='utf-8') as f:
+                    teal_source = f.read()
+            except Exception:
+                return b"",DopError(3,"Teal file not found.")
+
+        try:
+            if compile_cache is not None:
+                compile_response = compile_cache.compile(client, teal_source)
+            else:
+                compile_response = client.compile(teal_source)
+        except Exception:
+            return b"",DopError(4,"Error compiling teal source.")
+
+        return base64.b64decode(compile_response['result']),DopError(0,"")
+
     @staticmethod
     def dop_stateful_create(
         client: algosdk.v2client.algod.AlgodClient
@@ -171,6 +304,9 @@ class workerAlgorand():
     ,   creator_address: str
     ,   creator_private_key: str
     ,   smart_contract_address: str                     #   address of the stateless smart contract
+    ,   compile_cache: TealCompileCache = None          #   if provided, the compile results are cached
+    ,   params: transaction.SuggestedParams = None      #   if not provided, the suggested params are requested to algod
+    ,   note: bytes = None                              #   note of the creation transaction
         ) -> Tuple[str, DopError]:
         """
             creates the stateful smart contract
@@ -181,43 +317,56 @@ class workerAlgorand():
         #ApplicationCreateTxn
 
         #   get and compile the clear program
-        teal_clear_source: str = ""
-        try:
-            with open(teal_clear_program_path, 'r', encoding='utf-8') as f:
-                teal_clear_source = f.read()
-        except Exception:
-            return "",DopError(5,"Teal clear file not found.")
+        clear_program, err = workerAlgorand.teal_program(client, teal_clear_program_path, compile_cache)
+        if err.isError():
+            return "",DopError(5,"Teal clear file not found.") if err.code == 3 else err
 
-        compile_response = client.compile(teal_clear_source)            
-        clear_program = base64.b64decode(compile_response['result'])
 
+        #   get and compile the approval program
+        approval_program, err = workerAlgorand.teal_program(client, teal_approval_program_path, compile_cache)
+        if err.isError():
+            return "",DopError(6,"Teal approval file not found.") if err.code == 3 else err
 
-        # declare on_complete as NoOp
-        on_complete = transaction.OnComplete.NoOpOC.real
+        if params is None:
+            params = client.suggested_params()
+            params.flat_fee = True
+            params.fee = 1000
 
-        #   get and compile the approval program
-        teal_approval_source: str = ""
-        try:
-            with open(teal_approval_program_path, 'r', encoding='utf-8') as f:
-                teal_approval_source = f.read()
-        except Exception:
-            return "",DopError(6,"Teal approval file not found.")
+        unsigned_txn = workerAlgorand.stateful_create_txn(params, creator_address, approval_program, clear_program, smart_contract_address, note)
+        # sign transaction
+        signed_txn = unsigned_txn.sign(creator_private_key)
+        txn_id = signed_txn.transaction.get_txid()
 
-        compile_response = client.compile(teal_approval_source) 
-        approval_program = base64.b64decode(compile_response['result'])           
+        #   send transaction
+        try: 
+            client.send_transactions([signed_txn])    
+        except Exception as err:
+            return txn_id, DopError(120, f"An error occurred while creating stateful \
+                smart contract.")
+        return (txn_id,DopError(0,""))
 
-        params = client.suggested_params()
-        params.flat_fee = True
-        params.fee = 1000
+    @staticmethod
+    def stateful_create_txn(
+        params: transaction.SuggestedParams
+    ,   creator_address: str
+    ,   approval_program: bytes
+    ,   clear_program: bytes
+    ,   smart_contract_address: str                     #   address of the stateless smart contract
+    ,   note: bytes = None                              #   note of the transaction
+        ) -> ApplicationCreateTxn:
+        """
+            builds the (unsigned) creation transaction of the stateful smart contract
+            NOTE:   the stateless account depends only on the creator: the creations of two contracts
+                    of the same creator with the same params differ only by the note (see deploy_contracts)
+        """
+        # declare on_complete as NoOp
+        on_complete = transaction.OnComplete.NoOpOC.real
 
         #compile_result = base64.b64decode(compile_response['result'])
         
-        smart_contract_arguments = {
-            "args":     [smart_contract_address]    #   list of app arguments (goal app create --app-arg)
-#       ,   "addrs":    [subscriber_address]        #   list of account arguments
-        }
-
-        app_args: list   = workerAlgorand.getArgs(smart_contract_arguments)
+        #   the stateless smart contract address is passed decoded (32 bytes): the approval program
+        #   compares it with the Receiver of the deposit payments (see dop.stateful.teal)
+        app_args: list   = [encoding.decode_address(smart_contract_address)]
 
         # declare application state storage (immutable)
         local_ints      = 5
@@ -229,18 +378,7 @@ class workerAlgorand():
         global_schema   = transaction.StateSchema(global_ints, global_bytes)
         local_schema    = transaction.StateSchema(local_ints, local_bytes)
 
-        unsigned_txn = ApplicationCreateTxn(creator_address, params, on_complete, approval_program, clear_program, global_schema, local_schema, app_args)
-        # sign transaction
-        signed_txn = unsigned_txn.sign(creator_private_key)
-        txn_id = signed_txn.transaction.get_txid()
-
-        #   send transaction
-        try: 
-            client.send_transactions([signed_txn])    
-        except Exception as err:
-            return txn_id, DopError(120, f"An error occurred while creating stateful \
-                smart contract.")
-        return (txn_id,DopError(0,""))
+        return ApplicationCreateTxn(creator_address, params, on_complete, approval_program, clear_program, global_schema, local_schema, app_args, note=note)
 
     @staticmethod
     def mnemonic_to_private_key(mnemonic_key: str) -> Tuple[str, DopError]:
@@ -286,17 +424,29 @@ class workerAlgorand():
             return ("",0,err)
         creator_address       = account.address_from_private_key(creator_private_key)         #   this line to be deleted
 
-        smart_contract_address, err = self.dop_stateless_create(client, self._i_stateless_teal_template_path, creator_address)
+        smart_contract_address, err = self.dop_stateless_create(client, self._i_stateless_teal_template_path, creator_address, self._i_teal_cache)
         if err.isError():
             return ("",0,err)
 
-        txn_id, err = self.dop_stateful_create(client, self._i_teal_clear_program_path, self._i_teal_approval_program_path, creator_address, creator_private_key, smart_contract_address)
+        try:
+            self._i_admission.acquire(1)
+        except AdmissionRejected:
+            return "",0,self.__admission_error()
+        sent_round: int = self.__sent_round()
+        txn_id, err = self.dop_stateful_create(
+            client, self._i_teal_clear_program_path, self._i_teal_approval_program_path, creator_address, creator_private_key,
+            smart_contract_address, self._i_teal_cache, self._i_params.params('create'), self.creation_note(os.urandom(8).hex(), 0))
 
         if err.isError():
+            self._i_admission.release(1, False)
             return "",0,err
+        self.__admission_track(txn_id, 1, sent_round)
 
         # await confirmation
-        confirmed_txn = self.wait_for_confirmation(client, txn_id, 4)  
+        try:
+            confirmed_txn = self.__confirm(txn_id, 4)  
+        except Exception:
+            return "",0,DopError(120, "An error occurred while creating stateful smart contract.")
 
 
         #   confirmed_txn holds:
@@ -328,53 +478,11 @@ class workerAlgorand():
         #       }
 
 
-        # display results
-        transaction_response = client.pending_transaction_info(txn_id)
-
-        #   transaction_response
-        #   {
-        #       'application-index': 392, 
-        #       'confirmed-round': 66118, 
-        #       'global-state-delta': [
-        #                               {
-        #                                   'key': 'Y3JlYXRvcg==', 
-        #                                   'value': {'action': 1, 'bytes': 'tpw3hll7wAFNFzreNA5uPoRnNAnJ28KBEYxhgtJW4to='}
-        #                               }, 
-        #                               {
-        #                                   'key': 'a2V5', 
-        #                                   'value': {'action': 1, 'bytes': 'MHgwMA=='}
-        #                               }, 
-        #                               {
-        #                                   'key': 'a2lk', 
-        #                                   'value': {'action': 1, 'bytes': 'MHgwMA=='}
-        #                               }, 
-        #                               {
-        #                                   'key': 'bGlua2Vk', 
-        #                                   'value': {'action': 1, 'bytes': 'RjZWVkZNTEY1RVM0S1VZTUg3TFlGVlZLRUFUQlJMQjdHRllSMk1IQkRCWEpOM1pHUURZUUVNUEE3UQ=='}
-        #                               }
-        #                               ], 
-        #       'pool-error': '', 
-        #       'sender-rewards': 16230, 
-        #       'txn': {
-        #                   'sig': 'NiAHaHCPSs/APuWMBvpmfiG1iYDod0RzeRZd2YzFSCQ+mfwVGgH5MEE1oxJ4f7VVOIoSpaEZTRu1uKlXOnadAQ==', 
-        #                   'txn': {
-        #                               'apaa': ['RjZWVkZNTEY1RVM0S1VZTUg3TFlGVlZLRUFUQlJMQjdHRllSMk1IQkRCWEpOM1pHUURZUUVNUEE3UQ=='], 
-        #                               'apap': 'BSAGAAECBucJZCYMA2tpZANrZXkFZ3JhbnQGZXJyPTA7DHN1YnNjcmlwdGlvbgE7B2NyZWF0b3IGZ2V0a2V5CGVycj0yNTU7BGtleT0GbGlua2VkBDB4MDAxGCISQAGSMRkjEkABpDEZJBJAAaAxGYEFEkABkjIEIxJAAAkyBCQSQAFQIkMxECUTQAGEJwZkMQASQAChNhoAgAlzdWJzY3JpYmUSQAAjNhoAgAt1bnN1YnNjcmliZRJAABw2GgAnBxJAABwnCLAhBEMiJwQjZiIqImaB6AdDIicEImaB8gdDIicEYiMTQAApIipiIxNAAC02GgEoZBNAADAiKChkZiIpKWRmK7AnCSlkUCcFULAhBUOABmVycj0xO7CBZUOABmVycj0yO7CBZkOABmVycj0zO7CBZ0M2GgAqEkAAbTYaAIAGcmV2b2tlEkAAaDYaAIAGY2hhcmdlEkAAYzYaAIAGc2V0a2V5EkAAWDYaACcHEkAABicIsCEEQzYaAShkE0AAGyuwJwkpZFAnBVCwgARraWQ9KGRQJwVQsCEFQ4AHZXJyPTEwO7CBbkMjKiNmK7CB0A9DIyoiZiuwgdoPQ4HkD0MpNhoBZyg2GgJnK7CB7g9DMwAQIxNAADUzARAlE0AALTMABycKZBNAACOB9ANDJwYxAGcnCjYaAGcpJwtnKCcLZ4EKQ4EUQ4EeQ4EoQyJD', 
-        #                               'apgs': {'nbs': 5, 'nui': 5}, 
-        #                               'apls': {'nbs': 5, 'nui': 5}, 
-        #                               'apsu': 'AyABASI=', 
-        #                               'fee': 1000, 
-        #                               'fv': 66017, 
-        #                               'gen': 'private-v1', 
-        #                               'gh': '85lTOmM+7boPryKD0hCIWMkcoKAZZaFZ+Gi9YSitq0g=', 
-        #                               'lv': 67017, 
-        #                               'snd': 'W2ODPBSZPPAACTIXHLPDIDTOH2CGONAJZHN4FAIRRRQYFUSW4LNODF4EVY', 
-        #                               'type': 'appl'
-        #                           }
-        #               }
-        #       }
-
-        app_id = transaction_response['application-index']
+        #   the confirmation holds the application index: no further lookup
+        app_id = confirmed_txn.get('application-index', 0)
+        if app_id == 0:
+            return "",0,DopError(120, "An error occurred while creating stateful smart contract.")
+        self.__watch_contract(app_id, creator_address, smart_contract_address)
         return (smart_contract_address, str(app_id), DopError(0,""))
 
 
@@ -384,47 +492,59 @@ class workerAlgorand():
         """
         Sends tokens from one account to another
         """
-        if self._i_algod_client == None:
-            return "",DopError(1,"Missing value for algod client.")
+        err: DopError
+        operation, err = self.__payment_op(from_mnemonic, to_address, amount)
+        if err.isError():
+            return "",err
 
-        params = self._i_algod_client.suggested_params()
-        params.flat_fee = True
-        params.fee = 1000
-        txn_note = "DOP OPTIN".encode()
+        #   sign the transaction using the private key of the sender (from_address),
+        #   submit it and wait for confirmation (unless a transaction buffer is open)
+        txid, err = self.__submit(operation.txn, operation.private_key, operation.send_error, operation.wait_error)
+        if err.isError():
+            return "", err
+        if txid != "":
+            print("Successfully sent transaction with txID: {}".format(txid))
+
+        return txid, DopError(0,)
 
+    #   private method
+    def __payment_op(self, from_mnemonic, to_address, amount) -> Tuple['_Operation',DopError]:
+        if self._i_algod_client == None:
+            return None,DopError(1,"Missing value for algod client.")
+        #   the provider applies the flat fee (see SuggestedParamsProvider)
+        return self.payment_operation(self._i_params.params('payment'), from_mnemonic, to_address, amount)
+
+    @staticmethod
+    def payment_operation(
+        params: transaction.SuggestedParams
+    ,   from_mnemonic: str
+    ,   to_address: str
+    ,   amount: int
+    ,   note: bytes = None              #   if not provided, a unique funding note (see funding_note)
+    ) -> Tuple['_Operation',DopError]:
+        """
+        builds the payment of amount microAlgo from the account of from_mnemonic to to_address
+        """
         err: DopError
 
-        from_private_key, err = self.mnemonic_to_private_key(from_mnemonic)
+        from_private_key, err = workerAlgorand.mnemonic_to_private_key(from_mnemonic)
         if err.isError():
-            return "",err
+            return None,err
         from_address = account.address_from_private_key(from_private_key)
 
-        
-        params = self._i_algod_client.suggested_params()
-        # comment out the next two (2) lines to use suggested fees
-        params.flat_fee = True
-        params.fee = 1000
-        txn_note = "DOP funds".encode()
+        #   two payments of the same amount to the same address would have the same txid
+        txn_note = note if note is not None else workerAlgorand.funding_note(os.urandom(8).hex(), 0)
 
         #   create an unsigned transaction
         unsigned_txn = PaymentTxn(from_address, params, to_address, amount, None, txn_note)
 
-        #   sign the transaction using the private key of the sender (from_address)
-        signed_txn = unsigned_txn.sign(from_private_key)
-
-        #submit transaction
-        txid = self._i_algod_client.send_transaction(signed_txn)
-        print("Successfully sent transaction with txID: {}".format(txid))
-
-        # wait for confirmation 
-        try:
-            confirmed_txn = self.wait_for_confirmation(self._i_algod_client, txid, 4)  
-        except Exception as err:
-            print(err)
-            return "", DopError(301,'An exception occurred while waiting \
+        return _Operation(
+            unsigned_txn
+        ,   from_private_key
+        ,   DopError(209,'An exception occurred when sending payment transaction.')
+        ,   DopError(301,'An exception occurred while waiting \
                 for the confirmation of the send transaction.')
-        
-        return txid, DopError(0,)
+        ), DopError(0,"")
     
     @staticmethod
     def wait_for_confirmation(
@@ -460,6 +580,16 @@ class workerAlgorand():
         raise Exception(
             'pending tx not found in timeout rounds, timeout value = : {}'.format(timeout))
 
+    #   private method
+    def __confirm(self, transaction_id: str, timeout: int) -> dict:
+        """
+        Wait for the confirmation of the transaction (same semantic as wait_for_confirmation)
+        all the waiting threads share the rounds followed by the confirmation tracker
+        """
+        if self._i_tracker is None:
+            return self.wait_for_confirmation(self._i_algod_client, transaction_id, timeout)
+        return self._i_tracker.wait(transaction_id, timeout)
+
     @staticmethod
     def Token(token: str, path: str) -> Tuple[DopError, str]:
         ntoken: str = token
@@ -502,6 +632,9 @@ class workerAlgorand():
                 to the process calling this method
         """
 
+        if self._i_open:
+            #   resolved by open (the files are not read again)
+            return DopError(),self._i_algo_token
         token: str
         if 'atoken' in self._i_config:
             #   atoken passed in connstring - ignore file containing token
@@ -522,6 +655,9 @@ class workerAlgorand():
                 so this function requires the macro ALGORAND_DATA to be defined and available
                 to the process calling this method
         """
+        if self._i_open:
+            #   resolved by open (the files are not read again)
+            return DopError(),self._i_algo_port
         port: int
         if 'anetprt' in self._i_config:
             #   anetprt passed in connstring - ignore file containing port
@@ -535,6 +671,9 @@ class workerAlgorand():
         return (err, port)
 
     def kmdToken(self) -> Tuple[DopError, str]:
+        if self._i_open:
+            #   resolved by open (the files are not read again)
+            return DopError(),self._i_kmd_token
         token: str
         if 'ktoken' in self._i_config:
             #   atoken passed in connstring - ignore file containing token
@@ -548,6 +687,9 @@ class workerAlgorand():
         return (err, token)
 
     def kmdPort(self) -> Tuple[DopError, str]:
+        if self._i_open:
+            #   resolved by open (the files are not read again)
+            return DopError(),self._i_kmd_port
         port: int
         if 'knetprt' in self._i_config:
             #   anetprt passed in connstring - ignore file containing port
@@ -560,20 +702,138 @@ class workerAlgorand():
             self._i_kmd_port = port
         return (err, port)
 
-    def kmd(self) -> Tuple[DopError, algosdk.kmd.KMDClient]:
+    def configuration(self) -> dict:
+        """
+        returns a copy of the configuration (see init)
+        """
+        return dict(self._i_config)
+
+    def tealPaths(self) -> Tuple[str, str, str]:
+        """
+        returns the absolute paths of the stateless teal template, of the teal approval program
+        and of the teal clear program
+        """
+        return (self._i_stateless_teal_template_path, self._i_teal_approval_program_path, self._i_teal_clear_program_path)
+
+    def kmdEndpoint(self) -> Tuple[DopError, str, str]:
+        """
+        returns the token and the address (http://ip:port) of the kmd
+        """
         err, kmd_token = self.kmdToken()
         if err.code != 0:
-            return (err,None)
+            return (err,'','')
         err, kmd_port = self.kmdPort()
         if err.code != 0:
-            return (err,None)
+            return (err,'','')
 
         kmd_ip_address: str = 'http://localhost:' 
         if 'knetip' in self._i_config:
-            kmd_ip_address = 'http://' + self._i_config['knetip'] + ':'
+            kmd_ip_address = self.__scheme(self._i_config['knetip']) + ':'
         kmd_address = kmd_ip_address + str(kmd_port)
+        return (DopError(),kmd_token,kmd_address)
+
+    @staticmethod
+    def __scheme(ip_address: str) -> str:
+        #   private method
+        #   the address can include the scheme (https://host when the node is behind a TLS terminator)
+        if '://' in ip_address:
+            return ip_address
+        return 'http://' + ip_address
+
+    def httpPool(self, address: str) -> Tuple[DopError, HTTPConnectionPool]:
+        """
+        returns a keep-alive connection pool to address (see hpsz, hpto and hpcon)
+        """
+        try:
+            pool_size = int(self._i_config['hpsz'])
+            timeout = float(self._i_config['hpto'])
+        except ValueError:
+            return (DopError(25, "Invalid value for http pool size (hpsz) or http timeout (hpto)."),None)
+        if pool_size < 0 or timeout < 0:
+            return (DopError(25, "Invalid value for http pool size (hpsz) or http timeout (hpto)."),None)
+        try:
+            max_concurrent = int(self._i_config['hpcon'])
+        except ValueError:
+            return (DopError(35, "Invalid value for http concurrency limit (hpcon)."),None)
+        if max_concurrent < 0:
+            return (DopError(35, "Invalid value for http concurrency limit (hpcon)."),None)
+        return (DopError(),HTTPConnectionPool(address, pool_size, timeout if timeout > 0 else None, max_concurrent))
+
+    def connectionStats(self) -> dict:
+        """
+        returns the counters (new/reused/idle connections) of the algod and kmd connection pools
+        and, if more nodes are configured (anodes, knodes), the state of every node
+        """
+        stats: dict = {}
+        if self._i_algod_pool is not None:
+            stats['algod'] = self._i_algod_pool.stats()
+        if self._i_kmd_pool is not None:
+            stats['kmd'] = self._i_kmd_pool.stats()
+        if self._i_algod_balancer is not None:
+            stats['algod_nodes'] = self._i_algod_balancer.stats()
+        if self._i_kmd_balancer is not None:
+            stats['kmd_nodes'] = self._i_kmd_balancer.stats()
+        return stats
+
+    #   private method
+    def __nodes(self, label: str) -> list:
+        #   additional nodes (see anodes and knodes)
+        return [self.__scheme(node.strip()) for node in self._i_config[label].split(',') if node.strip() != '']
+
+    @staticmethod
+    def __algod_probe(endpoint: Endpoint) -> int:
+        #   private method
+        return endpoint.client.status()['last-round']
+
+    @staticmethod
+    def __kmd_probe(endpoint: Endpoint) -> int:
+        #   private method
+        #   kmd has no rounds: the node is healthy if it answers
+        endpoint.client.versions()
+        return 0
+
+    #   private method
+    def __balancer(self, endpoints: list, probe, check_lag: bool) -> Tuple[DopError, EndpointBalancer]:
+        err: DopError = DopError(32, "Invalid value for load balancer failures (lbfail), lag (lblag) or probe interval (lbprb).")
+        try:
+            max_failures = int(self._i_config['lbfail'])
+            max_lag = int(self._i_config['lblag'])
+            probe_interval = float(self._i_config['lbprb'])
+        except ValueError:
+            return (err,None)
+        if max_failures < 1 or max_lag < 0 or probe_interval <= 0:
+            return (err,None)
+        return (DopError(),EndpointBalancer(endpoints, max_failures, max_lag if check_lag else 0, probe_interval, probe))
+
+    def kmd(self) -> Tuple[DopError, algosdk.kmd.KMDClient]:
+        err, kmd_token, kmd_address = self.kmdEndpoint()
+        if err.code != 0:
+            return (err,None)
 
-        kcl = kmd.KMDClient(kmd_token, kmd_address)
+        #   the pools and the balancer are created once (the client can be requested by many threads)
+        with self._i_lock:
+            if self._i_kmd_pool is None:
+                err, self._i_kmd_pool = self.httpPool(kmd_address)
+                if err.code != 0:
+                    return (err,None)
+            kcl = PooledKMDClient(kmd_token, kmd_address, self._i_kmd_pool)
+
+            #   additional nodes (see knodes): the requests stick to a node and fail over to the next one
+            nodes: list = self.__nodes('knodes')
+            if len(nodes) > 0:
+                if self._i_kmd_balancer is None:
+                    endpoints: list = [Endpoint(kmd_address, kcl, self._i_kmd_pool)]
+                    for node in nodes:
+                        err, pool = self.httpPool(node)
+                        if err.code != 0:
+                            return (err,None)
+                        endpoints.append(Endpoint(node, PooledKMDClient(kmd_token, node, pool), pool))
+                    err, self._i_kmd_balancer = self.__balancer(endpoints, self.__kmd_probe, False)
+                    if err.code != 0:
+                        return (err,None)
+                    self._i_kmd_balancer.probe_all()
+                    self._i_kmd_balancer.start()
+                kcl = BalancedKMDClient(kmd_token, kmd_address, self._i_kmd_balancer)
 
         try:
             #   NOTE:           it seems that the kmd can be instantiated only if using localhost
@@ -583,24 +843,57 @@ class workerAlgorand():
             return(DopError(22, "An exception occurred while initializing kmd client."),kcl)
 
         return(DopError(),kcl)
-    
-    def algod(self) -> Tuple[DopError, algosdk.v2client.algod.AlgodClient]:
+
+    def algodEndpoint(self) -> Tuple[DopError, str, str]:
+        """
+        returns the token and the address (http://ip:port) of the algod node
+        """
         #   get algod token
         err, algod_token = self.algodToken()
         if err.code != 0:
-            return (err,None)
+            return (err,'','')
         #   get algod port
         err, algod_port = self.algodPort()
         if err.code != 0:
-            return (err,None)
+            return (err,'','')
         #   get algo node address (default is localhost)
 
         algod_ip_address: str = 'http://localhost:' 
         if 'anetip' in self._i_config:
-            algod_ip_address = 'http://' + self._i_config['anetip'] + ':'
+            algod_ip_address = self.__scheme(self._i_config['anetip']) + ':'
         #algod_address = 'http://localhost:' + str(algod_port)
         algod_address = algod_ip_address + str(algod_port)
-        algocl = algod.AlgodClient(algod_token, algod_address)
+        return (DopError(),algod_token,algod_address)
+    
+    def algod(self) -> Tuple[DopError, algosdk.v2client.algod.AlgodClient]:
+        err, algod_token, algod_address = self.algodEndpoint()
+        if err.code != 0:
+            return (err,None)
+        #   the pools and the balancer are created once (the client can be requested by many threads)
+        with self._i_lock:
+            if self._i_algod_pool is None:
+                err, self._i_algod_pool = self.httpPool(algod_address)
+                if err.code != 0:
+                    return (err,None)
+            algocl = PooledAlgodClient(algod_token, algod_address, self._i_algod_pool)
+
+            #   additional nodes (see anodes): the requests are balanced across all the nodes
+            #   (the client is valid as long as one node is reachable)
+            nodes: list = self.__nodes('anodes')
+            if len(nodes) > 0:
+                if self._i_algod_balancer is None:
+                    endpoints: list = [Endpoint(algod_address, algocl, self._i_algod_pool)]
+                    for node in nodes:
+                        err, pool = self.httpPool(node)
+                        if err.code != 0:
+                            return (err,None)
+                        endpoints.append(Endpoint(node, PooledAlgodClient(algod_token, node, pool), pool))
+                    err, self._i_algod_balancer = self.__balancer(endpoints, self.__algod_probe, True)
+                    if err.code != 0:
+                        return (err,None)
+                    self._i_algod_balancer.probe_all()
+                    self._i_algod_balancer.start()
+                algocl = BalancedAlgodClient(algod_token, algod_address, self._i_algod_balancer)
 
         #   check if the algod client is valid
         try:
@@ -646,96 +939,604 @@ class workerAlgorand():
     ,   transaction_note: str           #   the note field withon the transaction
     ) -> Tuple[str, DopError]:               #   error code, transaction id
 
+        err: DopError
         #   retrieve and change suggested params (for the transaction)        
         #   this could become an argument, to be investigated (future releases)
-        params = algod_client.suggested_params()
-        params.flat_fee = True
-        params.fee = 1000
-
-        txn_note = transaction_note.encode()
-
-        err: DopError
-        owner_private_key: str
-        owner_private_key,err   = self.mnemonic_to_private_key(owner_mnemonic)
+        unsigned_txn, owner_private_key, err = self.app_call_txn(self._i_params.params(), appid, owner_mnemonic, scarguments, transaction_note)
         if err.isError():
             return "",err
 
-        owner_address       = account.address_from_private_key(owner_private_key)         #   this line to be deleted
-
-        arguments_list   = self.getArgs(scarguments)
-        accounts_list    = self.getAccounts(scarguments)
-
-        unsigned_txn = ApplicationNoOpTxn(owner_address, params, appid, arguments_list, accounts_list, None, None, txn_note)
         signed_txn = unsigned_txn.sign(owner_private_key)
 
         txid = ''
+        try:
+            self._i_admission.acquire(1)
+        except AdmissionRejected:
+            return "", self.__admission_error()
+        sent_round: int = self.__sent_round()
         try:
             txid = algod_client.send_transaction(signed_txn)
             #   print("Successfully sent transaction with txID: {}".format(txid))
 
         except Exception as err:
             #print(err)
+            self._i_admission.release(1, False, self._i_admission.congestion(err))
             return "", DopError(202,f"An exception occurred when sending transaction.")
 
+        #   the transaction stays in flight (see AdmissionController) until confirmed
+        self.__admission_track(txid, 1, sent_round)
         return(txid, DopError(0,""))      #   now the transaction can be waited for
 
-    def __default(self):
-        #   set default parameters
-        self._i_algo_token      = ''
-        self._i_algo_port       = ''
-        self._i_algod_client    = None
+    @staticmethod
+    def app_call_txn(
+        params: transaction.SuggestedParams
+    ,   appid:  int                     #   smart contract index (address)
+    ,   owner_mnemonic: str             #   private key (mnemonic) of the sender
+    ,   scarguments: dict               #   {"args":[argslist], "addrs":[accountaddresseslist]}
+    ,   transaction_note: str           #   the note field withon the transaction
+    ) -> Tuple[ApplicationNoOpTxn, str, DopError]:  #   unsigned transaction, private key of the sender, DopError
 
-        self._i_kmd_token       = ''
-        self._i_kmd_port        = ''
-        self._i_kmd_client      = None
+        txn_note = transaction_note.encode()
 
-        self._i_config: dict   = {}
-        
-        algorand_data_path: str = '/home/ecosteer/dop/externals/algorand/net1/Primary'
-        if 'ALGORAND_DATA' in os.environ:
-            algorand_data_path = os.environ['ALGORAND_DATA']
+        err: DopError
+        owner_private_key: str
+        owner_private_key,err   = workerAlgorand.mnemonic_to_private_key(owner_mnemonic)
+        if err.isError():
+            return None,"",err
 
-        self._i_algo_token_file     = algorand_data_path + '/algod.token'           #   this has to go
-        self._i_config['atokf']     = algorand_data_path + '/algod.token'
+        owner_address       = account.address_from_private_key(owner_private_key)         #   this line to be deleted
 
-        self._i_algo_net_file       = algorand_data_path + '/algod.net'             #   this has to go
-        self._i_config['anetf']     = algorand_data_path + '/algod.net'
+        arguments_list   = workerAlgorand.getArgs(scarguments)
+        accounts_list    = workerAlgorand.getAccounts(scarguments)
 
-        self._i_kmd_token_file      = algorand_data_path + '/kmd-v0.5/kmd.token'    #   this has to go
-        self._i_config['ktokf']     = algorand_data_path + '/kmd-v0.5/kmd.token'
+        unsigned_txn = ApplicationNoOpTxn(owner_address, params, appid, arguments_list, accounts_list, None, None, txn_note)
+        return unsigned_txn, owner_private_key, DopError(0,"")
 
-        self._i_kmd_net_file        = algorand_data_path + '/kmd-v0.5/kmd.net'      #   this has to go
-        self._i_config['knetf']     = algorand_data_path + '/kmd-v0.5/kmd.net'
-        
+    #   private method
+    def __submit(
+        self
+    ,   unsigned_txn: transaction.Transaction
+    ,   private_key: str                #   private key of the sender
+    ,   send_error: DopError            #   error returned if the transaction can not be sent
+    ,   wait_error: DopError            #   error returned if the transaction is not confirmed
+    ) -> Tuple[str, DopError]:          #   transaction id, DopError
+        """
+        Signs, sends and waits for the confirmation of a transaction
+        (or buffers it if a transaction buffer is open, see begin_transaction)
+        the transaction id is empty if the transaction has not been sent
+        """
+        txids, err = self.__submit_many([(unsigned_txn, private_key)], send_error, wait_error)
+        txid = txids[0] if len(txids) > 0 else ""
+        return txid, err
 
-        dop_smart_contract_root_path: str = '/home/ecosteer/dop/intermediation/algorand/DOP'
-        self._i_config['scrf'] = dop_smart_contract_root_path
+    #   private method
+    def __submit_many(
+        self
+    ,   txns: list                      #   transactions of one operation: list of (unsigned transaction, private key of the sender)
+    ,   send_error: DopError
+    ,   wait_error: DopError
+    ) -> Tuple[list, DopError]:
+        return self.__submit_operations([txns], send_error, wait_error)
 
-        user_wallet: str            = "unencrypted-default-wallet"                  # wallet where the users are created
-        user_wallet_password: str   = ""                                            # password to access the wallet
-        self._i_config['usrwlab']   = user_wallet
-        self._i_config['usrwpwd']   = user_wallet_password
+    #   private method
+    def __submit_operations(
+        self
+    ,   operations: list                #   list of operations, each a list of (unsigned transaction, private key of the sender)
+    ,   send_error: DopError
+    ,   wait_error: DopError
+    ) -> Tuple[list, DopError]:
+        buffer: list = getattr(self._i_local, 'buffer', None)
+        if buffer is not None:
+            #   a transaction buffer is open: the operations are sent by commit, packed into groups
+            #   that the contracts deployed before dop.stateful.teal 1.5 would reject
+            if not all(self.__grouped_calls(app_id) for app_id in self.app_ids(operations)):
+                return [], self.__ungrouped_error()
+            buffer.extend(operations)
+            return [], DopError(0,"")
+        return self.__send_groups(operations, send_error, wait_error)
 
+    @staticmethod
+    def app_ids(
+        operations: list                #   list of operations, each a list of (unsigned transaction, private key of the sender)
+    ) -> set:
+        """
+        returns the application indexes called by the transactions of the operations (creations excluded)
+        """
+        return {
+            int(unsigned_txn.index)
+            for operation in operations for unsigned_txn, _ in operation
+            if isinstance(unsigned_txn, transaction.ApplicationCallTxn) and unsigned_txn.index
+        }
 
-        if 'DOP_SMART_CONTRACT_ROOT_FOLDER' in os.environ:
-            dop_smart_contract_root_path = os.environ['DOP_SMART_CONTRACT_ROOT_FOLDER']
-            
-        self._i_stateless_teal_template_path    = dop_smart_contract_root_path + '/dop.account/dop.account.teal.template'
-        self._i_config['sttp'] = 'dop.account/dop.account.teal.template'
-        self._i_teal_approval_program_path      = dop_smart_contract_root_path + '/dop.stateful/dop.stateful.teal'
-        self._i_config['tapp'] = 'dop.stateful/dop.stateful.teal'
-        self._i_teal_clear_program_path         = dop_smart_contract_root_path + '/dop.clear/basicClear.teal'
-        self._i_config['tcpp'] = 'dop.clear/basicClear.teal'
+    @staticmethod
+    def pack_groups(
+        operations: list                #   list of operations, each a list of (unsigned transaction, private key of the sender)
+    ) -> list:                          #   list of groups, each a list of (unsigned transaction, private key of the sender)
+        """
+        Packs the operations into atomic groups of up to MAX_GROUP_SIZE transactions
+        the transactions of an operation are never split across groups: a new group is started
+        when the operation does not fit into the current one; an operation with more than
+        MAX_GROUP_SIZE transactions (e.g. grant_many) is split into groups of its own
+        """
+        groups: list = []
+        current: list = []
+        for operation in operations:
+            if len(operation) > workerAlgorand.MAX_GROUP_SIZE:
+                if current:
+                    groups.append(current)
+                    current = []
+                for start in range(0, len(operation), workerAlgorand.MAX_GROUP_SIZE):
+                    groups.append(list(operation[start:start + workerAlgorand.MAX_GROUP_SIZE]))
+                continue
+            if len(current) + len(operation) > workerAlgorand.MAX_GROUP_SIZE:
+                groups.append(current)
+                current = []
+            current.extend(operation)
+        if current:
+            groups.append(current)
+        return groups
 
-        self._i_config['ownmne'] = ''
+    #   private method
+    def __send_nowait(self, operation: '_Operation') -> Tuple[OperationHandle, DopError]:
+        """
+        Signs and sends the transaction of the operation without waiting for its confirmation
+        """
+        if getattr(self._i_local, 'buffer', None) is not None:
+            return None,DopError(212,"Non blocking operations are not available while a transaction is open.")
+        if self._i_tracker is None:
+            return None,DopError(1,"Missing value for algod client.")
 
+        signed_txn = operation.txn.sign(operation.private_key)
+        try:
+            self.__admitted_send([signed_txn])
+        except AdmissionRejected:
+            return None,self.__admission_error()
+        except Exception:
+            return None,operation.send_error
+        txid = signed_txn.get_txid()
 
-    #============================================================================
-    #   abstract methods
-    #============================================================================
-    #   NOTE:   init must become an abstract method
-    def init(self, constring: str) -> DopError:
+        future = self._i_tracker.track(txid, 4)
+        future.add_done_callback(lambda _: self.__touched([operation.txn]))
+        return OperationHandle(txid, future, operation.wait_error), DopError(0,"")
 
+    #   private method
+    def __send_groups(
+        self
+    ,   operations: list                #   list of operations, each a list of (unsigned transaction, private key of the sender)
+    ,   send_error: DopError            #   error returned if a group can not be sent
+    ,   wait_error: DopError            #   error returned if a group is not confirmed
+    ) -> Tuple[list, DopError]:         #   ids of the transactions sent, DopError
+        """
+        Packs the operations into atomic groups (see pack_groups),
+        sends all the groups and then waits for their confirmation
+        if a group can not be sent, the next groups are not sent: the groups already sent are
+        waited for and the ids of their transactions are returned along with send_error
+        """
+        txids: list = []
+        group_txids: list = []          #   one txid per group sent (the group is confirmed atomically)
+        err: DopError = DopError(0,"")
+        groups: list = self.pack_groups(operations)
+
+        for chunk in groups:
+            unsigned_txns = [item[0] for item in chunk]
+            if len(unsigned_txns) > 1:
+                transaction.assign_group_id(unsigned_txns)
+            signed_txns = [item[0].sign(item[1]) for item in chunk]
+
+            try:
+                self.__admitted_send(signed_txns)
+            except AdmissionRejected:
+                err = self.__admission_error()
+                break
+            except Exception:
+                err = send_error
+                break
+
+            chunk_txids = [signed_txn.get_txid() for signed_txn in signed_txns]
+            txids.extend(chunk_txids)
+            group_txids.append(chunk_txids[0])
+
+        for txid in group_txids:
+            try:
+                self.__confirm(txid, 4)
+            except Exception:
+                if not err.isError():
+                    err = wait_error
+
+        self.__touched([item[0] for group in groups for item in group])
+        return txids, err
+
+    #   private method
+    def __send_sequential(
+        self
+    ,   txns: list                      #   list of (unsigned transaction, private key of the sender)
+    ,   send_error: DopError
+    ,   wait_error: DopError
+    ) -> Tuple[list, DopError]:         #   ids of the transactions confirmed, DopError
+        """
+        Sends the transactions one at a time (each as a group of its own), every transaction is
+        confirmed before the next one is sent; stops at the first error
+        """
+        txids: list = []
+        for txn in txns:
+            txn_txids, err = self.__send_groups([[txn]], send_error, wait_error)
+            txids.extend(txn_txids)
+            if err.isError():
+                return txids, err
+        return txids, DopError(0,"")
+
+    #   private method
+    def __send_group_list(
+        self
+    ,   groups: list                    #   list of groups, each a list of (unsigned transaction, private key of the sender)
+    ,   send_error: DopError            #   error returned for a group that can not be sent
+    ,   wait_error: DopError            #   error returned for a group that is not confirmed
+    ,   track_all: bool = False         #   the pending information of every transaction is needed (not only of the group)
+    ) -> list:                          #   one (ids of the transactions of the group, DopError, pending information) per group
+        """
+        Sends the (already formed) atomic groups concurrently, then waits once for the
+        confirmation of each group; the outcome of each group is independent of the others
+        the pending information (see pending_transaction_info) is returned for the first transaction
+        of each group or, if track_all, for every transaction of the group (empty if not confirmed)
+        """
+        def send(group: list) -> Tuple[list, DopError]:
+            unsigned_txns = [item[0] for item in group]
+            if len(unsigned_txns) > 1:
+                transaction.assign_group_id(unsigned_txns)
+            signed_txns = [item[0].sign(item[1]) for item in group]
+            try:
+                self.__admitted_send(signed_txns)
+            except AdmissionRejected:
+                return [], self.__admission_error()
+            except Exception:
+                return [], send_error
+            return [signed_txn.get_txid() for signed_txn in signed_txns], DopError(0,"")
+
+        try:
+            max_workers = max(1, int(self._i_config['hpsz']))
+        except ValueError:
+            max_workers = 1
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, max(1, len(groups)))) as executor:
+            sent: list = list(executor.map(send, groups))
+
+        #   all the groups are tracked at once: a single pass over the rounds confirms them all
+        futures: list = [
+            [self._i_tracker.track(txid, 4) for txid in (txids if track_all else txids[:1])]
+            for txids, _ in sent
+        ]
+
+        results: list = []
+        for (txids, err), group_futures in zip(sent, futures):
+            confirmed: list = []
+            try:
+                confirmed = [future.result() for future in group_futures]
+            except Exception:
+                err = wait_error
+                confirmed = []
+            results.append((txids, err, confirmed))
+
+        self.__touched([item[0] for group in groups for item in group])
+        return results
+
+    #   private method
+    def __admitted_send(self, signed_txns: list):
+        """
+        sends the signed transactions (a group) once admitted (see AdmissionController); they stay
+        in flight until the tracker confirms the first one (see __admission_track)
+        while algod rejects them because its pool is full the window shrinks and the send is
+        retried (after a pause) until the admission deadline
+        raises AdmissionRejected or the exception raised by the client
+        """
+        count: int = len(signed_txns)
+        deadline: float = self._i_admission.deadline()
+        while True:
+            self._i_admission.acquire(count, deadline)
+            sent_round: int = self.__sent_round()
+            try:
+                self._i_algod_client.send_transactions(signed_txns)
+                self.__admission_track(signed_txns[0].get_txid(), count, sent_round)
+                return
+            except Exception as e:
+                congested = self._i_admission.congestion(e)
+                self._i_admission.release(count, False, congested)
+                if not congested or time.monotonic() + self.ADMISSION_RETRY_SECONDS >= deadline:
+                    raise
+            time.sleep(self.ADMISSION_RETRY_SECONDS)
+
+    #   private method
+    def __sent_round(self) -> int:
+        return self._i_tracker.last_round if self._i_tracker is not None else 0
+
+    #   private method
+    def __admission_release(self, count: int, sent_round: int, pending_txn: Optional[dict], exception: Exception = None):
+        #   count transactions sent at sent_round are confirmed (pending_txn) or failed (exception)
+        if exception is not None:
+            self._i_admission.release(count, False, self._i_admission.congestion(exception))
+            return
+        confirmed_round: int = (pending_txn or {}).get('confirmed-round', 0)
+        rounds: int = confirmed_round - sent_round if sent_round > 0 and confirmed_round > 0 else 0
+        self._i_admission.release(count, True, False, rounds)
+
+    #   private method
+    def __admission_done(self, count: int, sent_round: int, future: concurrent.futures.Future):
+        try:
+            pending_txn = future.result()
+        except Exception as e:
+            self.__admission_release(count, sent_round, None, e)
+            return
+        self.__admission_release(count, sent_round, pending_txn)
+
+    #   private method
+    def __admission_track(self, txid: str, count: int, sent_round: int):
+        #   the transactions (txid: the first one) leave the window when the tracker resolves txid, not
+        #   when the sender waits for them: a sender can send more than the window and then wait
+        #   (without tracker they are released at once)
+        if self._i_tracker is None:
+            self._i_admission.release(count, False)
+            return
+        self._i_tracker.track(txid, 4).add_done_callback(lambda done: self.__admission_done(count, sent_round, done))
+
+    @staticmethod
+    def __admission_error() -> DopError:
+        #   private method
+        return DopError(217,"The transaction was not admitted (admission queue full or deadline exceeded).")
+
+    @staticmethod
+    def __ungrouped_error() -> DopError:
+        #   private method
+        return DopError(218,"The contract does not accept grouped application calls (deployed with dop.stateful.teal before version 1.5).")
+
+    #   private method
+    def __grouped_calls(self, app_id: int) -> bool:
+        """
+        True if the contract runs the approval program of this worker (dop.stateful.teal 1.5 or
+        later) and then accepts application calls within larger atomic groups; the contracts
+        deployed with previous versions reject any group but a deposit (pay + appl) and process
+        only the first account of an application call
+        the outcome is cached per contract (it is not cached if algod can not be reached)
+        """
+        grouped = self._i_grouped_apps.get(app_id)
+        if grouped is not None:
+            return grouped
+        approval_program, err = self.teal_program(self._i_algod_client, self._i_teal_approval_program_path, self._i_teal_cache)
+        if err.isError():
+            return False
+        try:
+            application = self._i_algod_client.application_info(app_id)
+        except Exception:
+            return False
+        grouped = base64.b64decode(application.get('params', {}).get('approval-program', '')) == approval_program
+        self._i_grouped_apps[app_id] = grouped
+        return grouped
+
+    #   private method
+    def __touched(self, unsigned_txns: list):
+        """
+        drops the cached information of the accounts touched by the transactions (sender,
+        receiver of a payment) and the cached local state of the (account, application) pairs
+        touched by the application calls (sender and foreign accounts)
+        """
+        if self._i_state_cache is None:
+            return
+        for unsigned_txn in unsigned_txns:
+            #   the balance of the sender changes (fee) - and of the receiver of a payment
+            self._i_account_cache.invalidate(unsigned_txn.sender)
+            if isinstance(unsigned_txn, transaction.PaymentTxn):
+                for address in (unsigned_txn.receiver, unsigned_txn.close_remainder_to):
+                    if address:
+                        self._i_account_cache.invalidate(address)
+            if isinstance(unsigned_txn, transaction.ApplicationCallTxn) and unsigned_txn.index:
+                for address in [unsigned_txn.sender] + list(unsigned_txn.accounts or []):
+                    self._i_state_cache.invalidate(address, int(unsigned_txn.index))
+                #   setkey is the only call changing the global state (see get_contract_state)
+                if unsigned_txn.app_args and unsigned_txn.app_args[0] == b'setkey':
+                    self._i_contract_cache.invalidate(int(unsigned_txn.index))
+
+    #   private method
+    def __creator_call_many(
+        self
+    ,   op: str                         #   "grant" or "revoke"
+    ,   publisher_passw: str            #   publisher private key mnemonic
+    ,   contract_address: str           #   application index
+    ,   subscriber_addresses: list      #   addresses of the subscribers
+    ,   transaction_note: str
+    ,   send_error: DopError
+    ,   wait_error: DopError
+    ) -> Tuple[list, DopError]:
+
+        if self._i_algod_client == None:
+            return [],DopError(1,"Missing value for algod client.")
+        try:
+            app_id = self.application_index(contract_address)
+        except ValueError:
+            return [],DopError(11,"Invalid contract address.")
+
+        if self.__grouped_calls(app_id):
+            err: DopError
+            txns, err = self.creator_many_txns(self._i_params.params(op), op, publisher_passw, str(app_id), subscriber_addresses, transaction_note)
+            if err.isError():
+                return [],err
+            return self.__submit_many(txns, send_error, wait_error)
+
+        #   contract deployed with a previous version of dop.stateful.teal: one account per call
+        #   and one call per group (the groups can not be buffered)
+        if getattr(self._i_local, 'buffer', None) is not None:
+            return [],self.__ungrouped_error()
+        txns, err = self.creator_many_txns(self._i_params.params(op), op, publisher_passw, str(app_id), subscriber_addresses, transaction_note, 1)
+        if err.isError():
+            return [],err
+        txids: list = []
+        err = DopError(0,"")
+        for group_txids, group_err, _ in self.__send_group_list([[txn] for txn in txns], send_error, wait_error):
+            txids.extend(group_txids)
+            if group_err.isError() and not err.isError():
+                err = group_err
+        return txids, err
+
+    @staticmethod
+    def creator_many_txns(
+        params: transaction.SuggestedParams
+    ,   op: str                         #   "grant" or "revoke"
+    ,   publisher_passw: str            #   publisher private key mnemonic
+    ,   contract_address: str           #   application index
+    ,   subscriber_addresses: list      #   addresses of the subscribers
+    ,   transaction_note: str
+    ,   per_call: int = MAX_APP_ACCOUNTS    #   max number of subscribers per call
+    ) -> Tuple[list, DopError]:         #   list of (unsigned transaction, private key of the sender), DopError
+        """
+        builds the application calls for op, every call carries up to per_call subscribers
+        """
+        err: DopError
+        publisher_private_key: str
+        publisher_private_key, err = workerAlgorand.mnemonic_to_private_key(publisher_passw)
+        if err.isError():
+            return [],err
+        publisher_address = account.address_from_private_key(publisher_private_key)
+
+        appid = int(contract_address)
+        app_args: list = [bytes(op,'utf-8')]
+        txn_note = transaction_note.encode()
+
+        txns: list = []
+        for start in range(0, len(subscriber_addresses), per_call):
+            accounts_list = subscriber_addresses[start:start + per_call]
+            unsigned_txn = ApplicationNoOpTxn(publisher_address, params, appid, app_args, accounts_list, None, None, txn_note)
+            txns.append((unsigned_txn, publisher_private_key))
+
+        return txns, DopError(0,"")
+
+    def __default(self):
+        #   set default parameters
+        self._i_algo_token      = ''
+        self._i_algo_port       = ''
+        self._i_algod_client    = None
+
+        self._i_kmd_token       = ''
+        self._i_kmd_port        = ''
+        self._i_kmd_client      = None
+        self._i_wallet_session  = None
+
+        self._i_config: dict   = {}
+
+        #   per thread state (transaction buffer, see begin_transaction)
+        self._i_local           = threading.local()
+        
+        algorand_data_path: str = '/home/ecosteer/dop/externals/algorand/net1/Primary'
+        if 'ALGORAND_DATA' in os.environ:
+            algorand_data_path = os.environ['ALGORAND_DATA']
+
+        self._i_algo_token_file     = algorand_data_path + '/algod.token'           #   this has to go
+        self._i_config['atokf']     = algorand_data_path + '/algod.token'
+
+        self._i_algo_net_file       = algorand_data_path + '/algod.net'             #   this has to go
+        self._i_config['anetf']     = algorand_data_path + '/algod.net'
+
+        self._i_kmd_token_file      = algorand_data_path + '/kmd-v0.5/kmd.token'    #   this has to go
+        self._i_config['ktokf']     = algorand_data_path + '/kmd-v0.5/kmd.token'
+
+        self._i_kmd_net_file        = algorand_data_path + '/kmd-v0.5/kmd.net'      #   this has to go
+        self._i_config['knetf']     = algorand_data_path + '/kmd-v0.5/kmd.net'
+        
+
+        dop_smart_contract_root_path: str = '/home/ecosteer/dop/intermediation/algorand/DOP'
+        self._i_config['scrf'] = dop_smart_contract_root_path
+
+        user_wallet: str            = "unencrypted-default-wallet"                  # wallet where the users are created
+        user_wallet_password: str   = ""                                            # password to access the wallet
+        self._i_config['usrwlab']   = user_wallet
+        self._i_config['usrwpwd']   = user_wallet_password
+
+
+        if 'DOP_SMART_CONTRACT_ROOT_FOLDER' in os.environ:
+            dop_smart_contract_root_path = os.environ['DOP_SMART_CONTRACT_ROOT_FOLDER']
+            
+        self._i_stateless_teal_template_path    = dop_smart_contract_root_path + '/dop.account/dop.account.teal.template'
+        self._i_config['sttp'] = 'dop.account/dop.account.teal.template'
+        self._i_teal_approval_program_path      = dop_smart_contract_root_path + '/dop.stateful/dop.stateful.teal'
+        self._i_config['tapp'] = 'dop.stateful/dop.stateful.teal'
+        self._i_teal_clear_program_path         = dop_smart_contract_root_path + '/dop.clear/basicClear.teal'
+        self._i_config['tcpp'] = 'dop.clear/basicClear.teal'
+
+        self._i_config['ownmne'] = ''
+
+        #   max age (seconds) of the cached suggested params
+        self._i_config['spttl'] = '5'
+        self._i_params          = None
+
+        #   cap (microAlgo) of the fee of a transaction (the fee is computed by the fee policy)
+        self._i_config['feemax'] = '10000'
+        self._i_fee_policy      = None
+        self._i_tracker         = None
+
+        #   admission control of the transactions sent: initial and max window (transactions in flight),
+        #   max number of waiting senders, max wait (seconds)
+        self._i_config['acwin'] = '64'
+        self._i_config['acmax'] = '4096'
+        self._i_config['acqsz'] = '1024'
+        self._i_config['acwait'] = '30'
+        self._i_admission       = AdmissionController()
+
+        #   folder where the compiled teal programs are persisted (empty: memory only)
+        self._i_config['tccf'] = os.path.join(tempfile.gettempdir(), 'dop_teal_cache')
+        self._i_teal_cache      = None
+        self._i_grouped_apps: dict = {}                 #   app_id -> the contract accepts grouped calls (see __grouped_calls)
+
+        #   keep-alive connections to algod and kmd: max idle connections per pool and request timeout
+        #   (seconds, 0: no timeout)
+        self._i_config['hpsz'] = '8'
+        self._i_config['hpto'] = '0'
+        #   max number of requests in progress per node (0: no limit)
+        self._i_config['hpcon'] = '32'
+        self._i_algod_pool      = None
+        self._i_kmd_pool        = None
+
+        #   additional algod and kmd nodes (comma separated [scheme://]host:port, same tokens) and
+        #   load balancing: consecutive failures and lag (rounds) ejecting a node, health probe interval (seconds)
+        self._i_config['anodes'] = ''
+        self._i_config['knodes'] = ''
+        self._i_config['lbfail'] = '3'
+        self._i_config['lblag'] = '4'
+        self._i_config['lbprb'] = '5'
+        self._i_algod_balancer  = None
+        self._i_kmd_balancer    = None
+
+        #   account pool watermarks (apmax=0: pool not enabled)
+        self._i_config['apmin'] = '0'
+        self._i_config['apmax'] = '0'
+        self._i_account_pool    = None
+
+        #   funder accounts: comma separated mnemonics (empty: the owner account funds the new accounts),
+        #   routing policy (rr: round robin, balance: highest balance), top up threshold and amount (microAlgo)
+        self._i_config['fndmne'] = ''
+        self._i_config['fndpol'] = 'rr'
+        self._i_config['fndmin'] = '1000000'
+        self._i_config['fndtop'] = '10000000'
+        self._i_funders         = None
+
+        #   max age (rounds) of the cached local state of the subscribers
+        self._i_config['lsage'] = '4'
+        self._i_state_cache     = None
+        self._i_contract_cache  = None
+        self._i_account_cache   = None
+
+        #   grant index kept by the block follower: database file (empty: follower not enabled,
+        #   :memory: not persisted) and first round followed (0: last round) when the index is new
+        self._i_config['bfdb'] = ''
+        self._i_config['bfstart'] = '0'
+        self._i_grant_index     = None
+        self._i_follower        = None
+        #   events of the DOP transactions found by the follower (listeners can be added before open)
+        self._i_events          = EventStream()
+
+
+    #============================================================================
+    #   abstract methods
+    #============================================================================
+    #   NOTE:   init must become an abstract method
+    def init(self, constring: str) -> DopError:
+
+        if self._i_open:
+            return DopError(36, "The configuration can not be changed while the worker is open.")
         self.__default()
                 
         #   convert connstring into a dict (see config_to_dict in shared.utils.py)
@@ -765,7 +1566,31 @@ class workerAlgorand():
             'tcpp',
             'usrwlab',
             'usrwpwd',
-            'ownmne'
+            'ownmne',
+            'tccf',
+            'spttl',
+            'feemax',
+            'acwin',
+            'acmax',
+            'acqsz',
+            'acwait',
+            'hpsz',
+            'hpto',
+            'hpcon',
+            'anodes',
+            'knodes',
+            'lbfail',
+            'lblag',
+            'lbprb',
+            'apmin',
+            'apmax',
+            'fndmne',
+            'fndpol',
+            'fndmin',
+            'fndtop',
+            'lsage',
+            'bfdb',
+            'bfstart'
             ]
 
         for p in pars:
@@ -795,6 +1620,45 @@ class workerAlgorand():
 		#	usrwpwd	string		user wallet password
 
         #   ownmne  string      mnemonic of the owner account to be used to fund newly created accounts
+        #   tccf    string      teal compile cache folder       : absolute path of the folder where the compiled teal programs are persisted
+        #                                                         (default: $TMPDIR/dop_teal_cache - empty value: cache kept in memory only)
+        #   spttl   float       suggested params ttl            : max age (seconds) of the cached suggested params (default 5)
+        #                                                         the params are refreshed at most once per round or when older than spttl
+        #   feemax  int         fee cap                         : max fee (microAlgo) of a transaction (default 10000); the fee is computed
+        #                                                         from the suggested fee per byte, the congestion of the transaction pool
+        #                                                         and the priority of the operation (see FeePolicy) - feemax=1000: flat fee
+        #   acwin   int         admission window                : initial number of transactions in flight (sent, not confirmed) (default 64)
+        #                                                         the window follows the congestion of algod (see AdmissionController)
+        #   acmax   int         admission max window            : max number of transactions in flight (default 4096)
+        #   acqsz   int         admission queue size            : max number of senders waiting for the window (default 1024)
+        #   acwait  float       admission max wait              : max time (seconds) a sender waits for the window (default 30)
+        #   hpsz    int         http pool size                  : max number of idle keep-alive connections kept per node (default 8)
+        #   hpto    float       http timeout                    : timeout (seconds) of the requests to algod and kmd (default 0: no timeout)
+        #   hpcon   int         http concurrency limit          : max number of requests in progress per node, the following ones wait
+        #                                                         for a slot (default 32 - 0: no limit); long polls are not counted
+        #   anodes  string      algod nodes                     : comma separated [scheme://]host:port of additional algod nodes (same token):
+        #                                                         reads are balanced by response time, writes by outstanding requests
+        #   knodes  string      kmd nodes                       : comma separated [scheme://]host:port of additional kmd nodes (same token):
+        #                                                         the requests stick to one node and fail over to the next one
+        #   lbfail  int         load balancer failures          : consecutive failures ejecting a node (default 3)
+        #   lblag   int         load balancer lag               : an algod node lagging more than lblag rounds is ejected (default 4)
+        #   lbprb   float       load balancer probe interval    : seconds between the health probes re-admitting the nodes (default 5)
+        #   apmin   int         account pool low watermark      : the pool is refilled when its depth falls below apmin (default 0: when empty)
+        #   apmax   int         account pool high watermark     : number of accounts generated ahead of demand (default 0: pool not enabled)
+        #   fndmne  string      funder mnemonics                : comma separated mnemonics of the funder accounts (default empty: the
+        #                                                         owner account funds the new accounts)
+        #   fndpol  string      funder policy                   : rr (round robin, default) or balance (funder with the highest balance)
+        #   fndmin  int         funder threshold                : a funder is topped up by the owner account when its balance (microAlgo)
+        #                                                         falls below fndmin (default 1000000)
+        #   fndtop  int         funder top up                   : amount (microAlgo) of a top up (default 10000000)
+        #   lsage   int         local state max age             : max age (rounds) of the cached local state of the subscribers (default 4)
+        #                                                         (the state touched by the transactions of the worker is refreshed at once)
+        #   bfdb    string      block follower database         : absolute path of the SQLite grant index (see admin_get_grants) kept
+        #                                                         by the block follower (default empty: follower not enabled - :memory:
+        #                                                         index not persisted); the follower resumes from the last round indexed
+        #   bfstart int         block follower start round      : first round followed when the index is new (default 0: last round)
+        #                                                         (the contracts created before are indexed only if deployed by the worker)
+        #   NOTE:   anetip and knetip can include the scheme (for instance https://192.178.20.30 if the node is behind a TLS terminator)
 
         #   example 1 (can be used only if the kmd and algod are running on localhost)
         #   atokf=/home/ecosteer/algorand/net1/Primary/algod.token;anetf=/home/ecosteer/algorand/net1/Primary/algod.net;\
@@ -816,9 +1680,12 @@ class workerAlgorand():
         #   tapp=dop.stateful/dop.stateful.teal;\
         #   tcpp=dop.clear/basicClear.teal;
 
-        #   test only
+        #   test only (the secrets are masked)
         for el in self._i_config:
-            print(el + ':[' + self._i_config[el] + ']')
+            value: str = self._i_config[el]
+            if el in workerAlgorand.SECRET_PARAMETERS and value != '':
+                value = '*****'
+            print(el + ':[' + value + ']')
         
         return DopError(0, "")
 
@@ -830,7 +1697,28 @@ class workerAlgorand():
             2)  _i_algod_port
             3)  _i_kmd_token
             4)  _i_kmd_port
+            NOTE:   once open, a single worker can be shared by many threads:
+                    1)  the configuration is read only (init fails until close)
+                    2)  the algod and kmd clients hold no per request state: their requests go
+                        through the shared keep-alive pools, up to hpcon requests in progress per node
+                    3)  the caches (state, params, compiled teal) are read without locks
+                    4)  the transaction buffer is per thread (see begin_transaction)
         """
+        with self._i_lock:
+            if self._i_open:
+                return DopError(37, "The worker is already open.")
+            err = self.__open()
+            if err.isError():
+                #   the threads and pools started before the error are stopped
+                self.__close()
+                return err
+            #   from now on the configuration can not be changed
+            self._i_config = types.MappingProxyType(self._i_config)
+            self._i_open = True
+            return err
+
+    #   private method
+    def __open(self) -> DopError:
 
 
         #   self.algod
@@ -843,16 +1731,159 @@ class workerAlgorand():
         if err.isError():
             return err
 
+        #   wallet id and wallet handle of the user wallet, shared by all the create_user
+        self._i_wallet_session = WalletSession(
+            self._i_kmd_client, self._i_config['usrwlab'], self._i_config['usrwpwd'])
+
+        #   accounts generated ahead of demand (see create_user)
+        try:
+            pool_low = int(self._i_config['apmin'])
+            pool_high = int(self._i_config['apmax'])
+        except ValueError:
+            return DopError(26, "Invalid value for account pool watermarks (apmin, apmax).")
+        if pool_low < 0 or pool_high < 0:
+            return DopError(26, "Invalid value for account pool watermarks (apmin, apmax).")
+        if pool_high > 0:
+            self._i_account_pool = AccountPool(self.__generate_account, pool_low, pool_high)
+            self._i_account_pool.start()
+
+        #   the suggested params are shared by all the transaction builders
+        try:
+            params_ttl = float(self._i_config['spttl'])
+        except ValueError:
+            return DopError(24, "Invalid value for suggested params ttl (spttl).")
+        try:
+            max_fee = int(self._i_config['feemax'])
+        except ValueError:
+            return DopError(33, "Invalid value for fee cap (feemax).")
+        #   the fee of each operation follows the congestion of the transaction pool
+        self._i_fee_policy = FeePolicy(self._i_algod_client, max_fee)
+        self._i_params = SuggestedParamsProvider(self._i_algod_client, params_ttl, fee_policy=self._i_fee_policy)
+
+        #   the transactions in flight are kept within a window following the congestion of algod
+        try:
+            admission_window = int(self._i_config['acwin'])
+            admission_max_window = int(self._i_config['acmax'])
+            admission_queue = int(self._i_config['acqsz'])
+            admission_wait = float(self._i_config['acwait'])
+        except ValueError:
+            return DopError(34, "Invalid value for admission control (acwin, acmax, acqsz, acwait).")
+        if admission_window < 1 or admission_max_window < admission_window or admission_queue < 0 or admission_wait < 0:
+            return DopError(34, "Invalid value for admission control (acwin, acmax, acqsz, acwait).")
+        self._i_admission = AdmissionController(admission_window, admission_max_window, admission_queue, admission_wait)
+
+        #   a single tracker follows the rounds for all the transactions waiting for confirmation
+        #   (the rounds it observes refresh the suggested params)
+        self._i_tracker = ConfirmationTracker(self._i_algod_client, self._i_params.notify_round)
+        self._i_tracker.start()
+
+        #   local state of the subscribers (see get_balance), refreshed after lsage rounds
+        try:
+            state_age = int(self._i_config['lsage'])
+        except ValueError:
+            return DopError(29, "Invalid value for local state max age (lsage).")
+        self._i_state_cache = LocalStateCache(
+            self._i_algod_client, state_age, self._i_tracker.current_round, self._i_tracker.notify_round)
+        #   global state of the contracts (see get_contract_state), refreshed every round
+        self._i_contract_cache = GlobalStateCache(
+            self._i_algod_client, self._i_tracker.current_round, self._i_tracker.notify_round)
+        #   account information (see get_wallet_balances), refreshed every round
+        self._i_account_cache = AccountCache(
+            self._i_algod_client, int(self._i_config['hpsz']), self._i_tracker.current_round, self._i_tracker.notify_round)
+        try:
+            #   the round estimate starts from the round of the suggested params
+            self._i_tracker.notify_round(self._i_params.params().first)
+        except Exception:
+            pass
+
+        #   the teal programs never change between deployments: compile them once
+        self._i_teal_cache = TealCompileCache(self._i_config['tccf'])
+
         if 'ownmne' in self._i_config: 
             self._own_mnemonic = self._i_config['ownmne']
         else:
             self._own_mnemonic = None
             return DopError(201, "Owner mnemonic not provided.")
 
+        #   funder accounts (the payments are routed across them, the owner account tops them up)
+        funder_mnemonics: list = [m.strip() for m in self._i_config['fndmne'].split(',') if m.strip() != '']
+        try:
+            funder_threshold = int(self._i_config['fndmin'])
+            funder_top_up = int(self._i_config['fndtop'])
+        except ValueError:
+            return DopError(28, "Invalid value for funder threshold (fndmin) or funder top up (fndtop).")
+        try:
+            self._i_funders = FunderPool(
+                self._i_algod_client, funder_mnemonics, self._i_config['fndpol'], funder_threshold, funder_top_up)
+        except Exception:
+            return DopError(27, "Invalid funder mnemonic (fndmne) or funder policy (fndpol).")
+
+        #   grant index (see admin_get_grants) kept up to date by the block follower
+        if self._i_config['bfdb'] != '':
+            try:
+                start_round = int(self._i_config['bfstart'])
+            except ValueError:
+                return DopError(30, "Invalid value for block follower start round (bfstart).")
+            try:
+                self._i_grant_index = GrantIndex(self._i_config['bfdb'])
+            except sqlite3.Error:
+                return DopError(31, "Block follower database (bfdb) could not be opened.")
+            self._i_follower = BlockFollower(
+                self._i_algod_client, self._i_grant_index, start_round, self._i_tracker.notify_round, self._i_events)
+            #   the contracts created with the DOP approval program are recognized in the blocks
+            approval_program, program_err = self.teal_program(
+                self._i_algod_client, self._i_teal_approval_program_path, self._i_teal_cache)
+            if not program_err.isError():
+                self._i_follower.add_program(approval_program)
+            self._i_follower.start()
+
         return err
 
     def close(self) -> DopError:
+        with self._i_lock:
+            err = self.__close()
+            self._i_config = dict(self._i_config)
+            self._i_open = False
+            return err
+
+    #   private method
+    def __close(self) -> DopError:
         #   TODO:   check if algod and kmd client have to be "closed" 
+        if self._i_fee_policy is not None:
+            self._i_fee_policy.close()
+            self._i_fee_policy = None
+        if self._i_follower is not None:
+            self._i_follower.stop()
+            self._i_follower = None
+        if self._i_grant_index is not None:
+            self._i_grant_index.close()
+            self._i_grant_index = None
+        if self._i_tracker is not None:
+            self._i_tracker.stop()
+            self._i_tracker = None
+        if self._i_account_cache is not None:
+            self._i_account_cache.close()
+            self._i_account_cache = None
+        if self._i_account_pool is not None:
+            self._i_account_pool.stop()
+            self._i_account_pool = None
+        if self._i_wallet_session is not None:
+            #   the wallet handle is released (kmd side)
+            self._i_wallet_session.close()
+            self._i_wallet_session = None
+        if self._i_algod_balancer is not None:
+            #   the connection pools of the additional nodes are closed
+            self._i_algod_balancer.close()
+            self._i_algod_balancer = None
+        if self._i_kmd_balancer is not None:
+            self._i_kmd_balancer.close()
+            self._i_kmd_balancer = None
+        if self._i_algod_pool is not None:
+            self._i_algod_pool.close()
+            self._i_algod_pool = None
+        if self._i_kmd_pool is not None:
+            self._i_kmd_pool.close()
+            self._i_kmd_pool = None
         return DopError(0,"")
 
 
@@ -861,16 +1892,77 @@ class workerAlgorand():
                     subscriber_address: str,                        #   EoA address of the subscriber we want to check the balance 
                     contract_address: str) -> Tuple[dict, DopError]:   #   address (blockchain layer) of the contract) -> Tuple[dict, DopError]:
         """
-        in this version this method is not "really" implemented
+        returns the subscription status of the subscriber, read from its local state
+        (see LocalStateCache) - publisher_address is not used
         """
+        return self.__subscriber_state(subscriber_address, contract_address)
+
+    #   private method
+    def __subscriber_state(self, subscriber_address: str, contract_address: str) -> Tuple[dict, DopError]:
+        if self._i_state_cache is None:
+            return {}, DopError(1,"Missing value for algod client.")
+
+        try:
+            app_id = self.application_index(contract_address)
+        except ValueError:
+            return {}, DopError(11,"Invalid contract address.")
+
+        try:
+            local_state = self._i_state_cache.get(subscriber_address, app_id)
+        except Exception:
+            return {}, DopError(213,"An exception occurred while getting the subscriber balance.")
+
+        #   local state (see op_subscribe and op_sub_getkey in dop.stateful.teal):
+        #   subscription (1: subscribed), grant (1: granted), kid and key (copied by getkey)
+        #   None if the subscriber has not opted in
+        local_state = local_state or {}
         response = {}
-        response['subscribed'] = 1
-        response['granted'] = 1             #   shortcut - use sub_keyget to valorize this field or use DB
-        response['credit'] = 100
+        response['subscribed'] = local_state.get('subscription', 0)
+        response['granted'] = local_state.get('grant', 0)
+        response['kid'] = local_state.get('kid', '')
+        response['key'] = local_state.get('key', '')
+        response['credit'] = 100            #   NOTE:   credit and debit are not kept on chain yet (see op_sub_getkey)
         response['debit'] = 0
 
         return response, DopError(0,"")
 
+    def get_contract_state(self,
+                    contract_address: str                   #   application index (or encoded address, see deploy_contract)
+                    ) -> Tuple[dict, DopError]:
+        """
+        returns the global state of the contract, read from algod (no transaction):
+        {'creator': address, 'linked': stateless account address, 'key': str, 'kid': str}
+        the state is cached until the next round or until the worker sends a setkey to the contract
+        """
+        if self._i_contract_cache is None:
+            return {}, DopError(1,"Missing value for algod client.")
+
+        try:
+            app_id = self.application_index(contract_address)
+        except ValueError:
+            return {}, DopError(11,"Invalid contract address.")
+
+        try:
+            global_state = self._i_contract_cache.get(app_id)
+        except Exception:
+            return {}, DopError(214,"An exception occurred while getting the contract state.")
+
+        response = {}
+        response['creator'] = global_state.get('creator', '')
+        response['linked'] = global_state.get('linked', '')
+        response['key'] = global_state.get('key', '')
+        response['kid'] = global_state.get('kid', '')
+        return response, DopError(0,"")
+
+    @staticmethod
+    def application_index(contract_address: str) -> int:
+        """
+        returns the application index of a contract address - either the application index
+        or the encoded address returned by deploy_contract (%smart_contract_address%@%app_id%)
+        raises ValueError if the contract address is not valid
+        """
+        return int(str(contract_address).split('@')[-1])
+
     def create_user(self, username: str, password: str) -> Tuple[str, str, DopError]: 
         """
             creates a blockchain account and returns the address (public key) of the account and the password
@@ -881,8 +1973,13 @@ class workerAlgorand():
         wallet_id: str
         err: DopError
 
+        #   pre-generated account (if the account pool is enabled and not empty)
+        if self._i_account_pool is not None:
+            pooled_account = self._i_account_pool.pop()
+            if pooled_account is not None:
+                return pooled_account[0], pooled_account[1], DopError(0,"")
+
         wallet_name = self._i_config['usrwlab']
-        wallet_password = self._i_config['usrwpwd']
 
         wallet_id, err = self.__wallet_id(wallet_name)
         if err.isError():
@@ -890,12 +1987,7 @@ class workerAlgorand():
 
         
         try:
-            wallet = Wallet(wallet_name, wallet_password, self._i_kmd_client)
-            #   create the account
-            account_address     = wallet.generate_key()
-            account_mnemonic, err    = self.__account_mnemonic(wallet_name,wallet_password,account_address)
-            if err.isError():
-                return "","",err
+            account_address, account_mnemonic = self.__generate_account()
             #   return err=0,account_address
             return account_address, account_mnemonic,DopError(0,"")
 
@@ -911,6 +2003,21 @@ class workerAlgorand():
     
 
 
+    def __generate_account(self) -> Tuple[str, str]:
+        #   private method
+        #   the wallet session keeps a single (renewed) wallet handle: two kmd requests per account
+        account_address     = self._i_wallet_session.generate_key()
+        account_mnemonic    = self._i_wallet_session.export_mnemonic(account_address)
+        return account_address, account_mnemonic
+
+    def accountPoolStats(self) -> dict:
+        """
+        returns the depth and the counters of the account pool (empty dict if the pool is not enabled)
+        """
+        if self._i_account_pool is None:
+            return {}
+        return self._i_account_pool.stats()
+
     def get_wallet_balance(self, account_address: str, currency="algo") -> Tuple[str, DopError]:
         """
             TODO:       return account_balance, DopError (as usual)
@@ -922,7 +2029,8 @@ class workerAlgorand():
 
         try:
             #   address is the account address - for instance: "4KNM6V4O2WBD3N7C5HSCTFSM3LFOUS7DRGILFFG6U54TJZYHUYMDPN26KY"
-            from_account_info = self._i_algod_client.account_info(account_address)
+            #   (the account information is cached per round, see get_wallet_balances)
+            from_account_info = self._i_account_cache.get(account_address)
             #   the account balance is in micro algos
             account_balance = from_account_info.get('amount')
             #print("Origin Account balance     : [{} microAlgos]".format(from_account_info.get('amount')))
@@ -930,6 +2038,30 @@ class workerAlgorand():
         except Exception:
             return "",DopError(204,"An exception occurred while getting wallet balance.")
 
+    def get_wallet_balances(self, account_addresses: list) -> Tuple[list, DopError]:
+        """
+            returns, in the same order as account_addresses, one (account information, DopError) where
+            the account information is {'amount': microAlgo, 'min-balance': microAlgo, 'apps': [application index]}
+            and the first error
+            the lookups run concurrently (up to hpsz), the same address is requested once and the
+            results are cached until the next round (or until a payment of the worker touches the account)
+        """
+        if self._i_algod_client == None:
+            return [], DopError(1,"Missing value for algod client.")
+
+        futures: list = [self._i_account_cache.lookup(account_address) for account_address in account_addresses]
+
+        results: list = []
+        err: DopError = DopError(0,"")
+        for future in futures:
+            try:
+                results.append((future.result(), DopError(0,"")))
+            except Exception:
+                results.append(({}, DopError(204,"An exception occurred while getting wallet balance.")))
+                if not err.isError():
+                    err = results[-1][1]
+        return results, err
+
         
     def deploy_contract(self,
                         publisher_address: str,                 #   address of the owner account
@@ -945,6 +2077,7 @@ class workerAlgorand():
                 processor specific for Algorand will have to be implemented.
                 See also monitor_des.py - it processes the event (DEPLOY_CONTRACT) that is
                 meant to close the pending op
+                (the creation is notified by the block follower as a DopEvent APP_CREATED, see add_event_listener)
 
                 NOTE:   EnableDeveloperAPI must be set to true (node configuration file)
                 NOTE:   https://developer.algorand.org/docs/run-a-node/reference/config/
@@ -977,6 +2110,129 @@ class workerAlgorand():
         encoded_smart_contract_address: str = smart_contract_address + '@' + str(app_id)
         return (encoded_smart_contract_address, err)
 
+    def deploy_contracts(self,
+                        contracts: list,                        #   list of (publisher_address, secret, tariff_period, tariff_price)
+                        fund: int = 0                           #   if not 0, amount (microAlgo) sent to each stateless account
+                        ) -> Tuple[list, DopError]:
+        """
+            deploys many contracts (see deploy_contract)
+            the creation transactions are packed into atomic groups of up to MAX_GROUP_SIZE creations;
+            if fund is not 0, each creation is followed (in the same group) by the payment of fund microAlgo
+            to its stateless account, sent by a funder account or by the owner account (so the groups hold
+            up to MAX_GROUP_SIZE/2 creations)
+            the teal programs are compiled once and the application index of each contract is read from
+            its confirmation
+            every creation and every funding payment carries a note unique to the call and to the
+            position in contracts (see creation_note): otherwise the transactions of two contracts of
+            the same publisher would be identical (same stateless account, same params)
+            returns one (encoded smart contract address, DopError) per contract, in the same order as
+            contracts, and the first error
+        """
+        if self._i_algod_client == None:
+            return [],DopError(1,"Missing value for algod client.")
+        if fund > 0 and self._own_mnemonic == None:
+            return [],DopError(201, "Owner mnemonic not provided.")
+
+        err: DopError
+        clear_program, err = self.teal_program(self._i_algod_client, self._i_teal_clear_program_path, self._i_teal_cache)
+        if err.isError():
+            return [],DopError(5,"Teal clear file not found.") if err.code == 3 else err
+        approval_program, err = self.teal_program(self._i_algod_client, self._i_teal_approval_program_path, self._i_teal_cache)
+        if err.isError():
+            return [],DopError(6,"Teal approval file not found.") if err.code == 3 else err
+
+        params = self._i_params.params('create')
+        batch: str = os.urandom(8).hex()
+
+        results: list = [("",DopError(0,""))] * len(contracts)
+        creations: list = []            #   (index in contracts, unsigned creation, private key, stateless address)
+        for index, (publisher_address, secret, tariff_period, tariff_price) in enumerate(contracts):
+            creator_private_key, err = self.mnemonic_to_private_key(secret)
+            if err.isError():
+                results[index] = ("",err)
+                continue
+            creator_address = account.address_from_private_key(creator_private_key)
+            smart_contract_address, err = self.dop_stateless_create(
+                self._i_algod_client, self._i_stateless_teal_template_path, creator_address, self._i_teal_cache)
+            if err.isError():
+                results[index] = ("",err)
+                continue
+            unsigned_txn = self.stateful_create_txn(
+                params, creator_address, approval_program, clear_program, smart_contract_address, self.creation_note(batch, index))
+            creations.append((index, unsigned_txn, creator_private_key, smart_contract_address))
+
+        per_group: int = self.MAX_GROUP_SIZE if fund <= 0 else self.MAX_GROUP_SIZE // 2
+        chunks: list = [creations[start:start + per_group] for start in range(0, len(creations), per_group)]
+        groups: list = []
+        funders: list = []              #   (funder, cost) per group
+        for chunk in chunks:
+            group: list = []
+            funder, cost = None, 0
+            if fund > 0:
+                cost = (fund + params.fee) * len(chunk)
+                funder = self.__select_funder(cost)
+                funder_private_key, err = self.mnemonic_to_private_key(
+                    funder.mnemonic if funder is not None else self._own_mnemonic)
+                if err.isError():
+                    self.__release_funder(funder, cost, False)
+                    for previous, previous_cost in funders:
+                        self.__release_funder(previous, previous_cost, False)
+                    return [],err
+                funder_address = account.address_from_private_key(funder_private_key)
+            for index, unsigned_txn, creator_private_key, smart_contract_address in chunk:
+                group.append((unsigned_txn, creator_private_key))
+                if fund > 0:
+                    fund_note: bytes = self.funding_note(batch, index)
+                    group.append((PaymentTxn(funder_address, params, smart_contract_address, fund, None, fund_note), funder_private_key))
+            groups.append(group)
+            funders.append((funder, cost))
+
+        sent: list = self.__send_group_list(
+            groups
+        ,   DopError(120, "An error occurred while creating stateful smart contract.")
+        ,   DopError(120, "An error occurred while creating stateful smart contract.")
+        ,   True                        #   the application index is in the confirmation of each creation
+        )
+
+        for chunk, (funder, cost), (txids, group_err, confirmed) in zip(chunks, funders, sent):
+            self.__release_funder(funder, cost, not group_err.isError())
+            step: int = 1 if fund <= 0 else 2
+            for position, (index, unsigned_txn, _, smart_contract_address) in enumerate(chunk):
+                app_id = confirmed[position * step].get('application-index', 0) if len(confirmed) > 0 else 0
+                if group_err.isError() or app_id == 0:
+                    results[index] = ("", group_err if group_err.isError() else
+                        DopError(120, "An error occurred while creating stateful smart contract."))
+                else:
+                    self.__watch_contract(app_id, unsigned_txn.sender, smart_contract_address)
+                    results[index] = (smart_contract_address + '@' + str(app_id), DopError(0,""))
+
+        err = DopError(0,"")
+        for _, item_err in results:
+            if item_err.isError():
+                err = item_err
+                break
+        return results, err
+
+    @staticmethod
+    def creation_note(
+        batch: str                      #   identifier of the deploy call (random)
+    ,   index: int                      #   position of the contract in the call
+    ) -> bytes:
+        """
+        returns the note of a creation transaction (see stateful_create_txn)
+        """
+        return "DOP create {}:{}".format(batch, index).encode()
+
+    @staticmethod
+    def funding_note(
+        batch: str                      #   identifier of the call (random)
+    ,   index: int                      #   position of the payment in the call
+    ) -> bytes:
+        """
+        returns the note of a funding payment (it starts with BlockFollower.FUNDING_NOTE)
+        """
+        return "DOP funds {}:{}".format(batch, index).encode()
+
     def algorand_sub_optin(     #   ALGORAND SPECIFIC
         self,
         from_mnemonic: str,         #   mnemonic (secret) of the account that is opting in
@@ -991,48 +2247,60 @@ class workerAlgorand():
         NOTE:   the subscriber, before subscribing the contract X, MUST opt-in to the contract X
         """
         #   see 01_sub_optin.py
-        
+        err: DopError
+        operation, err = self.__optin_op(from_mnemonic, application_address)
+        if err.isError():
+            return err
+
+        #   TODO: the confirmed transaction can be used to provide detailed log
+        txid, err = self.__submit(operation.txn, operation.private_key, operation.send_error, operation.wait_error)
+        return err
+
+    def algorand_sub_optin_nowait(      #   ALGORAND SPECIFIC
+        self,
+        from_mnemonic: str,
+        application_address: str
+        ) -> Tuple[OperationHandle, DopError]:
+        """
+        Non blocking version of algorand_sub_optin (see subscribe_nowait)
+        """
+        err: DopError
+        operation, err = self.__optin_op(from_mnemonic, application_address)
+        if err.isError():
+            return None,err
+        return self.__send_nowait(operation)
+
+    #   private method
+    def __optin_op(self, from_mnemonic: str, application_address: str) -> Tuple['_Operation', DopError]:
         if self._i_algod_client == None:
-            return DopError(1,"Missing value for algod client.")
+            return None,DopError(1,"Missing value for algod client.")
+        return self.optin_operation(self._i_params.params('optin'), from_mnemonic, application_address)
 
-        params = self._i_algod_client.suggested_params()
-        params.flat_fee = True
-        params.fee = 1000
+    @staticmethod
+    def optin_operation(
+        params: transaction.SuggestedParams
+    ,   from_mnemonic: str
+    ,   application_address: str
+    ) -> Tuple['_Operation', DopError]:
         txn_note = "DOP OPTIN".encode()
 
         err: DopError
 
         #subscriber_private_key = mnemonic.to_private_key(from_mnemonic)
-        subscriber_private_key, err = self.mnemonic_to_private_key(from_mnemonic)
+        subscriber_private_key, err = workerAlgorand.mnemonic_to_private_key(from_mnemonic)
         if err.isError():
-            return err
+            return None,err
         subscriber_address = account.address_from_private_key(subscriber_private_key)
 
         appid = int(application_address)
         unsigned_txn = ApplicationOptInTxn(subscriber_address, params, appid, None, None, None, None, txn_note)
-        signed_txn = unsigned_txn.sign(subscriber_private_key)
-
-        txid =''
-        try:
-            txid = self._i_algod_client.send_transaction(signed_txn)
-            #   print("Successfully sent transaction with txID: {}".format(txid))
-
-        except Exception as err:
-            #   print(err)
-            return DopError(205,"An exception occurred when sending optin transaction.")
 
-        try:
-            confirmed_txn = self.wait_for_confirmation(self._i_algod_client, txid, 4)  
-            #   TODO: confirmed_txn can be used to provide detailed log, see next
-            #   commented lines
-            #   print("Transaction information: {}".format(json.dumps(confirmed_txn, indent=4)))
-            #   print("Decoded note: {}".format(base64.b64decode(confirmed_txn["txn"]["txn"]["note"]).decode()))
-
-        except Exception as err:
-            #   print(err)
-            return DopError(302,"An exception occurred while waiting for confirmation of optin transaction.")
-
-        return DopError(0,"")
+        return _Operation(
+            unsigned_txn
+        ,   subscriber_private_key
+        ,   DopError(205,"An exception occurred when sending optin transaction.")
+        ,   DopError(302,"An exception occurred while waiting for confirmation of optin transaction.")
+        ), DopError(0,"")
 
 
     def algorand_sub_optout(     #   ALGORAND SPECIFIC
@@ -1044,49 +2312,61 @@ class workerAlgorand():
         Algorand specific (symmetric to algorand_sub_optin)
         NOTE:   a subscriber that has unsubscribed should call optout, too
         """
-        
-        if self._i_algod_client == None:
-            return DopError(1,"Missing value for algod client.")
-
-        params = self._i_algod_client.suggested_params()
-        params.flat_fee = True
-        params.fee = 1000
+        err: DopError
+        operation, err = self.__optout_op(from_mnemonic, application_address)
+        if err.isError():
+            return err
+
+        #   TODO: the confirmed transaction can be used to provide detailed log
+        txid, err = self.__submit(operation.txn, operation.private_key, operation.send_error, operation.wait_error)
+        return err
+
+    def algorand_sub_optout_nowait(     #   ALGORAND SPECIFIC
+        self,
+        from_mnemonic: str,
+        application_address: str
+        ) -> Tuple[OperationHandle, DopError]:
+        """
+        Non blocking version of algorand_sub_optout (see subscribe_nowait)
+        """
+        err: DopError
+        operation, err = self.__optout_op(from_mnemonic, application_address)
+        if err.isError():
+            return None,err
+        return self.__send_nowait(operation)
+
+    #   private method
+    def __optout_op(self, from_mnemonic: str, application_address: str) -> Tuple['_Operation', DopError]:
+        if self._i_algod_client == None:
+            return None,DopError(1,"Missing value for algod client.")
+        return self.optout_operation(self._i_params.params('optout'), from_mnemonic, application_address)
+
+    @staticmethod
+    def optout_operation(
+        params: transaction.SuggestedParams
+    ,   from_mnemonic: str
+    ,   application_address: str
+    ) -> Tuple['_Operation', DopError]:
         txn_note = "DOP OPTOUT".encode()
 
         err: DopError
         subscriber_private_key: str
 
-        subscriber_private_key, err = self.mnemonic_to_private_key(from_mnemonic)
+        subscriber_private_key, err = workerAlgorand.mnemonic_to_private_key(from_mnemonic)
         if err.isError():
-            return err
+            return None,err
         subscriber_address = account.address_from_private_key(subscriber_private_key)
 
         appid = int(application_address)
         unsigned_txn = ApplicationCloseOutTxn(subscriber_address, params, appid, None, None, None, None, txn_note)
-        signed_txn = unsigned_txn.sign(subscriber_private_key)
-
-        txid =''
-        try:
-            txid = self._i_algod_client.send_transaction(signed_txn)
-            #   print("Successfully sent transaction with txID: {}".format(txid))
 
-        except Exception as err:
-            #   print(err)
-            return DopError(206,"An exception occurred when sending optout transaction.")
-
-        try:
-            confirmed_txn = self.wait_for_confirmation(self._i_algod_client, txid, 4)  
-            #   TODO: confirmed_txn can be used to provide detailed log, see next
-            #   commented lines
-            #   print("Transaction information: {}".format(json.dumps(confirmed_txn, indent=4)))
-            #   print("Decoded note: {}".format(base64.b64decode(confirmed_txn["txn"]["txn"]["note"]).decode()))
-
-        except Exception as err:
-            #   print(err)
-            return DopError(303,"An exception occurred while waiting for \
+        return _Operation(
+            unsigned_txn
+        ,   subscriber_private_key
+        ,   DopError(206,"An exception occurred when sending optout transaction.")
+        ,   DopError(303,"An exception occurred while waiting for \
                         confirmation of optout transaction.")
-
-        return DopError(0,"")
+        ), DopError(0,"")
 
 
     def subscribe(self,
@@ -1098,13 +2378,46 @@ class workerAlgorand():
         """
         Subscribe to a contract
         """
+        err: DopError
+        operation, err = self.__subscribe_op(subscriber_psw, contract_address)
+        if err.isError():
+            return "",err
+
+        txid, err = self.__submit(operation.txn, operation.private_key, operation.send_error, operation.wait_error)
+        if err.isError():
+            return "",err
+
+        return txid,DopError(0,"")
+
+    def subscribe_nowait(self,
+                  subscriber_addr: str,             #   subscriber address
+                  subscriber_psw: str,              #   private key mnemonic
+                  contract_address: str,            #   algorand application index
+                  secret: str                       #   not used in this release
+                  ) -> Tuple[OperationHandle, DopError]:
+        """
+        Non blocking version of subscribe: returns as soon as the transaction has been sent
+        the returned handle holds the transaction id and can be polled or waited for
+        (the confirmation is followed by the shared confirmation tracker)
+        """
+        err: DopError
+        operation, err = self.__subscribe_op(subscriber_psw, contract_address)
+        if err.isError():
+            return None,err
+        return self.__send_nowait(operation)
 
+    #   private method
+    def __subscribe_op(self, subscriber_psw: str, contract_address: str) -> Tuple['_Operation', DopError]:
         if self._i_algod_client == None:
-            return "",DopError(1,"")        #   must be connected to a node
+            return None,DopError(1,"")        #   must be connected to a node
+        return self.subscribe_operation(self._i_params.params('subscribe'), subscriber_psw, contract_address)
 
-        params = self._i_algod_client.suggested_params()
-        params.flat_fee = True
-        params.fee = 1000
+    @staticmethod
+    def subscribe_operation(
+        params: transaction.SuggestedParams
+    ,   subscriber_psw: str
+    ,   contract_address: str
+    ) -> Tuple['_Operation', DopError]:
         txn_note = "DOP SUBSCRIBE".encode()
 
     #   the transaction type that has to be sent is of type ApplicationNoOpTxn
@@ -1114,39 +2427,23 @@ class workerAlgorand():
         err: DopError
         subscriber_private_key: str
 
-        subscriber_private_key, err = self.mnemonic_to_private_key(subscriber_psw)
+        subscriber_private_key, err = workerAlgorand.mnemonic_to_private_key(subscriber_psw)
         if err.isError():
-            return "",err
+            return None,err
 
         subscriber_address = account.address_from_private_key(subscriber_private_key)
 
         app_args : list = []
         app_args.append(bytes('subscribe','utf-8'))
         unsigned_txn = ApplicationNoOpTxn(subscriber_address, params, contract_address, app_args, None, None, None, txn_note)
-        signed_txn = unsigned_txn.sign(subscriber_private_key)
-
-        txid = ''
-        try:
-            txid = self._i_algod_client.send_transaction(signed_txn)
-            #print("Successfully sent transaction with txID: {}".format(txid))
-
-        except Exception as err:
-            #print(err)
-            return "", DopError(207,"An exception occurred when sending subscribe transaction.")
-
-        # wait for confirmation 
-        try:
-            confirmed_txn = self.wait_for_confirmation(self._i_algod_client,txid,4)
-
-            #print("Transaction information: {}".format(json.dumps(confirmed_txn, indent=4)))
-            #   print("Decoded note: {}".format(base64.b64decode(confirmed_txn["txn"]["txn"]["note"]).decode()))
 
-        except Exception as err:
-            #print(err)
-            return "",DopError(304,"An exception occurred while waiting for confirmation \
+        return _Operation(
+            unsigned_txn
+        ,   subscriber_private_key
+        ,   DopError(207,"An exception occurred when sending subscribe transaction.")
+        ,   DopError(304,"An exception occurred while waiting for confirmation \
                     of subscribe transaction.")
-
-        return txid,DopError(0,"")
+        ), DopError(0,"")
 
 
     def unsubscribe(self, 
@@ -1159,20 +2456,50 @@ class workerAlgorand():
             UnSubscribe from a contract
             return transaction id
             """
+            err: DopError
+            operation, err = self.__unsubscribe_op(subscriber_psw, contract_address)
+            if err.isError():
+                return "",err
 
+            txid, err = self.__submit(operation.txn, operation.private_key, operation.send_error, operation.wait_error)
+            if err.isError():
+                return "",err
+
+            return txid,DopError(0,'')
+
+    def unsubscribe_nowait(self,
+                    subscriber_addr: str,               #   not used
+                    subscriber_psw: str,                #   subscriber account private key mnemonic
+                    contract_address: str               #   application index
+                    ) -> Tuple[OperationHandle, DopError]:
+        """
+        Non blocking version of unsubscribe (see subscribe_nowait)
+        """
+        err: DopError
+        operation, err = self.__unsubscribe_op(subscriber_psw, contract_address)
+        if err.isError():
+            return None,err
+        return self.__send_nowait(operation)
+
+    #   private method
+    def __unsubscribe_op(self, subscriber_psw: str, contract_address: str) -> Tuple['_Operation', DopError]:
             if self._i_algod_client == None:
-                return "",DopError(1,"Missing value for algod client.")        #   must be connected to a node
+                return None,DopError(1,"Missing value for algod client.")        #   must be connected to a node
+            return self.unsubscribe_operation(self._i_params.params('unsubscribe'), subscriber_psw, contract_address)
 
-            params = self._i_algod_client.suggested_params()
-            params.flat_fee = True
-            params.fee = 1000
+    @staticmethod
+    def unsubscribe_operation(
+        params: transaction.SuggestedParams
+    ,   subscriber_psw: str
+    ,   contract_address: str
+    ) -> Tuple['_Operation', DopError]:
             txn_note = "DOP UNSUBSCRIBE".encode()
 
             err: DopError
             subscriber_private_key: str
-            subscriber_private_key, err = self.mnemonic_to_private_key(subscriber_psw)
+            subscriber_private_key, err = workerAlgorand.mnemonic_to_private_key(subscriber_psw)
             if err.isError():
-                return "",err
+                return None,err
             subscriber_address = account.address_from_private_key(subscriber_private_key)
 
             application_index = int(contract_address)
@@ -1180,30 +2507,172 @@ class workerAlgorand():
             app_args : list = []
             app_args.append(bytes('unsubscribe','utf-8'))
             unsigned_txn = ApplicationNoOpTxn(subscriber_address, params, application_index, app_args, None, None, None, txn_note)
-            signed_txn = unsigned_txn.sign(subscriber_private_key)
 
-            txid = ''
-            try:
-                txid = self._i_algod_client.send_transaction(signed_txn)
-                #print("Successfully sent transaction with txID: {}".format(txid))
+            return _Operation(
+                unsigned_txn
+            ,   subscriber_private_key
+            ,   DopError(208,'An exception occurred when sending unsubscribe transaction.')
+            ,   DopError(305,'An exception occurred while waiting for \
+                            confirmation of unsubscribe transaction')
+            ), DopError(0,"")
+
+    def onboard_subscriber(self,
+                    subscriber_addr: str,           #   not used (the address is derived from subscriber_psw)
+                    subscriber_psw: str,            #   subscriber private key mnemonic
+                    contract_address: str,          #   application index
+                    amount: int                     #   starting balance (microAlgo)
+                    ) -> Tuple[str, DopError]:      #   txid of the subscribe transaction, DopError
+        """
+        Funds the subscriber account, opts it in and subscribes it as a single atomic group
+        (set_starting_balance + algorand_sub_optin + subscribe, waited for once)
+        the funding payment is sent by a funder account (or by the owner account) and pays
+        the fees of the whole group
+        NOTE:   the group requires a contract deployed with dop.stateful.teal version 1.5 or later
+                (previous versions reject groups of 3 transactions): for older contracts the three
+                transactions are sent and waited for one after the other, each paying its own fee
+                (not available while a transaction is open, error 218)
+        """
+        if self._own_mnemonic == None:
+            return "",DopError(201, "Owner mnemonic not provided.")
+        if self._i_algod_client == None:
+            return "",DopError(1,"Missing value for algod client.")
+        try:
+            app_id = self.application_index(contract_address)
+        except ValueError:
+            return "",DopError(11,"Invalid contract address.")
 
-            except Exception as err:
-                #print(err)
-                return "", DopError(208,'An exception occurred when sending unsubscribe transaction.')
+        err: DopError
+        buffered: bool = getattr(self._i_local, 'buffer', None) is not None
+        grouped: bool = self.__grouped_calls(app_id)
+        if buffered and not grouped:
+            return "",self.__ungrouped_error()
+        params = self._i_params.params('subscribe')
+        cost: int = amount + params.fee * 3
+        funder = self.__select_funder(cost)
+
+        txns, err = self.onboard_txns(
+            params
+        ,   funder.mnemonic if funder is not None else self._own_mnemonic
+        ,   subscriber_psw
+        ,   str(app_id)                 #   contract_address may be encoded (see application_index)
+        ,   amount
+        ,   grouped and not buffered    #   the groups of a transaction are formed by commit
+        )
+        if err.isError():
+            self.__release_funder(funder, cost, False)
+            return "",err
 
-            # wait for confirmation 
-            try:
-                confirmed_txn = self.wait_for_confirmation(self._i_algod_client, txid, 4)  
+        send_error = DopError(211,"An exception occurred when sending the transaction groups.")
+        wait_error = DopError(308,"An exception occurred while waiting for confirmation of the transaction groups.")
+        if grouped:
+            txids, err = self.__submit_many(txns, send_error, wait_error)
+        else:
+            txids, err = self.__send_sequential(txns, send_error, wait_error)
+        self.__release_funder(funder, cost, not err.isError())
+        if err.isError():
+            return "",err
+        return (txids[-1] if len(txids) > 0 else ""),DopError(0,"")
 
-                #print("Transaction information: {}".format(json.dumps(confirmed_txn, indent=4)))
-                #print("Decoded note: {}".format(base64.b64decode(confirmed_txn["txn"]["txn"]["note"]).decode()))
+    @staticmethod
+    def onboard_txns(
+        params: transaction.SuggestedParams
+    ,   funder_mnemonic: str
+    ,   subscriber_psw: str
+    ,   contract_address: str
+    ,   amount: int
+    ,   pooled_fees: bool = True        #   the funding payment pays the fees of the group
+    ) -> Tuple[list, DopError]:
+        """
+        builds the group (payment, optin, subscribe) - see onboard_subscriber
+        """
+        err: DopError
+        subscriber_private_key, err = workerAlgorand.mnemonic_to_private_key(subscriber_psw)
+        if err.isError():
+            return [],err
+        subscriber_address = account.address_from_private_key(subscriber_private_key)
 
-            except Exception as err:
+        operations: list = []
+        for build, args in (
+            (workerAlgorand.payment_operation,      (params, funder_mnemonic, subscriber_address, amount))
+        ,   (workerAlgorand.optin_operation,        (params, subscriber_psw, contract_address))
+        ,   (workerAlgorand.subscribe_operation,    (params, subscriber_psw, contract_address))
+        ):
+            operation, err = build(*args)
+            if err.isError():
+                return [],err
+            operations.append(operation)
+
+        if pooled_fees:
+            operations[0].txn.fee = params.fee * len(operations)
+            for operation in operations[1:]:
+                operation.txn.fee = 0
+
+        return [(operation.txn, operation.private_key) for operation in operations], DopError(0,"")
+
+    def offboard_subscriber(self,
+                    subscriber_addr: str,           #   not used (the address is derived from subscriber_psw)
+                    subscriber_psw: str,            #   subscriber private key mnemonic
+                    contract_address: str,          #   application index
+                    close_to: str = ''              #   if not empty, the remaining balance is sent to close_to
+                    ) -> Tuple[str, DopError]:      #   txid of the unsubscribe transaction, DopError
+        """
+        Unsubscribes the subscriber, opts it out and (optionally) closes the subscriber account
+        as a single atomic group (unsubscribe + algorand_sub_optout + payment, waited for once)
+        NOTE:   the group requires a contract deployed with dop.stateful.teal version 1.5 or later:
+                for older contracts the transactions are sent and waited for one after the other
+                (not available while a transaction is open, error 218)
+        """
+        if self._i_algod_client == None:
+            return "",DopError(1,"Missing value for algod client.")
+        try:
+            app_id = self.application_index(contract_address)
+        except ValueError:
+            return "",DopError(11,"Invalid contract address.")
 
-                return "",DopError(305,'An exception occurred while waiting for \
-                            confirmation of unsubscribe transaction')
+        err: DopError
+        grouped: bool = self.__grouped_calls(app_id)
+        if not grouped and getattr(self._i_local, 'buffer', None) is not None:
+            return "",self.__ungrouped_error()
+        txns, err = self.offboard_txns(self._i_params.params('unsubscribe'), subscriber_psw, str(app_id), close_to)
+        if err.isError():
+            return "",err
 
-            return txid,DopError(0,'')
+        send_error = DopError(211,"An exception occurred when sending the transaction groups.")
+        wait_error = DopError(308,"An exception occurred while waiting for confirmation of the transaction groups.")
+        if grouped:
+            txids, err = self.__submit_many(txns, send_error, wait_error)
+        else:
+            txids, err = self.__send_sequential(txns, send_error, wait_error)
+        if err.isError():
+            return "",err
+        return (txids[0] if len(txids) > 0 else ""),DopError(0,"")
+
+    @staticmethod
+    def offboard_txns(
+        params: transaction.SuggestedParams
+    ,   subscriber_psw: str
+    ,   contract_address: str
+    ,   close_to: str = ''
+    ) -> Tuple[list, DopError]:
+        """
+        builds the group (unsubscribe, optout, closing payment) - see offboard_subscriber
+        """
+        err: DopError
+        txns: list = []
+        for build in (workerAlgorand.unsubscribe_operation, workerAlgorand.optout_operation):
+            operation, err = build(params, subscriber_psw, contract_address)
+            if err.isError():
+                return [],err
+            txns.append((operation.txn, operation.private_key))
+
+        if close_to != '':
+            #   the account is closed: the whole remaining balance goes to close_to
+            subscriber_private_key = txns[0][1]
+            subscriber_address = account.address_from_private_key(subscriber_private_key)
+            close_txn = PaymentTxn(subscriber_address, params, close_to, 0, close_to, "DOP CLOSE".encode())
+            txns.append((close_txn, subscriber_private_key))
+
+        return txns, DopError(0,"")
 
 
     def grant(self,
@@ -1214,43 +2683,29 @@ class workerAlgorand():
               ) -> Tuple[str, DopError]:    #   returns transactionid, DopError
               
             # see 06_pub_call_grant.py
-            if self._i_algod_client == None:
-                return "",DopError(1,"Missing value for algod client.")
-
-            smart_contract_arguments = {
-                    "args":     ['grant']                   #   list of app arguments
-                ,   "addrs":    [subscriber_address]        #   list of account arguments
-                }
-
-            transaction_note = "DOP GRANT"
-
             err: DopError
-            txid: str = ""
-            txid, err = self.dopSmartContract(
-                self._i_algod_client
-            ,   int(contract_address)
-            ,   publisher_passw
-            ,   smart_contract_arguments
-            ,   transaction_note
-            )
-
+            operation, err = self.__creator_op('grant', publisher_passw, contract_address, subscriber_address)
             if err.isError():
                 return "",err
 
-            try:
-                confirmed_txn = self.wait_for_confirmation(self._i_algod_client, txid, 4)  
-
-                #   print("Transaction information: {}".format(json.dumps(confirmed_txn, indent=4)))
-                #   print("Decoded note: {}".format(base64.b64decode(confirmed_txn["txn"]["txn"]["note"]).decode()))
-
-            except Exception as err:
-                #print(err)
-                return txid,DopError(306,"An exception occurred while waiting for \
-                    confirmation of grant transaction.")
-
-            return txid,DopError(0,"")
-            
+            txid: str = ""
+            txid, err = self.__submit(operation.txn, operation.private_key, operation.send_error, operation.wait_error)
+            return txid,err
 
+    def grant_nowait(self,
+              publisher_address: str,       #   not used
+              publisher_passw: str,         #   publisher private key mnemonic
+              contract_address: str,        #   application index
+              subscriber_address: str       #   address of the subscriber to be granted
+              ) -> Tuple[OperationHandle, DopError]:
+        """
+        Non blocking version of grant (see subscribe_nowait)
+        """
+        err: DopError
+        operation, err = self.__creator_op('grant', publisher_passw, contract_address, subscriber_address)
+        if err.isError():
+            return None,err
+        return self.__send_nowait(operation)
 
 
     def revoke(self,
@@ -1261,42 +2716,206 @@ class workerAlgorand():
               ) -> Tuple[str, DopError]:    #   returns transactionid, DopError
 
               # see 07_pub_call_revoke.py
+            err: DopError
+            operation, err = self.__creator_op('revoke', publisher_passw, contract_address, subscriber_address)
+            if err.isError():
+                return "",err
+
+            txid: str = ""
+            txid, err = self.__submit(operation.txn, operation.private_key, operation.send_error, operation.wait_error)
+            return txid,err
+
+    def revoke_nowait(self,
+              publisher_address: str,       #   not used
+              publisher_passw: str,         #   publisher private key mnemonic
+              contract_address: str,        #   application index
+              subscriber_address: str       #   address of the subscriber to be revoked
+              ) -> Tuple[OperationHandle, DopError]:
+        """
+        Non blocking version of revoke (see subscribe_nowait)
+        """
+        err: DopError
+        operation, err = self.__creator_op('revoke', publisher_passw, contract_address, subscriber_address)
+        if err.isError():
+            return None,err
+        return self.__send_nowait(operation)
+
+    #   private method
+    def __creator_op(
+        self,
+        op: str,                        #   "grant" or "revoke"
+        publisher_passw: str,           #   publisher private key mnemonic
+        contract_address: str,          #   application index
+        subscriber_address: str         #   address of the subscriber
+        ) -> Tuple['_Operation', DopError]:
             if self._i_algod_client == None:
-                return "",DopError(1,"Missing value for algod client.")
+                return None,DopError(1,"Missing value for algod client.")
+            try:
+                app_id = self.application_index(contract_address)
+            except ValueError:
+                return None,DopError(11,"Invalid contract address.")
+            return self.creator_operation(self._i_params.params(op), op, publisher_passw, str(app_id), subscriber_address)
 
+    @staticmethod
+    def creator_operation(
+        params: transaction.SuggestedParams
+    ,   op: str                         #   "grant" or "revoke"
+    ,   publisher_passw: str            #   publisher private key mnemonic
+    ,   contract_address: str           #   application index
+    ,   subscriber_address: str         #   address of the subscriber
+    ) -> Tuple['_Operation', DopError]:
             smart_contract_arguments = {
-                "args":     ['revoke']                   #   list of app arguments
-            ,   "addrs":    [subscriber_address]        #   list of account arguments
-            }
+                    "args":     [op]                        #   list of app arguments
+                ,   "addrs":    [subscriber_address]        #   list of account arguments
+                }
 
-            transaction_note = "DOP REVOKE"
+            transaction_note = "DOP GRANT" if op == 'grant' else "DOP REVOKE"
 
-            txid: str = ""
             err: DopError
-            txid, err = self.dopSmartContract(
-                self._i_algod_client
-            ,   contract_address
+            unsigned_txn, publisher_private_key, err = workerAlgorand.app_call_txn(
+                params
+            ,   int(contract_address)
             ,   publisher_passw
             ,   smart_contract_arguments
             ,   transaction_note
             )
 
             if err.isError():
-                return "",err
+                return None,err
 
-            try:
-                confirmed_txn = self.wait_for_confirmation(self._i_algod_client, txid, 4)  
+            wait_error: DopError
+            if op == 'grant':
+                wait_error = DopError(306,"An exception occurred while waiting for \
+                    confirmation of grant transaction.")
+            else:
+                wait_error = DopError(307,"An exception occurred while waiting for \
+                    confirmation of revoke transaction.")
 
-                #   print("Transaction information: {}".format(json.dumps(confirmed_txn, indent=4)))
-                #   print("Decoded note: {}".format(base64.b64decode(confirmed_txn["txn"]["txn"]["note"]).decode()))
+            return _Operation(
+                unsigned_txn
+            ,   publisher_private_key
+            ,   DopError(202,f"An exception occurred when sending transaction.")
+            ,   wait_error
+            ), DopError(0,"")
 
-            except Exception as err:
-                #print(err)
-                return txid,DopError(307,"An exception occurred while waiting for \
-                    confirmation of revoke transaction.")
 
-            return txid,DopError(0,"")
+    def grant_many(self,
+              publisher_address: str,       #   not used
+              publisher_passw: str,         #   publisher private key mnemonic
+              contract_address: str,        #   application index
+              subscriber_addresses: list    #   addresses of the subscribers to be granted
+              ) -> Tuple[list, DopError]:   #   returns list of transaction ids, DopError
+        """
+        Grants many subscribers: every application call carries up to MAX_APP_ACCOUNTS
+        subscribers and up to MAX_GROUP_SIZE calls are sent as one atomic group
+        NOTE:   the contracts deployed with dop.stateful.teal before version 1.5 process only the
+                first account of a call and reject larger groups: for them every subscriber is
+                granted by a call of its own sent as a group of its own (not available while
+                a transaction is open, error 218)
+        """
+        return self.__creator_call_many(
+            'grant'
+        ,   publisher_passw
+        ,   contract_address
+        ,   subscriber_addresses
+        ,   "DOP GRANT"
+        ,   DopError(202,"An exception occurred when sending transaction.")
+        ,   DopError(306,"An exception occurred while waiting for confirmation of grant transaction.")
+        )
+
+    def revoke_many(self,
+              publisher_address: str,       #   not used
+              publisher_passw: str,         #   publisher private key mnemonic
+              contract_address: str,        #   application index
+              subscriber_addresses: list    #   addresses of the subscribers to be revoked
+              ) -> Tuple[list, DopError]:   #   returns list of transaction ids, DopError
+        """
+        Revokes many subscribers (see grant_many)
+        """
+        return self.__creator_call_many(
+            'revoke'
+        ,   publisher_passw
+        ,   contract_address
+        ,   subscriber_addresses
+        ,   "DOP REVOKE"
+        ,   DopError(202,"An exception occurred when sending transaction.")
+        ,   DopError(307,"An exception occurred while waiting for confirmation of revoke transaction.")
+        )
+
+    def set_keys(self,
+              publisher_address: str,       #   not used
+              publisher_passw: str,         #   publisher private key mnemonic
+              keys: list                    #   list of (application index, key, kid)
+              ) -> Tuple[list, DopError]:   #   returns one (confirmed round, DopError) per key, DopError
+        """
+        Sets the key (and the key index) of many contracts of the publisher (key rotation)
+        one setkey application call per contract, up to MAX_GROUP_SIZE calls per atomic group;
+        the groups are sent concurrently (see hpsz) and each group is waited for once
+        returns, in the same order as keys, the round the key has been set in (0 if the key has
+        not been set or if a transaction is open - see begin_transaction) and the first error
+        NOTE:   the contracts deployed with dop.stateful.teal before version 1.5 reject the calls
+                within larger groups: their calls are sent as groups of their own (not available
+                while a transaction is open, error 218)
+        """
+        if self._i_algod_client == None:
+            return [],DopError(1,"Missing value for algod client.")
 
+        err: DopError
+        txns, err = self.setkey_txns(self._i_params.params('setkey'), publisher_passw, keys)
+        if err.isError():
+            return [],err
+        grouped: list = [self.__grouped_calls(int(unsigned_txn.index)) for unsigned_txn, _ in txns]
+
+        send_error = DopError(202,"An exception occurred when sending transaction.")
+        wait_error = DopError(310,"An exception occurred while waiting for confirmation of setkey transaction.")
+        if getattr(self._i_local, 'buffer', None) is not None:
+            if not all(grouped):
+                return [],self.__ungrouped_error()
+            txids, err = self.__submit_many(txns, send_error, wait_error)
+            return [(0, err) for _ in keys], err
+
+        #   groups of indexes of keys: up to MAX_GROUP_SIZE calls to 1.5 contracts, one call to older contracts
+        indexes: list = [index for index in range(len(txns)) if grouped[index]]
+        index_groups: list = [indexes[start:start + self.MAX_GROUP_SIZE] for start in range(0, len(indexes), self.MAX_GROUP_SIZE)]
+        index_groups.extend([index] for index in range(len(txns)) if not grouped[index])
+        groups: list = [[txns[index] for index in index_group] for index_group in index_groups]
+
+        results: list = [None] * len(txns)
+        err = DopError(0,"")
+        for index_group, (txids, group_err, confirmed) in zip(index_groups, self.__send_group_list(groups, send_error, wait_error)):
+            if group_err.isError() and not err.isError():
+                err = group_err
+            #   the group is confirmed atomically: all the keys of the group are set in the same round
+            confirmed_round: int = confirmed[0].get('confirmed-round', 0) if len(confirmed) > 0 else 0
+            for index in index_group:
+                results[index] = (confirmed_round, group_err)
+        return results, err
+
+    @staticmethod
+    def setkey_txns(
+        params: transaction.SuggestedParams
+    ,   publisher_passw: str            #   publisher private key mnemonic
+    ,   keys: list                      #   list of (application index, key, kid)
+    ) -> Tuple[list, DopError]:         #   list of (unsigned transaction, private key of the sender), DopError
+        """
+        builds the setkey application calls (see op_setkey in dop.stateful.teal)
+        """
+        txns: list = []
+        for contract_address, key, kid in keys:
+            smart_contract_arguments = {
+                    "args":     ['setkey', key, kid]        #   list of app arguments
+                }
+            unsigned_txn, publisher_private_key, err = workerAlgorand.app_call_txn(
+                params
+            ,   int(contract_address)
+            ,   publisher_passw
+            ,   smart_contract_arguments
+            ,   "DOP SETKEY"
+            )
+            if err.isError():
+                return [],err
+            txns.append((unsigned_txn, publisher_private_key))
+        return txns, DopError(0,"")
 
 
     def balance(self,
@@ -1305,17 +2924,9 @@ class workerAlgorand():
                 contract_address: str) -> Tuple[dict, DopError]:       #   address (blockchain layer) of the contract
         """
         Get the balance of a user with `address` of the contract with `contract_address`
+        (see get_balance) - secret is not used
         """
-        """
-        in this version this method is not "really" implemented
-        """
-        response = {}
-        response['subscribed'] = 1
-        response['granted'] = 1             #   shortcut - use sub_keyget to valorize this field or use postgres DB
-        response['credit'] = 100
-        response['debit'] = 0
-
-        return (response, DopError(0,""))
+        return self.__subscriber_state(subscriber_address, contract_address)
 
     
     def admin_get_grants(self,
@@ -1324,8 +2935,84 @@ class workerAlgorand():
         """
         This method is used by the publisher only in order to retrieve the list 
         of the EoA address of the granted subscribers
+        (read from the grant index, see BlockFollower) - publisher_address is not used
+        """
+        app_id, err = self.__indexed_contract(contract_address)
+        if err.isError():
+            return [], err
+        return self._i_grant_index.grants(app_id), DopError(0,"")
+
+    def get_subscribers(self,
+                        contract_address: str) -> Tuple[list, DopError]:    #   address (blockchain layer) of the contract
         """
-        return [], DopError()
+        Algorand specific
+        returns {'address', 'subscribed', 'granted', 'round'} for every account opted in the contract
+        (read from the grant index, see admin_get_grants)
+        """
+        app_id, err = self.__indexed_contract(contract_address)
+        if err.isError():
+            return [], err
+        return self._i_grant_index.subscribers(app_id), DopError(0,"")
+
+    #   private method
+    def __indexed_contract(self, contract_address: str) -> Tuple[int, DopError]:
+        if self._i_follower is None:
+            return 0, DopError(215,"Grant index not enabled (bfdb).")
+        try:
+            app_id = self.application_index(contract_address)
+        except ValueError:
+            return 0, DopError(11,"Invalid contract address.")
+        if not self._i_follower.is_watched(app_id):
+            return 0, DopError(216,"The contract is not in the grant index.")
+        return app_id, DopError(0,"")
+
+    #   private method
+    def __watch_contract(self, app_id: int, creator_address: str, smart_contract_address: str):
+        #   the contracts deployed by the worker are indexed even if the follower
+        #   does not recognize their approval program
+        if self._i_follower is not None and app_id > 0:
+            self._i_follower.watch(app_id, creator_address, smart_contract_address)
+
+    def add_event_listener(self, callback: Callable[[DopEvent], None]) -> DopError:
+        """
+        Algorand specific
+        callback(DopEvent) is called, from the block follower thread, for every DOP transaction
+        committed (contract created, optin, closeout, subscribe, unsubscribe, grant, revoke, setkey,
+        funding payment): a single follower closes the pending operations of all the callers
+        (see deploy_contract) without polling their transactions
+        NOTE:   after a restart the rounds not yet checkpointed are followed again (events can be
+                delivered twice: use DopEvent.txid to discard them) - the block follower has to be
+                enabled (bfdb)
+        """
+        self._i_events.add_listener(callback)
+        return DopError(0,"")
+
+    def remove_event_listener(self, callback: Callable[[DopEvent], None]) -> DopError:
+        self._i_events.remove_listener(callback)
+        return DopError(0,"")
+
+    def event_queue(self, maxsize: int = 0):
+        """
+        Algorand specific
+        returns a queue.Queue receiving the following DopEvent (see add_event_listener)
+        if maxsize is not 0 and the queue is full the events are dropped (see eventStats)
+        """
+        return self._i_events.add_queue(maxsize)
+
+    def eventStats(self) -> dict:
+        """
+        returns the number of events delivered and dropped (full queues)
+        """
+        return self._i_events.stats()
+
+    def followerStats(self) -> dict:
+        """
+        returns the last round indexed and the number of indexed contracts and subscribers
+        (empty dict if the block follower is not enabled)
+        """
+        if self._i_grant_index is None:
+            return {}
+        return self._i_grant_index.stats()
 
 
     def set_starting_balance(self, 
@@ -1339,11 +3026,202 @@ class workerAlgorand():
         if self._own_mnemonic == None:
             return ""
 
-        txid, err = self.__account_send(from_mnemonic = self._own_mnemonic, to_address=address, amount=amount)
+        #   the payment is sent by a funder account (if funders are configured) or by the owner account
+        cost: int = amount + self.__funding_fee()
+        funder = self.__select_funder(cost)
+        from_mnemonic = funder.mnemonic if funder is not None else self._own_mnemonic
+
+        txid, err = self.__account_send(from_mnemonic = from_mnemonic, to_address=address, amount=amount)
+        self.__release_funder(funder, cost, not err.isError())
         if err.isError():
             return "" 
 
         return txid
 
+    def set_starting_balances(self,
+                            balances: list                  #   list of (address, amount)
+                            ) -> Tuple[list, DopError]:
+        """
+        Sets the starting balance of many EoAs
+        the payments are packed into atomic groups of up to MAX_GROUP_SIZE payments (the first
+        payment of a group pays the fees of the whole group); the groups are sent concurrently
+        and each group is waited for once
+        returns one (txid, DopError) per address, in the same order as balances, and the first error
+        NOTE:   within a transaction (see begin_transaction) the payments are buffered with their
+                own fees (the groups are formed by commit) and the txids are empty
+        """
+        if self._own_mnemonic == None:
+            return [],DopError(201, "Owner mnemonic not provided.")
+        if self._i_algod_client == None:
+            return [],DopError(1,"Missing value for algod client.")
+
+        err: DopError
+        buffered: bool = getattr(self._i_local, 'buffer', None) is not None
+        params = self._i_params.params('payment')
+
+        #   each group is sent by a funder account (if funders are configured) or by the owner account
+        groups: list = []
+        funders: list = []              #   (funder, cost) per group
+        for start in range(0, len(balances), self.MAX_GROUP_SIZE):
+            chunk = balances[start:start + self.MAX_GROUP_SIZE]
+            cost: int = sum(amount for _, amount in chunk) + params.fee * len(chunk)
+            funder = self.__select_funder(cost)
+            chunk_groups, err = self.payment_groups(
+                params, funder.mnemonic if funder is not None else self._own_mnemonic, chunk, not buffered)
+            if err.isError():
+                self.__release_funder(funder, cost, False)
+                for previous, previous_cost in funders:
+                    self.__release_funder(previous, previous_cost, False)
+                return [],err
+            groups.extend(chunk_groups)
+            funders.append((funder, cost))
+
+        send_error = DopError(209,'An exception occurred when sending payment transaction.')
+        wait_error = DopError(301,'An exception occurred while waiting for the confirmation of the send transaction.')
+        if buffered:
+            txids, err = self.__submit_operations(groups, send_error, wait_error)
+            for funder, cost in funders:
+                self.__release_funder(funder, cost, not err.isError())
+            return [("", err) for _ in balances], err
+
+        results: list = []
+        err = DopError(0,"")
+        sent: list = self.__send_group_list(groups, send_error, wait_error)
+        for group, (funder, cost), (txids, group_err, _) in zip(groups, funders, sent):
+            self.__release_funder(funder, cost, not group_err.isError())
+            if group_err.isError() and not err.isError():
+                err = group_err
+            if len(txids) == 0:
+                txids = [""] * len(group)
+            results.extend((txid, group_err) for txid in txids)
+        return results, err
+
+    #   private method
+    def __funding_fee(self) -> int:
+        return self._i_params.params('payment').fee if self._i_params is not None else 1000
+
+    #   private method
+    def __select_funder(self, cost: int) -> Optional[Funder]:
+        """
+        returns the funder account for a payment of cost microAlgo (None: the owner account pays)
+        the funders below the threshold are topped up (in background) from the owner account
+        """
+        if self._i_funders is None or len(self._i_funders) == 0:
+            return None
+        candidates: list = self._i_funders.top_up_candidates()
+        if len(candidates) > 0:
+            threading.Thread(target=self.__top_up_funders, args=(candidates,), name='dop-funder-top-up', daemon=True).start()
+        return self._i_funders.select(cost)
+
+    #   private method
+    def __release_funder(self, funder: Optional[Funder], cost: int, confirmed: bool):
+        if funder is not None:
+            self._i_funders.release(funder, cost, confirmed)
+
+    #   private method
+    def __top_up_funders(self, funders: list):
+        """
+        sends the top up payments from the owner account (grouped) and waits for their confirmation
+        """
+        try:
+            groups, err = self.payment_groups(
+                self._i_params.params('payment')
+            ,   self._own_mnemonic
+            ,   [(funder.address, self._i_funders.top_up_amount) for funder in funders]
+            )
+            if not err.isError():
+                self.__send_group_list(
+                    groups
+                ,   DopError(209,'An exception occurred when sending payment transaction.')
+                ,   DopError(301,'An exception occurred while waiting for the confirmation of the send transaction.')
+                )
+        finally:
+            for funder in funders:
+                self._i_funders.topped_up(funder)
+
+    def feeStats(self) -> dict:
+        """
+        returns the suggested fee per byte, the minimum fee, the pending transactions and the
+        fee (microAlgo) currently paid by each operation (see FeePolicy)
+        """
+        if self._i_fee_policy is None:
+            return {}
+        return self._i_fee_policy.stats()
+
+    def admissionStats(self) -> dict:
+        """
+        returns the admission window, the transactions in flight, the queue depth (waiting senders)
+        and the admitted/rejected transactions (see AdmissionController)
+        """
+        return self._i_admission.stats()
+
+    def funderStats(self) -> list:
+        """
+        returns, for each funder account, the address, the last known balance (microAlgo) and
+        the number of payments in flight (empty list if no funder is configured)
+        """
+        if self._i_funders is None:
+            return []
+        return self._i_funders.stats()
+
+    @staticmethod
+    def payment_groups(
+        params: transaction.SuggestedParams
+    ,   from_mnemonic: str
+    ,   balances: list                  #   list of (address, amount)
+    ,   pooled_fees: bool = True        #   the first payment of each group pays the fees of the group
+    ) -> Tuple[list, DopError]:
+        """
+        builds the payments from the account of from_mnemonic, packed into groups of up to MAX_GROUP_SIZE
+        """
+        err: DopError
+        from_private_key, err = workerAlgorand.mnemonic_to_private_key(from_mnemonic)
+        if err.isError():
+            return [],err
+        from_address = account.address_from_private_key(from_private_key)
+
+        #   the same (address, amount) may be paid twice: each payment has a note of its own
+        batch: str = os.urandom(8).hex()
+
+        groups: list = []
+        for start in range(0, len(balances), workerAlgorand.MAX_GROUP_SIZE):
+            chunk = balances[start:start + workerAlgorand.MAX_GROUP_SIZE]
+            group: list = []
+            for index, (to_address, amount) in enumerate(chunk):
+                txn_params = params
+                if pooled_fees:
+                    txn_params = copy.copy(params)
+                    txn_params.flat_fee = True
+                    txn_params.fee = params.fee * len(chunk) if index == 0 else 0
+                txn_note = workerAlgorand.funding_note(batch, start + index)
+                group.append((PaymentTxn(from_address, txn_params, to_address, amount, None, txn_note), from_private_key))
+            groups.append(group)
+        return groups, DopError(0,"")
+
+    def set_starting_balance_nowait(self,
+                            address,
+                            amount) -> Tuple[OperationHandle, DopError]:
+        """
+        Non blocking version of set_starting_balance (see subscribe_nowait)
+        """
+        if self._own_mnemonic == None:
+            return None,DopError(201, "Owner mnemonic not provided.")
+
+        err: DopError
+        cost: int = amount + self.__funding_fee()
+        funder = self.__select_funder(cost)
+        operation, err = self.__payment_op(funder.mnemonic if funder is not None else self._own_mnemonic, address, amount)
+        if err.isError():
+            self.__release_funder(funder, cost, False)
+            return None,err
+
+        handle, err = self.__send_nowait(operation)
+        if err.isError():
+            self.__release_funder(funder, cost, False)
+        elif funder is not None:
+            handle.future.add_done_callback(
+                lambda future: self.__release_funder(funder, cost, future.exception() is None))
+        return handle, err
+
 
 
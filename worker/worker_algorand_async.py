@@ -0,0 +1,792 @@
+#   ver:    0.1
+#   date:   18/10/2026
+
+"""
+asyncio version of workerAlgorand: the same operations, as coroutines, on top of
+an async transport to algod and kmd (see async_transport.py)
+the configuration string is the same as workerAlgorand (see workerAlgorand.init)
+"""
+import os
+import time
+import base64
+import asyncio
+import contextvars
+from typing import Tuple, Optional
+
+import msgpack
+
+from    algosdk                     import mnemonic
+from    algosdk                     import account
+from    algosdk                     import error
+from    algosdk.future              import transaction
+
+from error import DopError
+from teal_cache import TealCompileCache
+from teal_cache import StatelessTemplate
+from async_transport import AsyncAlgodClient
+from async_transport import AsyncKMDClient
+from async_transport import AsyncHTTPTransport
+from state_cache import LocalStateCache
+from state_cache import GlobalStateCache
+from confirmation_tracker import ConfirmationTracker
+from fee_policy import FeePolicy
+from admission import AdmissionController
+from admission import AdmissionRejected
+from admission import AsyncAdmission
+from worker_algorand import workerAlgorand
+
+
+class _AsyncConfirmationTracker():
+    """
+    asyncio counterpart of ConfirmationTracker: a single task follows the rounds and
+    resolves the futures of all the outstanding transactions
+    """
+
+    def __init__(self, client: AsyncAlgodClient, on_round=None):
+        self._client = client
+        self._on_round = on_round
+        self._pending: dict = {}                    #   txid -> list of [future, timeout, deadline]
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task = None
+        self._last_round: int = 0
+        self._block_txids: bool = True
+        self._block_misses: int = 0
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.ensure_future(self.__run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except BaseException:
+                pass
+            self._task = None
+        pending = self._pending
+        self._pending = {}
+        for entries in pending.values():
+            for entry in entries:
+                if not entry[0].done():
+                    entry[0].set_exception(Exception('confirmation tracker stopped'))
+
+    def track(self, txid: str, timeout: int) -> asyncio.Future:
+        future = asyncio.get_event_loop().create_future()
+        deadline = self._last_round + timeout if (self._pending and self._last_round > 0) else 0
+        self._pending.setdefault(txid, []).append([future, timeout, deadline])
+        self._wakeup.set()
+        return future
+
+    def __set_last_round(self, round_number: int):
+        if round_number > self._last_round:
+            self._last_round = round_number
+            if self._on_round is not None:
+                self._on_round(round_number)
+        for entries in self._pending.values():
+            for entry in entries:
+                if entry[2] == 0:
+                    entry[2] = self._last_round + entry[1]
+
+    async def __run(self):
+        next_round: int = 0
+        while True:
+            if not self._pending:
+                next_round = 0
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            try:
+                if next_round == 0:
+                    self.__set_last_round((await self._client.status())['last-round'])
+                    next_round = self._last_round
+                if next_round > self._last_round:
+                    self.__set_last_round((await self._client.status_after_block(next_round - 1))['last-round'])
+                    if next_round > self._last_round:
+                        continue
+                await self.__process_round(next_round)
+                next_round += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                await asyncio.sleep(1.0)
+
+    async def __process_round(self, round_number: int):
+        if self._block_txids:
+            try:
+                response = await self._client.algod_request('GET', '/blocks/{}/txids'.format(round_number))
+                for txid in set(self._pending.keys()).intersection(response.get('blockTxids') or []):
+                    await self.__check(txid, round_number, False)
+            except error.AlgodHTTPError as e:
+                #   see ConfirmationTracker.__process_round
+                if e.code in (400, 404):
+                    self._block_misses += 1
+                if e.code != 501 and self._block_misses < ConfirmationTracker.BLOCK_MISSES:
+                    raise
+                self._block_txids = False
+            else:
+                self._block_misses = 0
+
+        for txid in list(self._pending.keys()):
+            expired = any(e[2] != 0 and e[2] <= round_number for e in self._pending.get(txid, []))
+            if expired or not self._block_txids:
+                await self.__check(txid, 0, expired)
+
+    async def __check(self, txid: str, confirmed_round: int, final: bool):
+        try:
+            pending_txn = await self._client.pending_transaction_info(txid)
+        except Exception:
+            if confirmed_round == 0:
+                if final:
+                    self.__resolve(txid, None, Exception('pending tx not found in timeout rounds'), True)
+                return
+            #   found in the block, but the pending info is not available anymore (see ConfirmationTracker)
+            pending_txn = {'confirmed-round': confirmed_round, 'pool-error': ''}
+            try:
+                response = await self._client.block_info(confirmed_round, 'msgpack')
+                block = msgpack.unpackb(response, raw=False, strict_map_key=False).get('block', {})
+                pending_txn = ConfirmationTracker.block_confirmation(block, txid, confirmed_round)
+            except Exception:
+                pass
+
+        if pending_txn.get('confirmed-round', 0) > 0:
+            self.__resolve(txid, pending_txn, None, False)
+        elif pending_txn.get('pool-error'):
+            self.__resolve(txid, None, Exception('pool error: {}'.format(pending_txn['pool-error'])), False)
+        elif final:
+            self.__resolve(txid, None, None, True)
+
+    def __resolve(self, txid: str, pending_txn: Optional[dict], exception: Exception, expired_only: bool):
+        entries = self._pending.pop(txid, [])
+        if expired_only:
+            remaining = [e for e in entries if not (e[2] != 0 and e[2] <= self._last_round)]
+            entries = [e for e in entries if e not in remaining]
+            if remaining:
+                self._pending[txid] = remaining
+        for future, timeout, _ in entries:
+            if future.done():
+                continue
+            if pending_txn is not None:
+                future.set_result(pending_txn)
+            else:
+                future.set_exception(exception or Exception(
+                    'pending tx not found in timeout rounds, timeout value = : {}'.format(timeout)))
+
+
+class AsyncWorkerAlgorand():
+    """
+    asyncio version of workerAlgorand
+    all the operations (but init, begin_transaction and rollback) are coroutines; the
+    transactions are built by the static builders of workerAlgorand and the error codes
+    are the same
+    NOTE:   the transaction buffer (begin_transaction/commit/rollback) is kept per task
+    """
+
+    MAX_GROUP_SIZE: int = workerAlgorand.MAX_GROUP_SIZE
+
+    def __init__(self):
+        #   the sync worker holds the configuration (connection string parsing, paths, ...)
+        self._i_worker = workerAlgorand()
+        self._i_algod_client: AsyncAlgodClient = None
+        self._i_kmd_client: AsyncKMDClient = None
+        self._i_tracker: _AsyncConfirmationTracker = None
+        self._i_teal_cache: TealCompileCache = None
+        self._i_grouped_apps: dict = {}
+        self._i_templates: dict = {}
+        self._i_wallet_id: str = ''
+        self._own_mnemonic: str = None
+
+        self._i_params: transaction.SuggestedParams = None
+        self._i_params_at: float = 0.0
+        self._i_params_ttl: float = 5.0
+        self._i_round: int = 0
+        self._i_params_lock: asyncio.Lock = None
+        self._i_fee_policy: FeePolicy = None
+        self._i_admission: AsyncAdmission = AsyncAdmission(AdmissionController())
+
+        self._i_buffer = contextvars.ContextVar('dop_async_buffer', default=None)
+        self._i_txids = contextvars.ContextVar('dop_async_txids', default=[])
+
+    #============================================================================
+    #   connection
+    #============================================================================
+    def init(self, constring: str) -> DopError:
+        return self._i_worker.init(constring)
+
+    async def open(self) -> DopError:
+        config: dict = self._i_worker.configuration()
+
+        err, algod_token, algod_address = self._i_worker.algodEndpoint()
+        if err.isError():
+            return err
+        try:
+            pool_size = int(config['hpsz'])
+            timeout = float(config['hpto'])
+        except ValueError:
+            return DopError(25, "Invalid value for http pool size (hpsz) or http timeout (hpto).")
+        timeout = timeout if timeout > 0 else None
+        try:
+            max_concurrent = int(config['hpcon'])
+        except ValueError:
+            return DopError(35, "Invalid value for http concurrency limit (hpcon).")
+
+        self._i_algod_client = AsyncAlgodClient(algod_token, algod_address,
+            AsyncHTTPTransport(algod_address, pool_size, timeout, max_concurrent))
+        try:
+            await self._i_algod_client.status()
+        except Exception:
+            return DopError(23, "Error in initializing algod client.")
+
+        err, kmd_token, kmd_address = self._i_worker.kmdEndpoint()
+        if err.isError():
+            return err
+        self._i_kmd_client = AsyncKMDClient(kmd_token, kmd_address,
+            AsyncHTTPTransport(kmd_address, pool_size, timeout, max_concurrent))
+        try:
+            await self._i_kmd_client.versions()
+        except Exception:
+            return DopError(22, "An exception occurred while initializing kmd client.")
+
+        if 'ownmne' in config:
+            self._own_mnemonic = config['ownmne']
+        else:
+            self._own_mnemonic = None
+            return DopError(201, "Owner mnemonic not provided.")
+
+        try:
+            self._i_params_ttl = float(config.get('spttl', '5'))
+        except ValueError:
+            return DopError(24, "Invalid value for suggested params ttl (spttl).")
+        self._i_params_lock = asyncio.Lock()
+        try:
+            #   the pool is not sampled: the fees follow the suggested fee per byte (see FeePolicy)
+            self._i_fee_policy = FeePolicy(None, int(config.get('feemax', '10000')))
+        except ValueError:
+            return DopError(33, "Invalid value for fee cap (feemax).")
+        try:
+            admission_window = int(config.get('acwin', '64'))
+            admission_max_window = int(config.get('acmax', '4096'))
+            admission_queue = int(config.get('acqsz', '1024'))
+            admission_wait = float(config.get('acwait', '30'))
+        except ValueError:
+            return DopError(34, "Invalid value for admission control (acwin, acmax, acqsz, acwait).")
+        if admission_window < 1 or admission_max_window < admission_window or admission_queue < 0 or admission_wait < 0:
+            return DopError(34, "Invalid value for admission control (acwin, acmax, acqsz, acwait).")
+        self._i_admission = AsyncAdmission(
+            AdmissionController(admission_window, admission_max_window, admission_queue, admission_wait), admission_queue)
+
+        self._i_teal_cache = TealCompileCache(config.get('tccf', ''))
+        try:
+            self._i_teal_cache.set_algod_build(await self._i_algod_client.versions())
+        except Exception:
+            return DopError(23, "Error in initializing algod client.")
+
+        self._i_tracker = _AsyncConfirmationTracker(self._i_algod_client, self.__notify_round)
+        self._i_tracker.start()
+        return DopError(0,"")
+
+    async def close(self) -> DopError:
+        if self._i_tracker is not None:
+            await self._i_tracker.stop()
+            self._i_tracker = None
+        if self._i_algod_client is not None:
+            await self._i_algod_client.close()
+        if self._i_kmd_client is not None:
+            await self._i_kmd_client.close()
+        return DopError(0,"")
+
+    def admissionStats(self) -> dict:
+        """
+        see workerAlgorand.admissionStats
+        """
+        return self._i_admission.stats()
+
+    #============================================================================
+    #   private methods
+    #============================================================================
+    def __notify_round(self, round_number: int):
+        if round_number > self._i_round:
+            self._i_round = round_number
+
+    async def __suggested_params(self, op: str = '') -> transaction.SuggestedParams:
+        """
+        same policy as SuggestedParamsProvider: refreshed at most once per round or after spttl seconds
+        """
+        def stale() -> bool:
+            return (self._i_params is None
+                or self._i_round > self._i_params.first
+                or time.monotonic() - self._i_params_at >= self._i_params_ttl)
+
+        if stale():
+            async with self._i_params_lock:
+                if stale():
+                    self._i_params = await self._i_algod_client.suggested_params()
+                    self._i_params_at = time.monotonic()
+                    self._i_round = max(self._i_round, self._i_params.first)
+                    self._i_fee_policy.observe(self._i_params)
+
+        params = transaction.SuggestedParams(
+            self._i_params.fee, self._i_params.first, self._i_params.last,
+            self._i_params.gh, self._i_params.gen, True,
+            self._i_params.consensus_version, self._i_params.min_fee)
+        params.fee = self._i_fee_policy.fee(op)
+        return params
+
+    async def __params(self, op: str = '') -> Tuple[transaction.SuggestedParams, DopError]:
+        if self._i_algod_client == None:
+            return None,DopError(1,"Missing value for algod client.")
+        try:
+            return await self.__suggested_params(op),DopError(0,"")
+        except Exception:
+            return None,DopError(1,"Missing value for algod client.")
+
+    async def __compile(self, teal_source: str) -> dict:
+        key = self._i_teal_cache.key(None, teal_source)
+        compile_response = self._i_teal_cache.cached(key)
+        if compile_response is None:
+            compile_response = self._i_teal_cache.put(key, await self._i_algod_client.compile(teal_source))
+        return compile_response
+
+    async def __program(self, teal_path: str) -> Tuple[bytes, DopError]:
+        teal_source = self._i_teal_cache.source(teal_path)
+        if teal_source is None:
+            return b"",DopError(3,"Teal file not found.")
+        try:
+            compile_response = await self.__compile(teal_source)
+        except Exception:
+            return b"",DopError(4,"Error compiling teal source.")
+        return base64.b64decode(compile_response['result']),DopError(0,"")
+
+    async def __grouped_calls(self, app_id: int) -> bool:
+        """
+        see workerAlgorand.__grouped_calls
+        """
+        grouped = self._i_grouped_apps.get(app_id)
+        if grouped is not None:
+            return grouped
+        approval_program, err = await self.__program(self._i_worker.tealPaths()[1])
+        if err.isError():
+            return False
+        try:
+            application = await self._i_algod_client.application_info(app_id)
+        except Exception:
+            return False
+        grouped = base64.b64decode(application.get('params', {}).get('approval-program', '')) == approval_program
+        self._i_grouped_apps[app_id] = grouped
+        return grouped
+
+    async def __stateless_address(self, teal_template_path: str, creator_address: str) -> Tuple[str, DopError]:
+        """
+        see workerAlgorand.dop_stateless_create
+        """
+        teal_template = self._i_teal_cache.source(teal_template_path)
+        if teal_template is None:
+            return "",DopError(3,"Teal template file not found.")
+
+        macro = '_RECEIVERADDRESS_'
+        if teal_template not in self._i_templates:
+            stateless_template = StatelessTemplate(teal_template, macro)
+            try:
+                compiled_a = await self.__compile(stateless_template.placeholder_source(0))
+                compiled_b = await self.__compile(stateless_template.placeholder_source(1))
+                if not stateless_template.check(compiled_a, compiled_b):
+                    stateless_template = None
+            except Exception:
+                stateless_template = None
+            self._i_templates[teal_template] = stateless_template
+
+        try:
+            stateless_template = self._i_templates[teal_template]
+            if stateless_template is not None:
+                return stateless_template.address(creator_address),DopError(0,"")
+            compile_response = await self.__compile(teal_template.replace(macro, creator_address))
+            return compile_response['hash'],DopError(0,"")
+        except Exception:
+            return "",DopError(4,"Error compiling teal source.")
+
+    async def __confirm(self, transaction_id: str, timeout: int) -> dict:
+        return await self._i_tracker.track(transaction_id, timeout)
+
+    async def __admitted_send(self, signed_txns: list):
+        """
+        see workerAlgorand.__admitted_send - a sender waiting for the window awaits its turn
+        (see AsyncAdmission, the event loop is not blocked)
+        """
+        count: int = len(signed_txns)
+        deadline: float = self._i_admission.deadline()
+        while True:
+            await self._i_admission.acquire(count, deadline)
+            sent_round: int = self._i_round
+            try:
+                await self._i_algod_client.send_transactions(signed_txns)
+                break
+            except Exception as e:
+                congested = self._i_admission.congestion(e)
+                self._i_admission.release(count, False, congested)
+                if not congested or time.monotonic() + workerAlgorand.ADMISSION_RETRY_SECONDS >= deadline:
+                    raise
+            await asyncio.sleep(workerAlgorand.ADMISSION_RETRY_SECONDS)
+
+        #   in flight until the tracker resolves the first transaction
+        future = self._i_tracker.track(signed_txns[0].get_txid(), 4)
+        future.add_done_callback(lambda done: self.__admission_done(count, sent_round, done))
+
+    def __admission_done(self, count: int, sent_round: int, future: asyncio.Future):
+        if future.cancelled() or future.exception() is not None:
+            exception = None if future.cancelled() else future.exception()
+            self._i_admission.release(count, False, exception is not None and self._i_admission.congestion(exception))
+            return
+        confirmed_round: int = future.result().get('confirmed-round', 0)
+        rounds: int = confirmed_round - sent_round if sent_round > 0 and confirmed_round > 0 else 0
+        self._i_admission.release(count, True, False, rounds)
+
+    async def __send_groups(self, operations: list, send_error: DopError, wait_error: DopError) -> Tuple[list, DopError]:
+        """
+        see workerAlgorand.__send_groups - the groups are waited for concurrently
+        """
+        txids: list = []
+        group_txids: list = []
+        err: DopError = DopError(0,"")
+
+        for chunk in workerAlgorand.pack_groups(operations):
+            unsigned_txns = [item[0] for item in chunk]
+            if len(unsigned_txns) > 1:
+                transaction.assign_group_id(unsigned_txns)
+            signed_txns = [item[0].sign(item[1]) for item in chunk]
+            try:
+                await self.__admitted_send(signed_txns)
+            except AdmissionRejected:
+                err = DopError(217,"The transaction was not admitted (admission queue full or deadline exceeded).")
+                break
+            except Exception:
+                err = send_error
+                break
+            chunk_txids = [signed_txn.get_txid() for signed_txn in signed_txns]
+            txids.extend(chunk_txids)
+            group_txids.append(chunk_txids[0])
+
+        results = await asyncio.gather(*[self.__confirm(txid, 4) for txid in group_txids], return_exceptions=True)
+        if not err.isError() and any(isinstance(result, BaseException) for result in results):
+            err = wait_error
+        return txids, err
+
+    async def __submit_many(self, txns: list, send_error: DopError, wait_error: DopError) -> Tuple[list, DopError]:
+        #   the transactions of one operation are kept in the same atomic group (see workerAlgorand.pack_groups)
+        buffer: list = self._i_buffer.get()
+        if buffer is not None:
+            for app_id in workerAlgorand.app_ids([txns]):
+                if not await self.__grouped_calls(app_id):
+                    return [],DopError(218,"The contract does not accept grouped application calls (deployed with dop.stateful.teal before version 1.5).")
+            buffer.append(txns)
+            return [], DopError(0,"")
+        return await self.__send_groups([txns], send_error, wait_error)
+
+    async def __submit_operation(self, operation) -> Tuple[str, DopError]:
+        txids, err = await self.__submit_many(
+            [(operation.txn, operation.private_key)], operation.send_error, operation.wait_error)
+        return (txids[0] if len(txids) > 0 else ""), err
+
+    #============================================================================
+    #   transactions
+    #============================================================================
+    def begin_transaction(self) -> DopError:
+        """
+        see workerAlgorand.begin_transaction (the buffer is kept per task)
+        """
+        if self._i_buffer.get() is not None:
+            return DopError(210,"A transaction is already open.")
+        self._i_buffer.set([])
+        self._i_txids.set([])
+        return DopError(0,"")
+
+    def rollback(self) -> DopError:
+        self._i_buffer.set(None)
+        return DopError(0,"")
+
+    async def commit(self) -> DopError:
+        buffer: list = self._i_buffer.get()
+        self._i_buffer.set(None)
+        if not buffer:
+            return DopError(0,"")
+        txids, err = await self.__send_groups(
+            buffer
+        ,   DopError(211,"An exception occurred when sending the transaction groups.")
+        ,   DopError(308,"An exception occurred while waiting for confirmation of the transaction groups.")
+        )
+        self._i_txids.set(txids)
+        return err
+
+    def committed_txids(self) -> list:
+        return list(self._i_txids.get())
+
+    #============================================================================
+    #   operations
+    #============================================================================
+    async def create_user(self, username: str, password: str) -> Tuple[str, str, DopError]:
+        """
+        see workerAlgorand.create_user
+        """
+        config: dict = self._i_worker.configuration()
+        wallet_name = config['usrwlab']
+        wallet_password = config['usrwpwd']
+
+        try:
+            if self._i_wallet_id == '':
+                for wallet in await self._i_kmd_client.list_wallets():
+                    if wallet.get('name') == wallet_name:
+                        self._i_wallet_id = wallet.get('id')
+                        break
+            if self._i_wallet_id == '':
+                return "","",DopError(101,"The wallet id for the specified wallet name could not be retrieved.")
+
+            wallet_handle = await self._i_kmd_client.init_wallet_handle(self._i_wallet_id, wallet_password)
+            try:
+                account_address = await self._i_kmd_client.generate_key(wallet_handle)
+                account_key = await self._i_kmd_client.export_key(wallet_handle, wallet_password, account_address)
+            finally:
+                await self._i_kmd_client.release_wallet_handle(wallet_handle)
+            return account_address, mnemonic.from_private_key(account_key), DopError(0,"")
+        except Exception:
+            return "","",DopError(203,"An exception occurred while creating user.")
+
+    async def get_wallet_balance(self, account_address: str, currency="algo") -> Tuple[str, DopError]:
+        if self._i_algod_client == None:
+            return "", DopError(1,"Missing value for algod client.")
+        try:
+            account_info = await self._i_algod_client.account_info(account_address)
+            return account_info.get('amount'), DopError(0,"")
+        except Exception:
+            return "",DopError(204,"An exception occurred while getting wallet balance.")
+
+    async def deploy_contract(self,
+                        publisher_address: str,
+                        secret: str,
+                        tariff_period: int,
+                        tariff_price: int
+                        ) -> Tuple[Optional[str], DopError]:
+        """
+        see workerAlgorand.deploy_contract
+        """
+        if self._i_algod_client == None:
+            return ("",DopError(1,"Missing value for algod client."))
+
+        creator_private_key, err = workerAlgorand.mnemonic_to_private_key(secret)
+        if err.isError():
+            return "",err
+        creator_address = account.address_from_private_key(creator_private_key)
+
+        stateless_template_path, approval_path, clear_path = self._i_worker.tealPaths()
+        smart_contract_address, err = await self.__stateless_address(stateless_template_path, creator_address)
+        if err.isError():
+            return "",err
+
+        clear_program, err = await self.__program(clear_path)
+        if err.isError():
+            return "",DopError(5,"Teal clear file not found.") if err.code == 3 else err
+        approval_program, err = await self.__program(approval_path)
+        if err.isError():
+            return "",DopError(6,"Teal approval file not found.") if err.code == 3 else err
+
+        params, err = await self.__params('create')
+        if err.isError():
+            return "",err
+        unsigned_txn = workerAlgorand.stateful_create_txn(
+            params, creator_address, approval_program, clear_program, smart_contract_address,
+            workerAlgorand.creation_note(os.urandom(8).hex(), 0))
+        signed_txn = unsigned_txn.sign(creator_private_key)
+        try:
+            await self.__admitted_send([signed_txn])
+            txn_id = signed_txn.get_txid()
+        except AdmissionRejected:
+            return "",DopError(217,"The transaction was not admitted (admission queue full or deadline exceeded).")
+        except Exception:
+            return "",DopError(120, "An error occurred while creating stateful smart contract.")
+
+        try:
+            confirmed_txn = await self.__confirm(txn_id, 4)
+        except Exception:
+            return "",DopError(120, "An error occurred while creating stateful smart contract.")
+        app_id = confirmed_txn.get('application-index', 0)
+        if app_id == 0:
+            return "",DopError(120, "An error occurred while creating stateful smart contract.")
+        return smart_contract_address + '@' + str(app_id), DopError(0,"")
+
+    async def algorand_sub_optin(self, from_mnemonic: str, application_address: str) -> DopError:
+        params, err = await self.__params('optin')
+        if err.isError():
+            return err
+        operation, err = workerAlgorand.optin_operation(params, from_mnemonic, application_address)
+        if err.isError():
+            return err
+        txid, err = await self.__submit_operation(operation)
+        return err
+
+    async def algorand_sub_optout(self, from_mnemonic: str, application_address: str) -> DopError:
+        params, err = await self.__params('optout')
+        if err.isError():
+            return err
+        operation, err = workerAlgorand.optout_operation(params, from_mnemonic, application_address)
+        if err.isError():
+            return err
+        txid, err = await self.__submit_operation(operation)
+        return err
+
+    async def subscribe(self, subscriber_addr: str, subscriber_psw: str, contract_address: str, secret: str) -> Tuple[str, DopError]:
+        params, err = await self.__params('subscribe')
+        if err.isError():
+            return "",err
+        operation, err = workerAlgorand.subscribe_operation(params, subscriber_psw, contract_address)
+        if err.isError():
+            return "",err
+        txid, err = await self.__submit_operation(operation)
+        if err.isError():
+            return "",err
+        return txid,DopError(0,"")
+
+    async def unsubscribe(self, subscriber_addr: str, subscriber_psw: str, contract_address: str) -> Tuple[str, DopError]:
+        params, err = await self.__params('unsubscribe')
+        if err.isError():
+            return "",err
+        operation, err = workerAlgorand.unsubscribe_operation(params, subscriber_psw, contract_address)
+        if err.isError():
+            return "",err
+        txid, err = await self.__submit_operation(operation)
+        if err.isError():
+            return "",err
+        return txid,DopError(0,"")
+
+    async def grant(self, publisher_address: str, publisher_passw: str, contract_address: str, subscriber_address: str) -> Tuple[str, DopError]:
+        return await self.__creator(
+            'grant', publisher_passw, contract_address, subscriber_address)
+
+    async def revoke(self, publisher_address: str, publisher_passw: str, contract_address: str, subscriber_address: str) -> Tuple[str, DopError]:
+        return await self.__creator(
+            'revoke', publisher_passw, contract_address, subscriber_address)
+
+    async def __creator(self, op: str, publisher_passw: str, contract_address: str, subscriber_address: str) -> Tuple[str, DopError]:
+        params, err = await self.__params(op)
+        if err.isError():
+            return "",err
+        try:
+            app_id = workerAlgorand.application_index(contract_address)
+        except ValueError:
+            return "",DopError(11,"Invalid contract address.")
+        operation, err = workerAlgorand.creator_operation(params, op, publisher_passw, str(app_id), subscriber_address)
+        if err.isError():
+            return "",err
+        return await self.__submit_operation(operation)
+
+    async def grant_many(self, publisher_address: str, publisher_passw: str, contract_address: str, subscriber_addresses: list) -> Tuple[list, DopError]:
+        return await self.__creator_many('grant', publisher_passw, contract_address, subscriber_addresses, "DOP GRANT",
+            DopError(306,"An exception occurred while waiting for confirmation of grant transaction."))
+
+    async def revoke_many(self, publisher_address: str, publisher_passw: str, contract_address: str, subscriber_addresses: list) -> Tuple[list, DopError]:
+        return await self.__creator_many('revoke', publisher_passw, contract_address, subscriber_addresses, "DOP REVOKE",
+            DopError(307,"An exception occurred while waiting for confirmation of revoke transaction."))
+
+    async def __creator_many(self, op: str, publisher_passw: str, contract_address: str, subscriber_addresses: list,
+                             transaction_note: str, wait_error: DopError) -> Tuple[list, DopError]:
+        params, err = await self.__params(op)
+        if err.isError():
+            return [],err
+        try:
+            app_id = workerAlgorand.application_index(contract_address)
+        except ValueError:
+            return [],DopError(11,"Invalid contract address.")
+        send_error = DopError(202,"An exception occurred when sending transaction.")
+        if await self.__grouped_calls(app_id):
+            txns, err = workerAlgorand.creator_many_txns(params, op, publisher_passw, str(app_id), subscriber_addresses, transaction_note)
+            if err.isError():
+                return [],err
+            return await self.__submit_many(txns, send_error, wait_error)
+
+        #   see workerAlgorand.__creator_call_many: one account per call, one call per group
+        if self._i_buffer.get() is not None:
+            return [],DopError(218,"The contract does not accept grouped application calls (deployed with dop.stateful.teal before version 1.5).")
+        txns, err = workerAlgorand.creator_many_txns(params, op, publisher_passw, str(app_id), subscriber_addresses, transaction_note, 1)
+        if err.isError():
+            return [],err
+        txids: list = []
+        err = DopError(0,"")
+        for group_txids, group_err in await asyncio.gather(*[self.__send_groups([[txn]], send_error, wait_error) for txn in txns]):
+            txids.extend(group_txids)
+            if group_err.isError() and not err.isError():
+                err = group_err
+        return txids, err
+
+    async def set_starting_balance(self, address, amount) -> str:
+        if self._own_mnemonic == None:
+            return ""
+        params, err = await self.__params('payment')
+        if err.isError():
+            return ""
+        operation, err = workerAlgorand.payment_operation(params, self._own_mnemonic, address, amount)
+        if err.isError():
+            return ""
+        txid, err = await self.__submit_operation(operation)
+        if err.isError():
+            return ""
+        return txid
+
+    async def get_balance(self, publisher_address: str, subscriber_address: str, contract_address: str) -> Tuple[dict, DopError]:
+        """
+        see workerAlgorand.get_balance (the local state is read from algod on every call)
+        """
+        return await self.__subscriber_state(subscriber_address, contract_address)
+
+    async def balance(self, subscriber_address: str, secret: str, contract_address: str) -> Tuple[dict, DopError]:
+        return await self.__subscriber_state(subscriber_address, contract_address)
+
+    async def __subscriber_state(self, subscriber_address: str, contract_address: str) -> Tuple[dict, DopError]:
+        if self._i_algod_client == None:
+            return {}, DopError(1,"Missing value for algod client.")
+        try:
+            app_id = workerAlgorand.application_index(contract_address)
+        except ValueError:
+            return {}, DopError(11,"Invalid contract address.")
+
+        local_state: dict = {}
+        try:
+            response = await self._i_algod_client.account_application_info(subscriber_address, app_id)
+            local_state = LocalStateCache.decode((response.get('app-local-state') or {}).get('key-value'))
+        except error.AlgodHTTPError as e:
+            if e.code != 404:
+                return {}, DopError(213,"An exception occurred while getting the subscriber balance.")
+        except Exception:
+            return {}, DopError(213,"An exception occurred while getting the subscriber balance.")
+
+        response = {}
+        response['subscribed'] = local_state.get('subscription', 0)
+        response['granted'] = local_state.get('grant', 0)
+        response['kid'] = local_state.get('kid', '')
+        response['key'] = local_state.get('key', '')
+        response['credit'] = 100            #   NOTE:   credit and debit are not kept on chain yet
+        response['debit'] = 0
+        return response, DopError(0,"")
+
+    async def get_contract_state(self, contract_address: str) -> Tuple[dict, DopError]:
+        """
+        see workerAlgorand.get_contract_state (the global state is read from algod on every call)
+        """
+        if self._i_algod_client == None:
+            return {}, DopError(1,"Missing value for algod client.")
+        try:
+            app_id = workerAlgorand.application_index(contract_address)
+        except ValueError:
+            return {}, DopError(11,"Invalid contract address.")
+        try:
+            application = await self._i_algod_client.application_info(app_id)
+        except Exception:
+            return {}, DopError(214,"An exception occurred while getting the contract state.")
+
+        global_state = LocalStateCache.decode(
+            application.get('params', {}).get('global-state'), GlobalStateCache.ADDRESS_KEYS)
+        response = {}
+        response['creator'] = global_state.get('creator', '')
+        response['linked'] = global_state.get('linked', '')
+        response['key'] = global_state.get('key', '')
+        response['kid'] = global_state.get('kid', '')
+        return response, DopError(0,"")
+
+    async def admin_get_grants(self, publisher_address: str, contract_address: str) -> Tuple[list, DopError]:
+        return self._i_worker.admin_get_grants(publisher_address, contract_address)